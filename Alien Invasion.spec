@@ -1,11 +1,22 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
 
+# Ship the packed asset archive (python tools/pack-assets.py) instead of loose files when available
+ASSET_ARCHIVE = os.path.join('build', 'assets.pak')
+datas = [(ASSET_ARCHIVE, '.')] if os.path.exists(ASSET_ARCHIVE) else [('src', 'src')]
+# Ship the precompiled translations (python tools/build-translations.py) when available
+TRANSLATION_BUNDLE = os.path.join('build', 'translations.bin')
+if os.path.exists(TRANSLATION_BUNDLE):
+    datas.append((TRANSLATION_BUNDLE, '.'))
+elif os.path.exists(ASSET_ARCHIVE):
+    # The archive does not pack translations, so ship the JSON files next to it
+    datas.append(('src/assets/translations', 'src/assets/translations'))
 
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('src', 'src')],
+    datas=datas,
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -2,48 +2,281 @@
 
 This module manages the creation and lifecycle of game entities:
 - Alien fleet creation and positioning
+- Alien pooling so fleets are rebuilt without new allocations
+- Optional staggered spawning that brings a fleet in row by row
+- Prebuilding the next fleet while the current level is finishing
 - Ship collision handling and respawn logic
 - Fleet edge detection and descent behavior
 - Game state transitions (game over, level completion)
 
 The factory pattern is used to create game entities, ensuring
 consistent initialization and proper integration with the game state.
+Fleets are stamped from a FleetPrototype that computes the scaled alien
+image and the formation layout once per screen size, so rebuilding a fleet
+only creates the aliens themselves.
 """
 
 from __future__ import annotations
 
+from collections import deque
 from time import sleep
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Tuple
 
 import pygame
 
 from src.config.actors.fleet_calculations import get_number_aliens_x, get_number_rows
-from src.entities.alien import Alien
+from src.config.configuration import Configuration
+from src.config.logic.broadphase import set_grid_cell_size
+from src.entities.alien import Alien, get_alien_image
 
 if TYPE_CHECKING:
     from src.game import Game
 
 
+class FleetPrototype:
+    """Shared sprite data and formation layout for every alien in a fleet.
+
+    A prototype depends only on the screen size and the ship height, so it is
+    computed once per combination and reused on every level change and respawn.
+
+    Attributes:
+        image (pygame.Surface): Alien image scaled for the screen resolution
+        width (int): Width of a single alien
+        height (int): Height of a single alien
+        number_aliens_x (int): Number of aliens per row
+        number_rows (int): Number of rows in the formation
+        positions (List[Tuple[int, int]]): Top-left position of each alien, row by row
+    """
+
+    def __init__(self, ai_configuration: Configuration, ship_height: int) -> None:
+        self.image = get_alien_image(ai_configuration)
+        self.width, self.height = self.image.get_size()
+        self.number_aliens_x = get_number_aliens_x(ai_configuration, self.width)
+        self.number_rows = get_number_rows(ai_configuration, ship_height, self.height)
+        self.positions: List[Tuple[int, int]] = [
+            self.position(alien_number, row_number)
+            for row_number in range(self.number_rows)
+            for alien_number in range(self.number_aliens_x)
+        ]
+
+    def position(self, alien_number: int, row_number: int) -> Tuple[int, int]:
+        """Return the top-left position of an alien in the formation."""
+        return self.width + 2 * self.width * alien_number, self.height + 2 * self.height * row_number
+
+    def stamp(self, x: float, y: int) -> Alien:
+        """Create an alien at the given position using the shared image, reusing pooled aliens."""
+        alien = Alien.get_alien(self.image)
+        alien.x = float(x)
+        alien.y = float(y)
+        alien.rect.x = int(x)
+        alien.rect.y = y
+        return alien
+
+    def rows(self) -> List[List[Tuple[int, int]]]:
+        """Return the formation positions grouped by row, top row first."""
+        n = self.number_aliens_x
+        return [self.positions[i : i + n] for i in range(0, len(self.positions), n)] if n else []
+
+
+class FleetSpawner:
+    """Brings a fleet in over several frames, a few rows per frame.
+
+    Each row is placed at the formation's current offset, so a partially
+    spawned fleet moves, bounces off the edges and descends as one formation.
+    """
+
+    def __init__(self) -> None:
+        self._prototype: Optional[FleetPrototype] = None
+        self._rows: Deque[List[Tuple[int, int]]] = deque()
+        # Spawned aliens with their formation position, used to find the fleet's offset
+        self._spawned: List[Tuple[Alien, int, int]] = []
+        self._offset: Tuple[float, int] = (0.0, 0)
+
+    @property
+    def is_spawning(self) -> bool:
+        """Whether rows of the current fleet are still waiting to spawn."""
+        return bool(self._rows)
+
+    @property
+    def pending_rows(self) -> int:
+        """Number of rows still waiting to spawn."""
+        return len(self._rows)
+
+    def start(self, prototype: FleetPrototype) -> None:
+        """Queue every row of a new fleet."""
+        self.cancel()
+        self._prototype = prototype
+        self._rows.extend(prototype.rows())
+
+    def cancel(self) -> None:
+        """Drop any rows that have not spawned yet."""
+        self._prototype = None
+        self._rows.clear()
+        self._spawned.clear()
+        self._offset = (0.0, 0)
+
+    def _current_offset(self) -> Tuple[float, int]:
+        """Return how far the formation has moved since it started spawning."""
+        # Newest first: a pooled alien may appear twice, and only its latest entry is current
+        for alien, x, y in reversed(self._spawned):
+            if alien.alive():
+                self._offset = (alien.x - x, int(alien.y) - y)
+                break
+        return self._offset
+
+    def spawn_rows(self, game: Game, max_rows: int) -> int:
+        """Spawn up to max_rows queued rows into the fleet.
+
+        Returns:
+            int: Number of rows spawned
+        """
+        if self._prototype is None or not self._rows:
+            return 0
+
+        dx, dy = self._current_offset()
+        spawned_rows = 0
+        while self._rows and spawned_rows < max_rows:
+            for x, y in self._rows.popleft():
+                alien = self._prototype.stamp(x + dx, y + dy)
+                game.aliens.add(alien)
+                self._spawned.append((alien, x, y))
+            spawned_rows += 1
+
+        if not self._rows:
+            self.cancel()
+        return spawned_rows
+
+
+class FleetPrebuilder:
+    """Prepares the aliens of the next fleet before the current level ends.
+
+    While only a few aliens remain, a handful of aliens for the next fleet are
+    stamped each frame and kept outside every group. The level transition then
+    only has to add the prepared aliens to the fleet.
+    """
+
+    def __init__(self) -> None:
+        self._prototype: Optional[FleetPrototype] = None
+        self._aliens: List[Alien] = []
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether a complete next fleet is waiting to be used."""
+        return self._prototype is not None and len(self._aliens) == len(self._prototype.positions)
+
+    def prepare(self, game: Game, prototype: FleetPrototype, max_aliens: int) -> int:
+        """Stamp up to max_aliens more aliens of the next fleet.
+
+        A partly prepared fleet for a different prototype, e.g. after a window
+        resize, is discarded first.
+
+        Returns:
+            int: Number of aliens prepared
+        """
+        if self._prototype is not prototype:
+            self.cancel()
+            self._prototype = prototype
+
+        start = len(self._aliens)
+        for x, y in prototype.positions[start : start + max_aliens]:
+            self._aliens.append(prototype.stamp(x, y))
+        return len(self._aliens) - start
+
+    def take(self, game: Game, prototype: FleetPrototype) -> Optional[List[Alien]]:
+        """Hand over the prepared fleet if it was started for the given prototype.
+
+        A partly prepared fleet, e.g. when the last aliens fell in the same
+        frame, is completed first. A fleet prepared for another prototype,
+        e.g. before a window resize, is discarded so it is never handed out.
+        """
+        if self._prototype is not prototype:
+            self.cancel()
+            return None
+        self.prepare(game, prototype, len(prototype.positions))
+        aliens, self._aliens = self._aliens, []
+        self._prototype = None
+        return aliens
+
+    def cancel(self) -> None:
+        """Drop the prepared aliens and return them to the alien pool."""
+        aliens, self._aliens = self._aliens, []
+        self._prototype = None
+        for alien in aliens:
+            Alien.return_to_pool(alien)
+
+
+# Prototypes keyed by (screen width, screen height, ship height), oldest first
+_fleet_prototypes: Dict[Tuple[int, int, int], FleetPrototype] = {}
+MAX_FLEET_PROTOTYPES = 4
+
+
+def get_fleet_prototype(game: Game) -> FleetPrototype:
+    """Returns the fleet prototype for the current screen size, building it on first use."""
+    key = (game.ai_configuration.screen_width, game.ai_configuration.screen_height, game.ship.rect.height)
+    prototype = _fleet_prototypes.get(key)
+    if prototype is None:
+        if len(_fleet_prototypes) >= MAX_FLEET_PROTOTYPES:
+            del _fleet_prototypes[next(iter(_fleet_prototypes))]
+        prototype = _fleet_prototypes[key] = FleetPrototype(game.ai_configuration, game.ship.rect.height)
+    return prototype
+
+
 def create_alien(game: Game, alien_number: int, row_number: int) -> None:
     """Creates a single alien and adds it to the aliens group."""
-    alien = Alien(game.ai_configuration, game.screen)
-    alien_width = alien.rect.width
-    alien.x = alien_width + 2 * alien_width * alien_number
-    alien.rect.x = int(alien.x)
-    alien.rect.y = alien.rect.height + 2 * alien.rect.height * row_number
-    game.aliens.add(alien)
+    prototype = get_fleet_prototype(game)
+    x, y = prototype.position(alien_number, row_number)
+    game.aliens.add(prototype.stamp(x, y))
 
 
 def create_fleet(game: Game) -> None:
-    """Creates a complete fleet of aliens arranged in rows and columns."""
-    alien = Alien(game.ai_configuration, game.screen)
-    number_aliens_x = get_number_aliens_x(game.ai_configuration, alien.rect.width)
-    number_rows = get_number_rows(game.ai_configuration, game.ship.rect.height, alien.rect.height)
+    """Creates a complete fleet of aliens arranged in rows and columns.
+
+    A fleet prepared in advance by prebuild_next_fleet() is used as is. Otherwise,
+    with staggered spawning enabled, only the first rows are created now and
+    the rest follow over the next frames through spawn_fleet_rows().
+    """
+    prototype = get_fleet_prototype(game)
+    update_collision_cell_size(game)
+    prebuilt = game.fleet_prebuilder.take(game, prototype)
+    if prebuilt is not None:
+        game.fleet_spawner.cancel()
+        game.aliens.add(prebuilt)
+        return
+    if game.ai_configuration.staggered_fleet_spawn:
+        game.fleet_spawner.start(prototype)
+        spawn_fleet_rows(game)
+        return
+    game.aliens.add([prototype.stamp(x, y) for x, y in prototype.positions])
+
+
+def update_collision_cell_size(game: Game) -> None:
+    """Sizes the collision grid's cells to fit one alien at the current scale."""
+    prototype = get_fleet_prototype(game)
+    set_grid_cell_size(max(prototype.width, prototype.height))
+
+
+def spawn_fleet_rows(game: Game) -> None:
+    """Spawns the next rows of a staggered fleet, up to the per-frame budget."""
+    game.fleet_spawner.spawn_rows(game, game.ai_configuration.fleet_spawn_rows_per_frame)
+
+
+def prebuild_next_fleet(game: Game) -> None:
+    """Prepares part of the next fleet once only a few aliens of the current one remain."""
+    ai_configuration = game.ai_configuration
+    if not ai_configuration.prebuild_next_fleet or game.fleet_prebuilder.is_ready:
+        return
+    if game.fleet_spawner.is_spawning or len(game.aliens) > ai_configuration.fleet_prebuild_threshold:
+        return
+    game.fleet_prebuilder.prepare(game, get_fleet_prototype(game), ai_configuration.fleet_prebuild_aliens_per_frame)
+
 
-    # Create the alien fleet
-    for row_number in range(number_rows):
-        for alien_number in range(number_aliens_x):
-            create_alien(game, alien_number, row_number)
+def clear_fleet(game: Game) -> None:
+    """Removes every alien from the fleet and returns them to the alien pool."""
+    game.fleet_spawner.cancel()
+    aliens = game.aliens.sprites()
+    game.aliens.empty()
+    for alien in aliens:
+        Alien.return_to_pool(alien)
 
 
 def ship_hit(game: Game) -> None:
@@ -54,12 +287,15 @@ def ship_hit(game: Game) -> None:
 
         # Decrements ships_remaining
         game.statistics.ships_remaining -= 1
+        if game.statistics.ships_remaining == 0:
+            # The next hit ends the game, so get the game over sound ready in the background
+            game.music.prefetch_game_over()
 
         # Updates the scoreboard
         game.scoreboard.prep_ships()
 
         # Empty the list of aliens and bullets
-        game.aliens.empty()
+        clear_fleet(game)
         game.bullets.empty()
 
         # Create a new fleet and center the ship
@@ -78,8 +314,7 @@ def check_aliens_bottom(game: Game) -> None:
     """Check if any aliens have reached the bottom of the screen"""
     screen_rect = game.screen.get_rect()
 
-    for alien in game.aliens.sprites():
-        if alien.rect.bottom >= screen_rect.bottom:
-            # Treat this the same as if the ship were hit
-            ship_hit(game)
-            break
+    bounds = game.aliens.archetype.bounds()
+    if bounds is not None and bounds[3] >= screen_rect.bottom:
+        # Treat this the same as if the ship were hit
+        ship_hit(game)
@@ -1,10 +1,75 @@
-from typing import Tuple
+import logging
+import os
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
 import pygame
 
+from src.config.logic.broadphase import BROADPHASES
+from src.config.profiles import DEFAULT_PROFILE, PERFORMANCE_PROFILES, detect_profile
+from src.core.path_utils import ensure_data_directory, load_json_file, save_json_file
+
+logger = logging.getLogger(__name__)
+
+# Player settings file in the data directory
+SETTINGS_FILE = "settings.json"
+# Environment variables named ALIEN_INVASION_CFG_<SETTING> override a setting, e.g. ALIEN_INVASION_CFG_SHOW_FPS=1
+ENV_PREFIX = "ALIEN_INVASION_CFG_"
+
+_TRUE_VALUES = ("1", "true", "yes", "on")
+_FALSE_VALUES = ("0", "false", "no", "off")
+
+# Settings whose type alone does not make a value usable: (check, what the setting expects)
+_VALUE_CHECKS: Dict[str, Tuple[Callable[[Any], bool], str]] = {
+    "broadphase": (lambda value: value in BROADPHASES, f"one of {', '.join(sorted(BROADPHASES))}"),
+    "frame_rate": (lambda value: value > 0, "a positive number"),
+    "idle_frame_rate": (lambda value: value > 0, "a positive number"),
+}
+
+
+def _coerce(current: Any, value: Any) -> Any:
+    """Convert a setting read from JSON or the environment to the type of its default value.
+
+    Raises:
+        ValueError: If the value cannot be converted.
+    """
+    if isinstance(current, bool):
+        if isinstance(value, bool):
+            return value
+        if str(value).strip().lower() in _TRUE_VALUES:
+            return True
+        if str(value).strip().lower() in _FALSE_VALUES:
+            return False
+        raise ValueError(f"expected a boolean, got {value!r}")
+    if isinstance(current, tuple):
+        parts = value.split(",") if isinstance(value, str) else value
+        return tuple(int(part) for part in parts)
+    return type(current)(value)
+
+
+def _validate(name: str, value: Any) -> Any:
+    """Return a converted setting value unchanged if the setting can use it.
+
+    Raises:
+        ValueError: If the value is out of the setting's range or not one of its choices.
+    """
+    check = _VALUE_CHECKS.get(name)
+    if check is not None and not check[0](value):
+        raise ValueError(f"expected {check[1]}, got {value!r}")
+    return value
+
 
 class Configuration:
-    """Used to store all game settings"""
+    """Used to store all game settings
+
+    Configuration() holds the built-in defaults. Configuration.load() layers
+    the player's settings on top of them, each layer overriding the one before:
+
+    1. The defaults
+    2. A performance profile (see src/config/profiles.py), picked by a short
+       benchmark on first launch
+    3. The settings file in the data directory
+    4. ALIEN_INVASION_CFG_<SETTING> environment variables
+    """
 
     def __init__(self) -> None:
         """Initializes the game settings"""
@@ -29,6 +94,19 @@ class Configuration:
             40,
         )  # Fallback color if gradient is not used
 
+        # Window settings
+        self.frame_rate: int = 60  # Frames per second the main loop is capped at
+        self.resize_settle_ms: int = 200  # Wait for a window drag to settle before rebuilding assets
+        # Sleep while minimized, unfocused, paused or in menus, drawing only frames that changed
+        self.power_saving: bool = True
+        # Times per second the loop wakes up while idle, even without input
+        self.idle_frame_rate: int = 4
+
+        # Draw the score, high score and level labels on translucent backgrounds
+        self.hud_translucency: bool = True
+        # Step rendering features down while frames run over budget (see quality_governor.py)
+        self.adaptive_quality: bool = True
+
         # Debug settings
         self.show_fps: bool = False  # Set to True to show FPS counter (impacts performance)
 
@@ -61,9 +139,106 @@ class Configuration:
         self.acceleration_scale: float = 1.1
         # How fast the point values for aliens increase
         self.score_scale: float = 1.2
+        # Bring each new fleet in row by row over several frames instead of all at once
+        self.staggered_fleet_spawn: bool = False
+        # Number of fleet rows spawned per frame when staggered spawning is enabled
+        self.fleet_spawn_rows_per_frame: int = 1
+        # Prepare the next fleet ahead of time while the current level is finishing
+        self.prebuild_next_fleet: bool = True
+        # Start preparing the next fleet once this many aliens or fewer remain
+        self.fleet_prebuild_threshold: int = 5
+        # Number of next-fleet aliens prepared per frame
+        self.fleet_prebuild_aliens_per_frame: int = 8
+
+        # Collision settings
+
+        # Broadphase used to pair bullets with nearby aliens:
+        # "grid", "sort_and_sweep", "brute_force" or "formation"
+        self.broadphase: str = "grid"
+        # Confirm rect hits against the opaque pixels of the alien and ship images
+        self.precise_collisions: bool = False
+
+        # Audio settings
+
+        # Samples per mixer buffer: smaller buffers lower the delay before a shot is heard,
+        # larger ones are safer on slow machines (see src/config/music/voices.py)
+        self.audio_buffer_size: int = 512
+
+        # Performance profile the settings above were taken from (see apply_profile)
+        self.performance_profile: str = DEFAULT_PROFILE
 
         self.initialize_dynamic_configurations()
 
+    @classmethod
+    def load(cls, settings_path: Optional[str] = None, environ: Mapping[str, str] = os.environ) -> "Configuration":
+        """Build the configuration from the defaults, a profile, the settings file and the environment.
+
+        On first launch, when neither the settings file nor the environment name
+        a profile, one is picked by detect_profile() and saved to the settings
+        file, so the benchmark runs only once.
+
+        Args:
+            settings_path (Optional[str]): Settings file; defaults to settings.json in the data directory
+            environ (Mapping[str, str]): Environment variables to read overrides from
+
+        Returns:
+            Configuration: The layered configuration
+        """
+        if settings_path is None:
+            settings_path = os.path.join(ensure_data_directory(), SETTINGS_FILE)
+        settings = load_json_file(settings_path, {}) if os.path.exists(settings_path) else {}
+        if not isinstance(settings, dict):
+            logger.warning(f"Ignoring {settings_path}: expected a JSON object")
+            settings = {}
+        overrides = {
+            name[len(ENV_PREFIX) :].lower(): value for name, value in environ.items() if name.startswith(ENV_PREFIX)
+        }
+
+        profile = overrides.get("profile", settings.get("profile"))
+        if profile is None:
+            profile = settings["profile"] = detect_profile()
+            save_json_file(settings_path, settings)
+            logger.info(f"Selected the {profile} performance profile")
+
+        configuration = cls()
+        configuration.apply_profile(profile)
+        configuration.apply_settings(settings, settings_path)
+        configuration.apply_settings(overrides, "environment")
+        return configuration
+
+    def apply_profile(self, name: str) -> None:
+        """Apply the values of a performance profile, falling back to the default one if it is unknown."""
+        if name not in PERFORMANCE_PROFILES:
+            logger.warning(f"Unknown performance profile '{name}', using '{DEFAULT_PROFILE}'")
+            name = DEFAULT_PROFILE
+        for setting, value in PERFORMANCE_PROFILES[name].items():
+            setattr(self, setting, value)
+        self.performance_profile = name
+
+    def apply_settings(self, settings: Mapping[str, Any], source: str) -> None:
+        """Override settings by name, converting each value to the type of the setting.
+
+        Unknown names, values that cannot be converted and values the setting
+        cannot use (an unknown broadphase, a frame rate of 0) are logged and
+        skipped, keeping the earlier value, so a typo in a settings file never
+        prevents the game from starting or breaks it later.
+
+        Args:
+            settings (Mapping[str, Any]): Values by setting name; "profile" is applied by load()
+            source (str): Where the values come from, for log messages
+        """
+        for name, value in settings.items():
+            if name == "profile":
+                continue
+            current = getattr(self, name, None)
+            if name.startswith("_") or current is None or callable(current):
+                logger.warning(f"Ignoring unknown setting '{name}' from {source}")
+                continue
+            try:
+                setattr(self, name, _validate(name, _coerce(current, value)))
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Ignoring setting '{name}' from {source}: {e}, keeping {current!r}")
+
     def initialize_dynamic_configurations(self) -> None:
         """Initializes the configuration that changes throughout the game"""
         # Ship speed
@@ -14,6 +14,8 @@ Key bindings:
 - Q: Quit game
 - S: Toggle sound effects
 - M: Toggle background music
+- L: Switch to the next language
+- F3: Print the memory report to the console
 
 Gamepad bindings (Xbox layout):
 - Left Stick / D-Pad: Move ship left/right
@@ -39,6 +41,7 @@ from src.config.controls.gamepad_controls import (
     verify_gamepad_hat,
 )
 from src.config.rendering.game_rendering import check_play_button, fire_bullet
+from src.core.memory_registry import format_memory_report
 
 if TYPE_CHECKING:
     from src.game import Game
@@ -67,6 +70,10 @@ def _handle_game_controls(event: pygame.event.Event, game: Game) -> None:
         # Toggle gamepad configuration screen
         if game.gamepad.is_connected():
             game.statistics.show_gamepad_config = not game.statistics.show_gamepad_config
+    elif event.key == pygame.K_l:
+        game.language.next_language()
+    elif event.key == pygame.K_F3:
+        print("\n".join(format_memory_report()))
 
 
 def verify_events_keydown(event: pygame.event.Event, game: Game) -> None:
@@ -129,21 +136,60 @@ def _handle_gamepad_events(event: pygame.event.Event, game: Game) -> None:
         verify_gamepad_hat(event, game)
 
 
+def queue_resize(event: pygame.event.Event, game: Game) -> None:
+    """Record a window resize so it can be applied once the window stops changing.
+
+    Args:
+        event: Pygame VIDEORESIZE event
+        game: Game object
+    """
+    game.pending_resize = (event.w, event.h)
+    game.resize_requested_at = pygame.time.get_ticks()
+
+
+def apply_pending_resize(game: Game) -> bool:
+    """Apply the most recent window resize once it has settled.
+
+    Resize events are coalesced by queue_resize() and only the final size is
+    applied, after no new resize has arrived for ``resize_settle_ms``. Until
+    then the game keeps rendering at the old size, so a window drag triggers a
+    single asset rebuild instead of one per event.
+
+    Args:
+        game: Game object
+
+    Returns:
+        bool: True if the new size was applied this frame, False otherwise
+    """
+    if game.pending_resize is None:
+        return False
+    if pygame.time.get_ticks() - game.resize_requested_at < game.ai_configuration.resize_settle_ms:
+        return False
+
+    width, height = game.pending_resize
+    game.pending_resize = None
+
+    # A drag that ends where it started needs no rebuild
+    if (width, height) == (game.ai_configuration.screen_width, game.ai_configuration.screen_height):
+        return False
+
+    # Update screen dimensions in configuration
+    game.ai_configuration.screen_width = width
+    game.ai_configuration.screen_height = height
+    game.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+    game.refresh_assets()
+    return True
+
+
 def verify_events(game: Game) -> None:
     """Responds to keystrokes and mouse events"""
     for event in pygame.event.get():
+        game.power_saver.handle_event(event, game)
         if event.type == pygame.QUIT:
             sys.exit()
         elif event.type == pygame.VIDEORESIZE:
-            # Update screen dimensions in configuration
-            game.ai_configuration.screen_width = event.w
-            game.ai_configuration.screen_height = event.h
-            # Clear resource manager cache to force re-scaling of images
-            game.resource_manager.clear_cache()
-            # We might need to recreate the screen surface if not handled by pygame automatically
-            # but usually it's better to let pygame handle it or call set_mode again
-            game.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
-            game.refresh_assets()
+            # Window drags produce a burst of resize events; only remember the latest size
+            queue_resize(event, game)
 
         # Handle gamepad config screen input separately
         if game.statistics.show_gamepad_config:
@@ -3,8 +3,11 @@ import locale
 import os
 import subprocess
 import sys
-from typing import Dict, Final, List
+import weakref
+from typing import Callable, Dict, Final, List
 
+from src.config.language.translation_bundle import get_translation_bundle
+from src.core.asset_archive import get_asset_archive, open_asset
 from src.core.path_utils import resource_path
 
 
@@ -135,8 +138,11 @@ class Language:
         The initialization process:
         1. Sets the program's locale to the user's default system settings.
         2. Detects the system language based on the new locale.
-        3. Loads all available translations.
-        4. Sets the current language.
+        3. Finds the available translations.
+        4. Sets the current language, loading only its translations and the English fallback.
+
+        Other languages are loaded on their first set_language(), which also
+        tells every listener added with add_listener() that texts changed.
         """
         try:
             # Set the locale to the user's default setting. This is a best-effort
@@ -147,7 +153,13 @@ class Language:
             print("Warning: Failed to set the system's default locale.")
 
         self.system_language = self._get_system_language()
-        self.translations = self._load_translations()
+        # Translations of each language loaded so far
+        self.translations: Dict[str, Dict[str, str]] = {}
+        # Current language's translations over the English ones, so get_text() needs one lookup
+        self._lookup: Dict[str, str] = {}
+        # Methods called when the current language changes, held weakly
+        self._listeners: List["weakref.WeakMethod[Callable[[], None]]"] = []
+        self.available_languages = self._find_languages()
         self.current_language = self._get_supported_language()
 
     def _get_system_language(self) -> str:
@@ -243,43 +255,116 @@ class Language:
         lang_lower = lang_name.lower()
         return self.WINDOWS_LOCALE_MAP.get(lang_lower)
 
-    def _load_translations(self) -> Dict[str, Dict[str, str]]:
-        """Load all available translations from JSON files.
+    def _find_languages(self) -> List[str]:
+        """List the supported languages that have a translation file, without reading them.
 
-        Loads translation files from the translations directory. Each file should be
-        named with its language code (e.g., 'en.json', 'es.json').
+        Lists the precompiled translation bundle when one is shipped, then the
+        packed asset archive when one is bundled with translations, otherwise
+        the translations directory. Each file should be named with its
+        language code (e.g., 'en.json', 'es.json').
 
         Returns:
-            Dict[str, Dict[str, str]]: Dictionary mapping language codes to their translations.
-
-        Raises:
-            FileNotFoundError: If the translations directory doesn't exist.
-            ValueError: If no translation files are found.
+            List[str]: Language codes with a translation file, in SUPPORTED_LANGUAGES order.
         """
-        translations: Dict[str, Dict[str, str]] = {}
-        try:
+        bundle = get_translation_bundle()
+        if bundle is not None:
+            return [language_code for language_code in self.SUPPORTED_LANGUAGES if language_code in bundle]
+
+        names: List[str] = []
+        archive = get_asset_archive()
+        if archive is not None:
+            # Frozen builds read the translations straight from the packed asset archive
+            names = [os.path.basename(name) for name in archive.names(self.TRANSLATIONS_DIR + "/")]
+        if not names:
             translations_dir = resource_path(self.TRANSLATIONS_DIR)
+            if os.path.isdir(translations_dir):
+                names = os.listdir(translations_dir)
+        found = {name[: -len(".json")] for name in names if name.endswith(".json")}
+        # Without any file, get_text() still has the built-in English translations
+        return [language_code for language_code in self.SUPPORTED_LANGUAGES if language_code in found] or [
+            self.DEFAULT_LANGUAGE
+        ]
 
-            if not os.path.exists(translations_dir):
-                raise FileNotFoundError(f"Translations directory not found: {translations_dir}")
-
-            for filename in os.listdir(translations_dir):
-                if filename.endswith(".json"):
-                    language_code = filename.split(".")[0]
-                    if language_code in self.SUPPORTED_LANGUAGES:
-                        file_path = os.path.join(translations_dir, filename)
-                        with open(file_path, "r", encoding="utf-8") as f:
-                            translations[language_code] = json.load(f)
+    def _read_translations(self, language_code: str) -> Dict[str, str]:
+        """Read one language's translations from the translation bundle, the asset archive or its JSON file.
 
-            if not translations:
-                raise ValueError("No translation files found")
+        Args:
+            language_code (str): The language code to read (e.g., 'es').
 
-        except Exception as e:
-            print(f"Error loading translations: {e}")
-            translations[self.DEFAULT_LANGUAGE] = self._get_default_translations()
+        Returns:
+            Dict[str, str]: The language's translations.
 
+        Raises:
+            FileNotFoundError: If the language has no translation file.
+        """
+        bundle = get_translation_bundle()
+        if bundle is not None and language_code in bundle:
+            return bundle.translations(language_code)
+
+        relative_path = f"{self.TRANSLATIONS_DIR}/{language_code}.json"
+        data = open_asset(relative_path)
+        translations: Dict[str, str]
+        if data is not None:
+            translations = json.loads(bytes(data))
+        else:
+            with open(resource_path(relative_path), "r", encoding="utf-8") as f:
+                translations = json.load(f)
         return translations
 
+    def _load_language(self, language_code: str) -> Dict[str, str]:
+        """Return a language's translations, reading them on first use.
+
+        Args:
+            language_code (str): The language code to load (e.g., 'es').
+
+        Returns:
+            Dict[str, str]: The language's translations, empty if they cannot be read,
+                or the built-in English ones for the default language.
+        """
+        if language_code not in self.translations:
+            try:
+                self.translations[language_code] = self._read_translations(language_code)
+            except (OSError, ValueError) as e:
+                print(f"Error loading translations: {e}")
+                fallback = self._get_default_translations() if language_code == self.DEFAULT_LANGUAGE else {}
+                self.translations[language_code] = fallback
+        return self.translations[language_code]
+
+    @property
+    def current_language(self) -> str:
+        """The language get_text() translates to."""
+        return self._current_language
+
+    @current_language.setter
+    def current_language(self, language_code: str) -> None:
+        """Switch languages, loading the new one and flattening it over the English fallback."""
+        changed = language_code != getattr(self, "_current_language", None)
+        self._current_language = language_code
+        self._lookup = {**self._load_language(self.DEFAULT_LANGUAGE), **self._load_language(language_code)}
+        if changed:
+            self._notify_listeners()
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """Call a bound method whenever the current language changes.
+
+        Only a weak reference is kept, so objects rebuilt on a resize never need
+        to unregister; their listeners are dropped along with them.
+
+        Args:
+            listener (Callable[[], None]): Bound method to call after the change.
+        """
+        self._listeners.append(weakref.WeakMethod(listener))
+
+    def _notify_listeners(self) -> None:
+        """Call every live listener and forget the dead ones."""
+        live = []
+        for ref in self._listeners:
+            listener = ref()
+            if listener is not None:
+                listener()
+                live.append(ref)
+        self._listeners = live
+
     def _get_supported_language(self) -> str:
         """Get the best supported language based on system language.
 
@@ -333,11 +418,7 @@ class Language:
             >>> language.set_language("es")
             >>> language.get_text("play")  # Returns "Jugar" in Spanish
         """
-        try:
-            return self.translations[self.current_language][key]
-        except KeyError:
-            # Fallback to English if translation is missing
-            return self.translations[self.DEFAULT_LANGUAGE].get(key, key)
+        return self._lookup.get(key, key)
 
     def set_language(self, language_code: str) -> bool:
         """Set the current language if supported.
@@ -358,15 +439,22 @@ class Language:
             return True
         return False
 
+    def next_language(self) -> str:
+        """Switch to the next available language, wrapping around, and return its code."""
+        available = self.get_available_languages()
+        index = available.index(self.current_language) if self.current_language in available else -1
+        self.set_language(available[(index + 1) % len(available)])
+        return self.current_language
+
     def get_available_languages(self) -> List[str]:
         """Get list of available languages.
 
         Returns:
-            List[str]: List of language codes that have been successfully loaded.
+            List[str]: List of language codes that have a translation file.
 
         Example:
             >>> language = Language()
             >>> available = language.get_available_languages()
             >>> print(available)  # ['en', 'es', 'fr', 'de', 'it', 'pt']
         """
-        return list(self.translations.keys())
+        return list(self.available_languages)
@@ -0,0 +1,115 @@
+"""Precompiled translation bundle for frozen builds.
+
+Parsing one JSON file per language at launch is wasted work once the game
+is frozen, since the translations can no longer change. The build compiles
+every translation into a single bundle instead (python
+tools/build-translations.py), which Language prefers over the JSON files
+whenever one is shipped next to the executable. Development checkouts have
+no bundle and keep reading the JSON files.
+
+Bundle layout:
+    MAGIC (8 bytes) | marshal data: (keys, {language code: values})
+
+Keys are stored once, sorted, and interned when the bundle is loaded. Each
+language stores a tuple of values in key order, with None for the keys it
+does not translate. The marshal format is tied to the Python version, which
+is why the bundle is built by the same interpreter that freezes the game.
+"""
+
+import json
+import logging
+import marshal
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from src.core.path_utils import resource_path
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_NAME = "translations.bin"
+MAGIC = b"AITRN\x00\x01\x00"
+
+
+def compile_translations(source_dir: Union[str, Path]) -> bytes:
+    """Compile every JSON translation file of a directory into bundle bytes.
+
+    Languages and keys are written in sorted order so the same sources always
+    produce the same bundle.
+
+    Args:
+        source_dir (Union[str, Path]): Directory holding one <language code>.json file per language
+
+    Returns:
+        bytes: The bundle
+    """
+    translations: Dict[str, Dict[str, str]] = {}
+    for filename in sorted(os.listdir(source_dir)):
+        if filename.endswith(".json"):
+            with open(os.path.join(source_dir, filename), "r", encoding="utf-8") as f:
+                translations[filename[: -len(".json")]] = json.load(f)
+
+    keys = tuple(sorted({key for texts in translations.values() for key in texts}))
+    languages = {
+        language_code: tuple(texts.get(key) for key in keys) for language_code, texts in sorted(translations.items())
+    }
+    return MAGIC + marshal.dumps((keys, languages))
+
+
+class TranslationBundle:
+    """Translations of every language, decoded from bundle bytes.
+
+    Args:
+        data (bytes): The bundle, as written by compile_translations()
+
+    Raises:
+        ValueError: If the data is not a valid translation bundle.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        if data[: len(MAGIC)] != MAGIC:
+            raise ValueError("Not a translation bundle")
+        try:
+            keys, self._languages = marshal.loads(data[len(MAGIC) :])
+        except (EOFError, TypeError, ValueError) as e:
+            raise ValueError(f"Translation bundle is corrupt: {e}") from e
+        self._keys: Tuple[str, ...] = tuple(sys.intern(key) for key in keys)
+
+    def __contains__(self, language_code: object) -> bool:
+        return language_code in self._languages
+
+    def languages(self) -> List[str]:
+        """Return the language codes in the bundle, sorted."""
+        return list(self._languages)
+
+    def translations(self, language_code: str) -> Dict[str, str]:
+        """Return one language's translations, with the same keys and texts as its JSON file.
+
+        Raises:
+            KeyError: If the language is not in the bundle.
+        """
+        values: Tuple[Optional[str], ...] = self._languages[language_code]
+        return {key: value for key, value in zip(self._keys, values) if value is not None}
+
+
+_bundle: Optional[TranslationBundle] = None
+_bundle_checked = False
+
+
+def get_translation_bundle() -> Optional[TranslationBundle]:
+    """Return the shipped translation bundle, or None when reading the JSON files.
+
+    The bundle is looked up and decoded only once per process.
+    """
+    global _bundle, _bundle_checked
+    if not _bundle_checked:
+        _bundle_checked = True
+        bundle_path = resource_path(BUNDLE_NAME)
+        if os.path.isfile(bundle_path):
+            try:
+                with open(bundle_path, "rb") as f:
+                    _bundle = TranslationBundle(f.read())
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to open translation bundle {bundle_path}: {e}")
+    return _bundle
@@ -0,0 +1,266 @@
+"""Broadphase collision strategies for Alien Invasion.
+
+A broadphase quickly narrows bullet-alien testing down to candidate pairs
+whose bounds may overlap; the exact swept test in game_logic then decides
+which pairs actually hit. Strategies are interchangeable and selected with
+Configuration.broadphase:
+
+- "grid": uniform spatial grid, with the cell size derived from the scaled alien size
+- "sort_and_sweep": sorts bounds along x and sweeps for overlapping intervals
+- "brute_force": tests every bullet against every alien
+- "formation": indexes the fleet by column in formation coordinates, so the
+  index survives fleet movement and is only rebuilt when aliens are removed
+
+Bullets are passed in with their swept rect, covering the path from their
+previous to their current position.
+"""
+
+from __future__ import annotations
+
+import heapq
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple, TypedDict
+
+import pygame
+
+from src.core.entity_store import Archetype, EntityGroup
+
+if TYPE_CHECKING:
+    from src.entities.alien import Alien
+    from src.entities.bullet import Bullet
+
+SweptBullet = Tuple["Bullet", pygame.Rect]
+CandidatePair = Tuple["Bullet", "Alien"]
+
+
+class GridCell(TypedDict):
+    """Type definition for spatial grid cell contents."""
+
+    aliens: List[Alien]
+    bullets: List[Bullet]
+
+
+# Spatial Grid Configuration
+# The spatial grid divides the game world into a grid of fixed-size cells. Each cell
+# contains references to game objects (aliens and bullets) that occupy that space, so
+# collision detection only checks objects in the same cell.
+spatial_grid: Dict[Tuple[int, int], GridCell] = {}  # Maps (cell_x, cell_y) -> {"aliens": [...], "bullets": [...]}
+grid_cell_size = 64  # Cell size in pixels, derived from the scaled alien size by set_grid_cell_size()
+
+
+def set_grid_cell_size(size: int) -> None:
+    """Sets the spatial grid cell size, typically to the size of a scaled alien."""
+    global grid_cell_size
+    grid_cell_size = max(1, int(size))
+
+
+def get_grid_cells(rect: pygame.Rect, cell_size: Optional[int] = None) -> List[Tuple[int, int]]:
+    """Calculates which grid cells a rectangle occupies in the spatial grid.
+
+    The spatial grid divides the game world into a grid of fixed-size cells.
+    A game object may occupy multiple cells if it spans across cell boundaries.
+
+    For example, with a 64-pixel cell size:
+    - A bullet at position (100, 200) occupies cell (1, 3)
+    - An alien at position (120, 190) with width 40 might occupy cells (1, 2) and (1, 3)
+
+    Args:
+        rect (pygame.Rect): The rectangle to check (typically an alien or bullet rect)
+        cell_size (Optional[int]): Cell size in pixels; defaults to the current grid_cell_size
+
+    Returns:
+        list: List of (cell_x, cell_y) tuples representing grid cell coordinates
+
+    Algorithm:
+        1. Calculate start cell: rect.left // cell_size, rect.top // cell_size
+        2. Calculate end cell using inclusive bounds:
+           (rect.right - 1) // cell_size, (rect.bottom - 1) // cell_size
+        3. Return all cells in the range [start_x to end_x, start_y to end_y]
+    """
+    size = grid_cell_size if cell_size is None else cell_size
+    # Calculate the grid cell indices for the rectangle boundaries
+    start_x = rect.left // size
+    start_y = rect.top // size
+    end_x = max(rect.left, rect.right - 1) // size
+    end_y = max(rect.top, rect.bottom - 1) // size
+
+    # Collect all cells that this rectangle overlaps
+    cells: List[Tuple[int, int]] = []
+    for x in range(start_x, end_x + 1):
+        for y in range(start_y, end_y + 1):
+            cells.append((x, y))
+    return cells
+
+
+def build_spatial_grid(aliens: EntityGroup, sweeps: Sequence[SweptBullet]) -> None:
+    """Rebuilds the spatial grid from the aliens' rects and the bullets' swept rects.
+
+    Each object is added to every cell it occupies, using a sparse dictionary
+    so only populated cells exist.
+    """
+    spatial_grid.clear()
+    grid_cells: Dict[Tuple[int, int], GridCell] = {}
+
+    for alien in aliens:
+        for cell in get_grid_cells(alien.rect):
+            if cell not in grid_cells:
+                grid_cells[cell] = {"aliens": [], "bullets": []}
+            grid_cells[cell]["aliens"].append(alien)
+
+    for bullet, swept in sweeps:
+        for cell in get_grid_cells(swept):
+            if cell not in grid_cells:
+                grid_cells[cell] = {"aliens": [], "bullets": []}
+            grid_cells[cell]["bullets"].append(bullet)
+
+    spatial_grid.update(grid_cells)
+
+
+class Broadphase(ABC):
+    """Finds bullet-alien pairs that may collide.
+
+    Subclasses yield every pair whose bounds could overlap. They may yield a
+    pair more than once, but must never miss one.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def pairs(self, aliens: EntityGroup, sweeps: Sequence[SweptBullet]) -> Iterator[CandidatePair]:
+        """Yield candidate (bullet, alien) pairs.
+
+        Args:
+            aliens (EntityGroup): The fleet, with rects synced to the aliens' positions
+            sweeps (Sequence[SweptBullet]): Each active bullet with its swept rect
+        """
+
+
+class UniformGridBroadphase(Broadphase):
+    """Pairs bullets and aliens that share a cell of the spatial grid."""
+
+    name = "grid"
+
+    def pairs(self, aliens: EntityGroup, sweeps: Sequence[SweptBullet]) -> Iterator[CandidatePair]:
+        build_spatial_grid(aliens, sweeps)
+        for cell_data in spatial_grid.values():
+            if cell_data["aliens"] and cell_data["bullets"]:
+                for bullet in cell_data["bullets"]:
+                    for alien in cell_data["aliens"]:
+                        yield bullet, alien
+
+
+class SortAndSweepBroadphase(Broadphase):
+    """Sorts every rect by its left edge and pairs those whose x intervals overlap."""
+
+    name = "sort_and_sweep"
+
+    def pairs(self, aliens: EntityGroup, sweeps: Sequence[SweptBullet]) -> Iterator[CandidatePair]:
+        # (left, is_bullet, index) sorts bullets and aliens together; the index breaks ties
+        bullets = [(swept, bullet) for bullet, swept in sweeps]
+        fleet = [(alien.rect, alien) for alien in aliens]
+        order = [(swept.left, True, i) for i, (swept, _) in enumerate(bullets)]
+        order.extend((rect.left, False, i) for i, (rect, _) in enumerate(fleet))
+        order.sort()
+        open_bullets: Dict[int, Tuple[pygame.Rect, Bullet]] = {}
+        open_aliens: Dict[int, Tuple[pygame.Rect, Alien]] = {}
+        # (right, is_bullet, index) of every open interval, so they close in order of their right edge
+        ends: List[Tuple[int, bool, int]] = []
+        for left, is_bullet, i in order:
+            # Close intervals that end before this one starts
+            while ends and ends[0][0] <= left:
+                _, ended_bullet, j = heapq.heappop(ends)
+                if ended_bullet:
+                    del open_bullets[j]
+                else:
+                    del open_aliens[j]
+            if is_bullet:
+                swept, bullet = bullets[i]
+                for rect, alien in open_aliens.values():
+                    if rect.top < swept.bottom and swept.top < rect.bottom:
+                        yield bullet, alien
+                open_bullets[i] = bullets[i]
+                heapq.heappush(ends, (swept.right, True, i))
+            else:
+                rect, alien = fleet[i]
+                for swept, bullet in open_bullets.values():
+                    if rect.top < swept.bottom and swept.top < rect.bottom:
+                        yield bullet, alien
+                open_aliens[i] = fleet[i]
+                heapq.heappush(ends, (rect.right, False, i))
+
+
+class BruteForceBroadphase(Broadphase):
+    """Tests every bullet against every alien. Useful as a reference and for tiny fleets."""
+
+    name = "brute_force"
+
+    def pairs(self, aliens: EntityGroup, sweeps: Sequence[SweptBullet]) -> Iterator[CandidatePair]:
+        fleet = aliens.sprites()
+        for bullet, swept in sweeps:
+            for alien in fleet:
+                if swept.colliderect(alien.rect):
+                    yield bullet, alien
+
+
+class FormationBroadphase(Broadphase):
+    """Indexes the fleet by column in formation coordinates.
+
+    Alien positions in the archetype are relative to the fleet origin, so the
+    column index stays valid while the formation moves and is only rebuilt
+    when an alien is added, removed or moved on its own.
+    """
+
+    name = "formation"
+
+    def __init__(self) -> None:
+        self._archetype: Optional[Archetype] = None
+        self._version = -1
+        self._column_width = 1.0
+        self._columns: Dict[int, List[int]] = {}
+
+    def _index(self, archetype: Archetype) -> None:
+        """Rebuild the column index if the fleet changed since it was built."""
+        if archetype is self._archetype and archetype.version == self._version:
+            return
+        indices = list(archetype.indices())
+        self._column_width = float(max((archetype.width[i] for i in indices), default=1) or 1)
+        columns: Dict[int, List[int]] = {}
+        x = archetype.x
+        for i in indices:
+            columns.setdefault(int(x[i] // self._column_width), []).append(i)
+        self._columns = columns
+        self._archetype = archetype
+        self._version = archetype.version
+
+    def pairs(self, aliens: EntityGroup, sweeps: Sequence[SweptBullet]) -> Iterator[CandidatePair]:
+        archetype = aliens.archetype
+        self._index(archetype)
+        width, columns, entities = self._column_width, self._columns, archetype.entities
+        for bullet, swept in sweeps:
+            # An alien overlaps the sweep only if its left edge lies within one column width to the left of it
+            left = swept.left - archetype.origin_x
+            first = int((left - width) // width)
+            last = int((swept.right - archetype.origin_x) // width)
+            for column in range(first, last + 1):
+                for i in columns.get(column, ()):
+                    alien = entities[i]
+                    if alien is not None and swept.colliderect(alien.rect):
+                        yield bullet, alien  # type: ignore[misc]
+
+
+BROADPHASES: Dict[str, Broadphase] = {
+    strategy.name: strategy
+    for strategy in (UniformGridBroadphase(), SortAndSweepBroadphase(), BruteForceBroadphase(), FormationBroadphase())
+}
+
+
+def get_broadphase(name: str) -> Broadphase:
+    """Returns the broadphase strategy registered under a name.
+
+    Raises:
+        ValueError: If no strategy has that name
+    """
+    try:
+        return BROADPHASES[name]
+    except KeyError:
+        raise ValueError(f"Unknown broadphase '{name}'. Available: {', '.join(BROADPHASES)}") from None
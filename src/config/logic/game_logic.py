@@ -3,203 +3,229 @@
 This module handles core game mechanics including:
 - Alien movement and fleet management
 - Bullet physics and collision detection
-- Spatial grid optimization for efficient collision detection
-
-The spatial grid system divides the game world into a grid of cells,
-allowing for O(n) collision detection instead of O(n²) by only checking
-objects in nearby cells.
+- Pluggable broadphase for efficient collision detection
+- Swept (continuous) bullet collision, so fast bullets cannot skip aliens
+
+Aliens and bullets live in EntityGroups, so movement runs as a single
+system over each group's component arrays rather than one update() call
+per sprite. The fleet moves as one formation by shifting its archetype's
+origin, and alien rects are only synced when a collision test needs them.
+
+Candidate bullet-alien pairs come from the broadphase selected with
+Configuration.broadphase (see broadphase.py). The default spatial grid
+divides the game world into cells sized like an alien, allowing for O(n)
+collision detection instead of O(n²) by only checking objects in nearby cells.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, List, Tuple, TypedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import pygame
 
-from src.config.actors.game_actors import check_aliens_bottom, create_fleet, ship_hit
+from src.config.actors.game_actors import check_aliens_bottom, create_fleet, prebuild_next_fleet, ship_hit, spawn_fleet_rows
+from src.config.logic.broadphase import get_broadphase
+from src.core.entity_store import movement_system, sync_rects, translate_system
+from src.entities.alien import Alien
+from src.entities.bullet import Bullet
 
 if TYPE_CHECKING:
-    from src.entities.alien import Alien
-    from src.entities.bullet import Bullet
     from src.game import Game
 
-
-class GridCell(TypedDict):
-    """Type definition for spatial grid cell contents."""
-
-    aliens: List[Alien]
-    bullets: List[Bullet]
-
-
-# Spatial Grid Configuration
-# The spatial grid is a performance optimization technique that divides the game world
-# into a grid of fixed-size cells. Each cell contains references to game objects
-# (aliens and bullets) that occupy that space. This allows collision detection to only
-# check objects in nearby cells instead of checking every object against every other object.
-spatial_grid: Dict[Tuple[int, int], GridCell] = {}  # Maps (cell_x, cell_y) -> {"aliens": [...], "bullets": [...]}
-grid_cell_size = 64  # Cell size in pixels - tuned for typical alien/bullet sizes
+# Solid masks for bullet paths, by size, used by precise collisions
+_path_masks: Dict[Tuple[int, int], pygame.mask.Mask] = {}
+_max_path_masks = 32
 
 
 def update_aliens(game: Game) -> None:
     """Checks if the fleet is at the edge and then updates the positions of all aliens in the fleet"""
+    spawn_fleet_rows(game)
+    prebuild_next_fleet(game)
     check_fleet_edges(game)
-    game.aliens.update()
+    move_fleet(game)
 
-    # Check for alien-ship collisions
-    if pygame.sprite.spritecollideany(game.ship, game.aliens):
-        ship_hit(game)
+    # Check for alien-ship collisions, once the fleet is low enough to reach the ship
+    bounds = game.aliens.archetype.bounds()
+    if bounds is not None and bounds[3] >= game.ship.rect.top:
+        sync_rects(game.aliens.archetype)
+        if ship_collides_with_fleet(game):
+            ship_hit(game)
 
     # Check for aliens hitting the bottom of the screen
     check_aliens_bottom(game)
 
 
+def ship_collides_with_fleet(game: Game) -> bool:
+    """Returns True if an alien touches the ship.
+
+    With precise collisions, aliens whose rect touches the ship's are then
+    checked against the opaque pixels of both images.
+    """
+    if not game.ai_configuration.precise_collisions:
+        return pygame.sprite.spritecollideany(game.ship, game.aliens) is not None
+    touching = pygame.sprite.spritecollide(game.ship, game.aliens, False)
+    return any(pygame.sprite.collide_mask(game.ship, alien) for alien in touching)
+
+
 def update_bullets(game: Game) -> None:
     """Updates the bullet positions and handles bullet-alien collisions."""
     # Updates the bullet positions
-    game.bullets.update()
+    move_bullets(game)
 
     # Remove inactive bullets from the group
-    for bullet in game.bullets.copy():
+    for bullet in game.bullets.sprites():
         if not bullet.active:
             game.bullets.remove(bullet)
 
     check_bullet_alien_collisions(game)
 
 
-def get_grid_cells(rect: pygame.Rect) -> List[Tuple[int, int]]:
-    """Calculates which grid cells a rectangle occupies in the spatial grid.
+def move_fleet(game: Game) -> None:
+    """Moves the whole fleet sideways by the fleet speed with a single update of its origin."""
+    ai_configuration = game.ai_configuration
+    translate_system(game.aliens.archetype, dx=ai_configuration.alien_speed_factor * ai_configuration.fleet_direction)
+
 
-    The spatial grid divides the game world into a grid of fixed-size cells.
-    A game object may occupy multiple cells if it spans across cell boundaries.
+def move_bullets(game: Game) -> None:
+    """Moves every bullet by its velocity and deactivates bullets that left the screen."""
+    archetype = game.bullets.archetype
+    movement_system(archetype)
+    entities = archetype.entities
+    for i in archetype.indices():
+        bullet = entities[i]
+        if bullet.rect.bottom <= 0:  # type: ignore[union-attr]
+            bullet.active = False  # type: ignore[union-attr]
+            Bullet.return_to_pool(bullet)  # type: ignore[arg-type]
 
-    For example, with a 64-pixel cell size:
-    - A bullet at position (100, 200) occupies cell (1, 3)
-    - An alien at position (120, 190) with width 40 might occupy cells (1, 2) and (1, 3)
 
-    This function calculates all cells that a rectangle overlaps with.
+def swept_collision_time(previous: pygame.Rect, current: pygame.Rect, target: pygame.Rect) -> Optional[float]:
+    """Returns when a rect moving from previous to current first overlaps target.
+
+    This is a swept AABB test using the slab method: for each axis, find the
+    fraction of the move during which the moving rect overlaps the target on
+    that axis, then intersect the two intervals. Like Rect.colliderect(),
+    rects that only touch edges do not count as overlapping.
 
     Args:
-        rect (pygame.Rect): The rectangle to check (typically an alien or bullet rect)
+        previous (pygame.Rect): The moving rect at the start of the move
+        current (pygame.Rect): The moving rect at the end of the move
+        target (pygame.Rect): The stationary rect to test against
 
     Returns:
-        list: List of (cell_x, cell_y) tuples representing grid cell coordinates
-
-    Algorithm:
-        1. Calculate start cell: rect.left // cell_size, rect.top // cell_size
-        2. Calculate end cell using inclusive bounds:
-           (rect.right - 1) // cell_size, (rect.bottom - 1) // cell_size
-        3. Return all cells in the range [start_x to end_x, start_y to end_y]
+        Optional[float]: Fraction of the move, from 0.0 to 1.0, at which the rects
+        first overlap, or None if they never do
     """
-    # Calculate the grid cell indices for the rectangle boundaries
-    start_x = rect.left // grid_cell_size
-    start_y = rect.top // grid_cell_size
-    end_x = max(rect.left, rect.right - 1) // grid_cell_size
-    end_y = max(rect.top, rect.bottom - 1) // grid_cell_size
-
-    # Collect all cells that this rectangle overlaps
-    cells: List[tuple[int, int]] = []
-    for x in range(start_x, end_x + 1):
-        for y in range(start_y, end_y + 1):
-            cells.append((x, y))
-    return cells
-
-
-def update_spatial_grid(game: Game) -> None:
-    """Updates the spatial grid with current positions of aliens and bullets.
-
-    The spatial grid optimization works by:
-    1. Dividing the game world into a grid of 64x64 pixel cells
-    2. Assigning each alien and bullet to the cell(s) they occupy
-    3. Only checking collisions between objects in the same cell
-
-    Performance benefit:
-    - Without spatial grid: O(n * m) where n=bullets, m=aliens
-    - With spatial grid: O(k) where k=average objects per cell
-    - For typical gameplay: ~60x faster collision detection
-
-    Example:
-    - 100 bullets × 50 aliens = 5,000 collision checks (brute force)
-    - With grid: ~10 objects per cell × 10 checks = 100 collision checks
+    entry, exit_ = 0.0, 1.0
+    for start, end, size, target_start, target_end in (
+        (previous.left, current.left, previous.width, target.left, target.right),
+        (previous.top, current.top, previous.height, target.top, target.bottom),
+    ):
+        delta = end - start
+        if delta == 0:
+            # No movement on this axis: it must already overlap
+            if start + size <= target_start or start >= target_end:
+                return None
+            continue
+        # Times at which the leading and trailing edges cross the target on this axis
+        first = (target_start - (start + size)) / delta
+        last = (target_end - start) / delta
+        if first > last:
+            first, last = last, first
+        entry = max(entry, first)
+        exit_ = min(exit_, last)
+        if entry >= exit_:
+            return None
+    return entry
+
+
+def swept_bullets(game: Game) -> List[Tuple[Bullet, pygame.Rect]]:
+    """Returns each active bullet with the rect its path covered this frame."""
+    return [(bullet, bullet.rect.union(bullet.previous_rect())) for bullet in game.bullets if bullet.active]
+
+
+def path_hits_alien(path: pygame.Rect, alien: Alien) -> bool:
+    """Returns True if a bullet's path covers any opaque pixel of an alien."""
+    mask = _path_masks.get(path.size)
+    if mask is None:
+        if len(_path_masks) >= _max_path_masks:
+            _path_masks.clear()
+        mask = _path_masks[path.size] = pygame.mask.Mask(path.size, fill=True)
+    return alien.mask.overlap(mask, (path.x - alien.rect.x, path.y - alien.rect.y)) is not None
+
+
+def find_bullet_hits(game: Game) -> List[Tuple[float, Bullet, Alien]]:
+    """Finds the first alien each active bullet hit along its path this frame.
+
+    Candidate pairs come from the configured broadphase; each one is then
+    confirmed with a swept test from the bullet's previous position. With
+    precise collisions, the bullet's path must also cross an opaque pixel of
+    the alien, so hits on an image's transparent border are ignored.
+
+    Returns:
+        List[Tuple[float, Bullet, Alien]]: (time of impact, bullet, alien) for each
+        bullet that hit, ordered by time of impact
     """
-    global spatial_grid
-    spatial_grid.clear()
-
-    # Pre-allocate grid cells for better performance
-    # Using a dictionary allows sparse grid (only populated cells exist)
-    grid_cells: Dict[Tuple[int, int], GridCell] = {}
-
-    # Phase 1: Add aliens to grid
-    # Each alien is added to all cells it occupies (usually 1-4 cells)
-    for alien in game.aliens:
-        # Get all cells that the alien occupies
-        alien_cells = get_grid_cells(alien.rect)
-        for cell in alien_cells:
-            if cell not in grid_cells:
-                grid_cells[cell] = {"aliens": [], "bullets": []}
-            grid_cells[cell]["aliens"].append(alien)
-
-    # Phase 2: Add bullets to grid
-    # Bullets are typically smaller and occupy fewer cells
-    for bullet in game.bullets:
-        # Get all cells that the bullet occupies
-        bullet_cells = get_grid_cells(bullet.rect)
-        for cell in bullet_cells:
-            if cell not in grid_cells:
-                grid_cells[cell] = {"aliens": [], "bullets": []}
-            grid_cells[cell]["bullets"].append(bullet)
-
-    # Phase 3: Update the global spatial grid
-    # This replaces the old grid with the new one
-    spatial_grid.update(grid_cells)
+    sync_rects(game.aliens.archetype)
+    sweeps = swept_bullets(game)
+    previous = {bullet: bullet.previous_rect() for bullet, _ in sweeps}
+    paths = dict(sweeps)
+    broadphase = get_broadphase(game.ai_configuration.broadphase)
+    precise = game.ai_configuration.precise_collisions
+
+    # Earliest hit per bullet; a broadphase may report the same pair more than once
+    hits: Dict[Bullet, Tuple[float, Alien]] = {}
+    for bullet, alien in broadphase.pairs(game.aliens, sweeps):
+        time = swept_collision_time(previous[bullet], bullet.rect, alien.rect)
+        if time is None or (bullet in hits and time >= hits[bullet][0]):
+            continue
+        if not precise or path_hits_alien(paths[bullet], alien):
+            hits[bullet] = (time, alien)
+    return sorted(((time, bullet, alien) for bullet, (time, alien) in hits.items()), key=lambda hit: hit[0])
 
 
 def check_bullet_alien_collisions(game: Game) -> None:
-    """Responds to bullet-alien collisions using spatial grid optimization.
+    """Responds to bullet-alien collisions using the configured broadphase.
 
     Collision detection algorithm:
-    1. Update spatial grid with current positions
-    2. For each grid cell that contains both bullets AND aliens:
-       - Only check collisions between objects in that cell
-       - Mark bullet as inactive and remove alien on collision
-       - Update score and trigger explosion effect
-    3. Check for level completion (all aliens destroyed)
-    4. Update high score if needed
+    1. Ask the broadphase for the aliens near each bullet's swept path; the
+       default spatial grid pairs bullets and aliens that share a cell
+    2. Test each candidate pair, sweeping the bullet from its previous
+       position to its current one
+    3. Resolve hits in order of time of impact: each bullet destroys the first
+       alien on its path, and an alien can only be destroyed once
+    4. Check for level completion (all aliens destroyed)
+    5. Update high score if needed
 
     Why this is faster:
     - Brute force would check every bullet against every alien
     - Spatial grid only checks bullets against aliens in nearby cells
     - Most cells contain either bullets OR aliens, not both
     - Empty cells are skipped entirely
+
+    Sweeping makes the result independent of the bullet speed and the frame
+    rate: a bullet that moves further than an alien's height in one step
+    still hits it.
     """
-    # Update spatial grid with current object positions
-    update_spatial_grid(game)
-
-    # Check collisions only in cells that contain both bullets and aliens
-    # Most cells will have only one or the other, so this skips many cells
-    for cell_data in spatial_grid.values():
-        if cell_data["aliens"] and cell_data["bullets"]:
-            # Check collisions between bullets and aliens in this cell only
-            for bullet in cell_data["bullets"]:
-                if not bullet.active:
-                    continue
-                for alien in cell_data["aliens"]:
-                    if not alien.alive():
-                        continue
-                    if bullet.rect.colliderect(alien.rect):
-                        # Hit detected - deactivate bullet and destroy alien
-                        bullet.active = False
-                        alien.kill()
-                        game.statistics.score += game.ai_configuration.alien_points
-                        alien.explode()
-                        game.scoreboard.prep_score()
-                        # Light rumble for alien hit
-                        game.gamepad.rumble(0.3, 0.5, 100)
-                        break  # Bullet can only hit one alien
+    # Without bullets there is nothing to test, and the fleet's rects can stay unsynced
+    if game.bullets:
+        for _, bullet, alien in find_bullet_hits(game):
+            if not alien.alive():
+                # Another bullet reached this alien first this frame
+                continue
+            # Hit detected - deactivate bullet and destroy alien
+            bullet.active = False
+            alien.kill()
+            game.statistics.score += game.ai_configuration.alien_points
+            alien.explode()
+            Alien.return_to_pool(alien)
+            game.scoreboard.prep_score()
+            # Light rumble for alien hit
+            game.gamepad.rumble(0.3, 0.5, 100)
 
     check_high_score(game)
 
-    # Check if all aliens are destroyed (level complete)
-    if len(game.aliens) == 0:
+    # Check if all aliens are destroyed (level complete), including rows still waiting to spawn
+    if len(game.aliens) == 0 and not game.fleet_spawner.is_spawning:
         # Clear remaining bullets and start new level
         game.bullets.empty()
         game.ai_configuration.boost_speed()
@@ -218,14 +244,15 @@ def check_high_score(game: Game) -> None:
 
 def check_fleet_edges(game: Game) -> None:
     """Respond appropriately if any alien has reached an edge"""
-    for alien in game.aliens.sprites():
-        if alien.check_edges():
-            change_fleet_direction(game)
-            break
+    bounds = game.aliens.archetype.bounds()
+    if bounds is None:
+        return
+    # Same test as Alien.check_edges(), on the integer left edge of the formation
+    if bounds[2] >= game.screen.get_rect().right or int(bounds[0]) <= 0:
+        change_fleet_direction(game)
 
 
 def change_fleet_direction(game: Game) -> None:
     """Changes the direction of the alien fleet and moves it down."""
-    for alien in game.aliens.sprites():
-        alien.rect.y += game.ai_configuration.fleet_drop_speed
+    translate_system(game.aliens.archetype, dy=game.ai_configuration.fleet_drop_speed)
     game.ai_configuration.fleet_direction *= -1
@@ -1,10 +1,26 @@
+import io
+import logging
 import os
-from typing import Any, Optional, Union
+from typing import Any, Dict, Optional, Set, Union
 
 import pygame
 from pygame.mixer import Sound
 
+from src.config.music.voices import VoiceManager
+from src.core.asset_archive import open_asset
+from src.core.asset_manifest import LAZY_SOUND_ASSETS
 from src.core.path_utils import resource_path
+from src.core.resource_manager import PreloadJob, ResourceManager
+
+logger = logging.getLogger(__name__)
+
+MUSIC_TRACK = "src/assets/music/music.mp3"
+SHOOT_SOUND = "src/assets/sounds/shoot.wav"
+EXPLOSION_SOUND = "src/assets/sounds/explosion.wav"
+GAME_OVER_SOUND = "src/assets/sounds/game_over.wav"
+
+# Playback volume of each sound effect
+SOUND_VOLUMES: Dict[str, float] = {SHOOT_SOUND: 0.3, EXPLOSION_SOUND: 0.4, GAME_OVER_SOUND: 0.5}
 
 
 class DummySound:
@@ -22,6 +38,23 @@ SoundType = Union[Sound, DummySound]
 
 
 class Music:
+    """Plays the background music and the sound effects.
+
+    The background music is streamed from disk through pygame.mixer.music
+    instead of being decoded into memory. Sound effects are fetched from the
+    ResourceManager whenever they play, and never held here, so their memory
+    is accounted for in one place and idle ones can be unloaded. Shoot and
+    explosion effects are loaded up front, since they play constantly; the
+    large game over sound is only loaded when it is first needed, or on a
+    worker thread once prefetch_game_over() is called. Each asset that fails
+    to load is replaced by a silent DummySound on its own, so one missing file
+    never disables the others.
+
+    Effects play through a VoiceManager, so rapid fire and explosions are
+    capped to their own reserved channels and can never crowd out the game
+    over sound.
+    """
+
     _instance: Optional["Music"] = None
     _initialized: bool
 
@@ -41,60 +74,114 @@ class Music:
         # Check if we're in a test environment
         self.is_test: bool = "PYTEST_CURRENT_TEST" in os.environ
 
+        self.music_loaded: bool = False
+        self._music_volume: float = 0.5
+        self._music_file: Optional[io.BytesIO] = None
+        self._game_over_job: Optional[PreloadJob] = None
+        # Sound effects that failed to load, so they are not retried on every play
+        self._unavailable: Set[str] = set()
+
         try:
             # Initialize the function so the music can start playing
             pygame.mixer.init()
+        except pygame.error as e:
+            logger.warning(f"Audio is unavailable, all sounds are disabled: {e}")
+            self._unavailable.update(SOUND_VOLUMES)
+        else:
+            self._start_music()
+            # Load sound effects (already decoded if the asset manifest was preloaded)
+            self._sound(SHOOT_SOUND)
+            self._sound(EXPLOSION_SOUND)
 
-            # Use resource_path() to get the correct music path
-            music_path = resource_path("src/assets/music/music.mp3")
+        # Reserves channels per category; plays nothing if the mixer is unavailable
+        self.voices = VoiceManager()
 
-            # Variable to define the music for the game
-            self.sound: SoundType = pygame.mixer.Sound(music_path)
+        self._initialized = True
 
-            # Set the music volume
-            self.sound.set_volume(0.5)
+    def _start_music(self) -> None:
+        """Stream the background music, looping forever."""
+        try:
+            data = open_asset(MUSIC_TRACK)
+            if data is not None:
+                # The stream reads from this buffer while playing, so keep it alive
+                self._music_file = io.BytesIO(data)
+                pygame.mixer.music.load(self._music_file, os.path.basename(MUSIC_TRACK))
+            else:
+                pygame.mixer.music.load(resource_path(MUSIC_TRACK))
+        except (pygame.error, OSError) as e:
+            logger.warning(f"Background music is unavailable: {e}")
+            return
 
-            # Load sound effects
-            self.shoot_sound: SoundType = pygame.mixer.Sound(resource_path("src/assets/sounds/shoot.wav"))
-            self.explosion_sound: SoundType = pygame.mixer.Sound(resource_path("src/assets/sounds/explosion.wav"))
-            self.game_over_sound: SoundType = pygame.mixer.Sound(resource_path("src/assets/sounds/game_over.wav"))
+        self.music_loaded = True
+        pygame.mixer.music.set_volume(self._music_volume)
+        # Pass the value "-1" to play the music infinitely
+        if not self.is_test:
+            pygame.mixer.music.play(-1)
 
-            # Set sound effects volume
-            self.shoot_sound.set_volume(0.3)
-            self.explosion_sound.set_volume(0.4)
-            self.game_over_sound.set_volume(0.5)
+    def _sound(self, path: str) -> SoundType:
+        """Return a sound effect from the ResourceManager, or a silent DummySound if it cannot be loaded."""
+        if path in self._unavailable:
+            return DummySound()
+        try:
+            sound: SoundType = ResourceManager().get_sound(path)
+        except (pygame.error, OSError) as e:
+            logger.warning(f"Sound effect {path} is unavailable: {e}")
+            self._unavailable.add(path)
+            return DummySound()
+        sound.set_volume(SOUND_VOLUMES[path])
+        return sound
 
-            # Pass the variable with the music and add the value "-1" to play the music infinitely
-            if not self.is_test:
-                pygame.mixer.Sound.play(self.sound, -1)
-        except pygame.error:
-            self.sound = DummySound()
-            self.shoot_sound = DummySound()
-            self.explosion_sound = DummySound()
-            self.game_over_sound = DummySound()
+    @property
+    def shoot_sound(self) -> SoundType:
+        """Shoot sound effect"""
+        return self._sound(SHOOT_SOUND)
 
-        self._initialized = True
+    @property
+    def explosion_sound(self) -> SoundType:
+        """Explosion sound effect"""
+        return self._sound(EXPLOSION_SOUND)
+
+    @property
+    def game_over_sound(self) -> SoundType:
+        """Game over sound effect, loaded on first use"""
+        if self._game_over_job is not None:
+            ResourceManager().finalize_preload(self._game_over_job)
+            self._game_over_job = None
+        return self._sound(GAME_OVER_SOUND)
+
+    def prefetch_game_over(self) -> None:
+        """Start decoding the game over sound on a worker thread, ahead of its first use."""
+        if self._game_over_job is None and GAME_OVER_SOUND not in self._unavailable and pygame.mixer.get_init():
+            self._game_over_job = ResourceManager().preload(sounds=LAZY_SOUND_ASSETS)
 
     @property
     def volume(self) -> float:
-        """Get the current volume of the main sound"""
-        return self.sound.get_volume()
+        """Get the current volume of the background music"""
+        if self.music_loaded:
+            return pygame.mixer.music.get_volume()
+        return self._music_volume
 
     @volume.setter
     def volume(self, value: float) -> None:
-        """Set the volume of the main sound"""
-        self.sound.set_volume(value)
+        """Set the volume of the background music"""
+        self._music_volume = value
+        if self.music_loaded:
+            pygame.mixer.music.set_volume(value)
 
     def pause(self) -> None:
         """Pause the music"""
         if not self.is_test:
             pygame.mixer.pause()
+            if self.music_loaded:
+                pygame.mixer.music.pause()
         self.is_paused = True
 
     def resume(self) -> None:
         """Resume the music"""
         if not self.is_test:
             pygame.mixer.unpause()
+            if self.music_loaded:
+                pygame.mixer.music.unpause()
         self.is_paused = False
 
     def toggle_music(self) -> None:
@@ -104,25 +191,33 @@ class Music:
         else:
             self.pause()
 
+    def _play_effect(self, sound: SoundType, category: str) -> None:
+        """Play a sound effect on the voices reserved for its category"""
+        if isinstance(sound, Sound):
+            self.voices.play(sound, category)
+
     def play_shoot(self) -> None:
         """Play shoot sound effect"""
         if not self.is_test and self.sound_effects_enabled:
-            self.shoot_sound.play()
+            self._play_effect(self.shoot_sound, "weapon")
 
     def play_explosion(self) -> None:
         """Play explosion sound effect"""
         if not self.is_test and self.sound_effects_enabled:
-            self.explosion_sound.play()
+            self._play_effect(self.explosion_sound, "impact")
 
     def play_game_over(self) -> None:
         """Play game over sound effect"""
         if not self.is_test and self.sound_effects_enabled:
             # Pause the background music
             pygame.mixer.pause()
+            if self.music_loaded:
+                pygame.mixer.music.pause()
             # Increase volume for game over sound
-            self.game_over_sound.set_volume(1.0)
-            # Play the game over sound
-            self.game_over_sound.play()
+            game_over_sound = self.game_over_sound
+            game_over_sound.set_volume(1.0)
+            # Play the game over sound on its own reserved channel
+            self._play_effect(game_over_sound, "critical")
 
     def toggle_sound_effects(self) -> None:
         """Toggle sound effects on/off"""
@@ -0,0 +1,172 @@
+"""Voice management for Alien Invasion's sound effects.
+
+Sound.play() picks whatever mixer channel happens to be free, so rapid fire
+and several explosions in one frame can use up every channel and drop the
+sounds that matter most. The VoiceManager instead reserves mixer channels
+for each category of sound and decides which voice plays:
+
+- A sound never plays more than its category's max_voices copies at once;
+  one more play restarts its oldest copy
+- A category plays on its own reserved channels while one is free
+- Otherwise it steals the channel of the oldest voice with a lower priority,
+  or the oldest voice of its own category, and is dropped only if neither exists
+
+The mixer's buffer size sets the delay between playing a sound and hearing
+it. configure_mixer() applies it, and mixer_latency_ms() reports the result.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import pygame
+
+DEFAULT_BUFFER_SIZE = 512
+
+# Buffer size the mixer was opened with by configure_mixer()
+_buffer_size = DEFAULT_BUFFER_SIZE
+
+
+class VoiceCategory(NamedTuple):
+    """Playback rules shared by every sound of a category.
+
+    Attributes:
+        channels (int): Mixer channels reserved for the category
+        priority (int): Voices of higher priority categories may steal channels from lower ones
+        max_voices (int): Most copies of one sound that may play at once
+    """
+
+    channels: int
+    priority: int
+    max_voices: int
+
+
+# Categories used by the Music manager
+DEFAULT_CATEGORIES: Dict[str, VoiceCategory] = {
+    "critical": VoiceCategory(channels=1, priority=100, max_voices=1),
+    "impact": VoiceCategory(channels=4, priority=50, max_voices=3),
+    "weapon": VoiceCategory(channels=3, priority=10, max_voices=2),
+}
+
+
+def configure_mixer(buffer_size: int = DEFAULT_BUFFER_SIZE) -> bool:
+    """Open the mixer with a given buffer size, reopening it if it is already open.
+
+    Call this before any sound is played, since reopening the mixer stops them.
+
+    Args:
+        buffer_size (int): Samples per mixer buffer; smaller buffers play sounds sooner
+            at the cost of more frequent audio callbacks
+
+    Returns:
+        bool: True if the mixer is open with the new buffer size
+    """
+    global _buffer_size
+    pygame.mixer.pre_init(buffer=buffer_size)
+    try:
+        if pygame.mixer.get_init():
+            pygame.mixer.quit()
+        pygame.mixer.init(buffer=buffer_size)
+    except pygame.error:
+        return False
+    _buffer_size = buffer_size
+    return True
+
+
+def mixer_latency_ms() -> Optional[float]:
+    """Return the delay, in milliseconds, added by one mixer buffer, or None without a mixer."""
+    # get_init() returns None while the mixer is closed, despite its type hints
+    mixer: Optional[Tuple[int, int, int]] = pygame.mixer.get_init()
+    if not mixer:
+        return None
+    return _buffer_size / mixer[0] * 1000
+
+
+class VoiceManager:
+    """Plays sounds on channels reserved per category, limiting and prioritizing voices.
+
+    Args:
+        categories (Dict[str, VoiceCategory]): Rules for each category of sound
+
+    Attributes:
+        stolen (int): Number of voices cut short to make room for another
+        dropped (int): Number of sounds that found no channel and did not play
+    """
+
+    def __init__(self, categories: Dict[str, VoiceCategory] = DEFAULT_CATEGORIES) -> None:
+        self.categories = categories
+        self.stolen = 0
+        self.dropped = 0
+        # Channel indices reserved for each category
+        self._channels: Dict[str, List[int]] = {}
+        # What each reserved channel last played: (sound, priority, play order)
+        self._voices: List[Optional[Tuple[pygame.mixer.Sound, int, int]]] = []
+        self._plays = 0
+
+        mixer: Optional[Tuple[int, int, int]] = pygame.mixer.get_init()
+        if not mixer:
+            return
+        total = sum(category.channels for category in categories.values())
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), total))
+        # Reserved channels are never picked by a plain Sound.play()
+        pygame.mixer.set_reserved(total)
+        first = 0
+        for name, category in categories.items():
+            self._channels[name] = list(range(first, first + category.channels))
+            first += category.channels
+        self._voices = [None] * total
+
+    def _playing(self, index: int) -> Optional[Tuple[pygame.mixer.Sound, int, int]]:
+        """Return the voice on a reserved channel, or None if the channel is free."""
+        voice = self._voices[index]
+        if voice is not None and not pygame.mixer.Channel(index).get_busy():
+            voice = self._voices[index] = None
+        return voice
+
+    def _pick_channel(self, sound: pygame.mixer.Sound, name: str, category: VoiceCategory) -> Optional[int]:
+        """Choose the reserved channel a sound should play on, or None to drop it."""
+        voices = [self._playing(i) for i in range(len(self._voices))]
+
+        # Restart the oldest copy of a sound that is already at its voice limit
+        copies = [(voice[2], i) for i, voice in enumerate(voices) if voice is not None and voice[0] is sound]
+        if len(copies) >= category.max_voices:
+            return min(copies)[1]
+
+        own = self._channels[name]
+        for index in own:
+            if voices[index] is None:
+                return index
+
+        # Steal the lowest priority, oldest voice among lower priority ones and our own category's
+        candidates = [
+            (voice[1], voice[2], i)
+            for i, voice in enumerate(voices)
+            if voice is not None and (voice[1] < category.priority or (voice[1] == category.priority and i in own))
+        ]
+        if not candidates:
+            return None
+        return min(candidates)[2]
+
+    def play(self, sound: pygame.mixer.Sound, name: str) -> Optional[pygame.mixer.Channel]:
+        """Play a sound as part of a category.
+
+        Args:
+            sound (pygame.mixer.Sound): The sound to play
+            name (str): The sound's category
+
+        Returns:
+            Optional[pygame.mixer.Channel]: The channel playing the sound, or None if it was dropped
+        """
+        if not self._voices:
+            return None
+        category = self.categories[name]
+        index = self._pick_channel(sound, name, category)
+        if index is None:
+            self.dropped += 1
+            return None
+        if self._playing(index) is not None:
+            self.stolen += 1
+
+        channel = pygame.mixer.Channel(index)
+        channel.play(sound)
+        self._plays += 1
+        self._voices[index] = (sound, category.priority, self._plays)
+        return channel
@@ -0,0 +1,123 @@
+"""Power saving for Alien Invasion's main loop.
+
+Simulating and drawing at full frame rate is wasted work whenever the player
+is not playing. The game is idle when:
+
+- The window is minimized, hidden or has lost focus; a game in progress is
+  paused automatically
+- The game is paused
+- The Play button, the controls screen or the gamepad configuration is shown
+
+While idle, the main loop sleeps in pygame.event.wait() instead of
+Clock.tick(), so it wakes the moment input arrives and otherwise only
+idle_frame_rate times a second. It draws a frame only when something may
+have changed (an event arrived, the window was resized or the game just went
+idle), and never while the window cannot be seen.
+
+The one thing that moves on its own while idle is the star field of the title
+screen. While it is shown, every idle wake draws a frame, and frame_steps
+scales the stars' motion by the time slept, so they keep their speed at the
+lower frame rate instead of freezing.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pygame
+
+if TYPE_CHECKING:
+    from src.game import Game
+
+# Window events after which the window can no longer be seen, or can be seen again
+HIDING_EVENTS = (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN)
+SHOWING_EVENTS = (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWMAXIMIZED)
+
+
+class PowerSaver:
+    """Tracks the window and game state to decide when the main loop may idle.
+
+    Attributes:
+        window_visible (bool): False while the window is minimized or hidden
+        window_focused (bool): False while another window has the input focus
+        needs_present (bool): Whether the next idle frame must be drawn
+        frame_steps (float): Frames' worth of star motion the next drawn frame makes
+    """
+
+    def __init__(self) -> None:
+        self.window_visible = True
+        self.window_focused = True
+        self.needs_present = True
+        self.frame_steps = 1.0
+
+    def handle_event(self, event: pygame.event.Event, game: Game) -> None:
+        """Follow window visibility and focus, pausing the game when the player leaves it.
+
+        Args:
+            event: Pygame event
+            game: Game object
+        """
+        # Any input may change what is on screen
+        self.needs_present = True
+        if event.type in HIDING_EVENTS:
+            self.window_visible = False
+        elif event.type in SHOWING_EVENTS:
+            self.window_visible = True
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            self.window_focused = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.window_focused = True
+        else:
+            return
+
+        leaving = not self.window_visible or not self.window_focused
+        if leaving and game.statistics.game_active and not game.statistics.game_paused:
+            # Pause like the P key does; the player resumes when they come back
+            game.statistics.game_paused = True
+            game.music.pause()
+
+    def is_idle(self, game: Game) -> bool:
+        """Return True if the player is away, paused or in a menu, so the loop may sleep."""
+        if not game.ai_configuration.power_saving:
+            return False
+        statistics = game.statistics
+        away = not self.window_visible or not self.window_focused
+        in_menu = not statistics.game_active or statistics.show_controls or statistics.show_gamepad_config
+        return away or in_menu or statistics.game_paused
+
+    def animates_stars(self, game: Game) -> bool:
+        """Return True if the title screen's star field is shown and scrolling, so idle frames must be drawn."""
+        configuration = game.ai_configuration
+        statistics = game.statistics
+        if not configuration.use_stars or not configuration.use_gradient_background or not self.window_focused:
+            return False
+        return not statistics.game_active and not statistics.game_over and not statistics.game_paused
+
+    def wait_for_event(self, game: Game) -> None:
+        """Sleep until an event arrives or one idle frame passes, leaving the event to be handled."""
+        event = pygame.event.wait(1000 // game.ai_configuration.idle_frame_rate)
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+
+    def set_frame_time(self, game: Game, frame_ms: int) -> None:
+        """Scale the next frame's star motion to the time since the last frame, up to one idle frame."""
+        configuration = game.ai_configuration
+        longest = configuration.frame_rate / configuration.idle_frame_rate
+        self.frame_steps = min(frame_ms * configuration.frame_rate / 1000, longest)
+
+    def request_present(self) -> None:
+        """Draw the next frame even if the game is idle, e.g. after a resize."""
+        self.needs_present = True
+
+    def should_present(self, game: Game) -> bool:
+        """Return True if this frame must be drawn and shown."""
+        if not game.ai_configuration.power_saving:
+            return True
+        if not self.window_visible:
+            return False
+        if self.is_idle(game):
+            present, self.needs_present = self.needs_present, False
+            return present or self.animates_stars(game)
+        # The first idle frame shows the state the game went idle in
+        self.needs_present = True
+        return True
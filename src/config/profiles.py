@@ -0,0 +1,106 @@
+"""Performance profiles for Alien Invasion.
+
+A profile is a named set of configuration values trading visual effects for
+speed, from "low" for old integrated graphics to "ultra" for fast machines.
+Configuration.load() applies the player's profile before their own settings,
+so a settings file or environment variable can still override any value.
+
+On first launch no profile is chosen yet. detect_profile() then draws a few
+frames of the full-effects scene on an off-screen surface (the window is not
+open yet) and picks the richest profile the machine draws fast enough.
+"""
+
+import random
+import time
+from typing import Any, Dict, Tuple
+
+import pygame
+
+DEFAULT_PROFILE = "high"
+
+# Configuration values of each profile, from the cheapest to the richest
+PERFORMANCE_PROFILES: Dict[str, Dict[str, Any]] = {
+    "low": {
+        "frame_rate": 30,
+        "use_gradient_background": False,
+        "use_stars": False,
+        "star_count": 0,
+        "precise_collisions": False,
+        "audio_buffer_size": 1024,
+    },
+    "medium": {
+        "frame_rate": 60,
+        "use_gradient_background": True,
+        "use_stars": True,
+        "star_count": 75,
+        "precise_collisions": False,
+        "audio_buffer_size": 1024,
+    },
+    "high": {
+        "frame_rate": 60,
+        "use_gradient_background": True,
+        "use_stars": True,
+        "star_count": 150,
+        "precise_collisions": False,
+        "audio_buffer_size": 512,
+    },
+    "ultra": {
+        "frame_rate": 120,
+        "use_gradient_background": True,
+        "use_stars": True,
+        "star_count": 300,
+        "precise_collisions": True,
+        "audio_buffer_size": 256,
+    },
+}
+
+# Slowest benchmark frame, in milliseconds, for which each profile is picked. Drawing must
+# fit well inside the profile's frame budget, leaving room for game logic and the display.
+PROFILE_FRAME_MS: Dict[str, float] = {"ultra": 1.5, "high": 4.0, "medium": 8.0}
+
+
+def measure_frame_ms(frames: int = 20, size: Tuple[int, int] = (1280, 720)) -> float:
+    """Return the mean time, in milliseconds, to draw a frame of the full-effects scene off screen.
+
+    The scene blits a full-screen background, draws the ultra profile's stars
+    and blits a fleet of alien-sized sprites, which is where a frame's drawing
+    time goes in game.
+
+    Args:
+        frames (int): Number of frames to draw
+        size (Tuple[int, int]): Size of the off-screen surface, in pixels
+    """
+    width, height = size
+    screen = pygame.Surface(size)
+    background = pygame.Surface(size)
+    for y in range(height):
+        pygame.draw.line(background, (5 + 35 * y // height, 5, 30 + 30 * y // height), (0, y), (width, y))
+    sprite = pygame.Surface((width // 20, height // 20), pygame.SRCALPHA)
+    sprite.fill((0, 255, 0, 200))
+    generator = random.Random(0)
+    stars = [
+        (generator.randrange(width), generator.randrange(height)) for _ in range(PERFORMANCE_PROFILES["ultra"]["star_count"])
+    ]
+    fleet = [(x, y) for y in range(0, height // 2, height // 10) for x in range(0, width, width // 12)]
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.blit(background, (0, 0))
+        for star in stars:
+            pygame.draw.circle(screen, (255, 255, 255), star, 2)
+        screen.blits([(sprite, position) for position in fleet], doreturn=False)
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def select_profile(frame_ms: float) -> str:
+    """Return the richest profile whose frame budget fits a measured frame time."""
+    for name, slowest_ms in PROFILE_FRAME_MS.items():
+        if frame_ms <= slowest_ms:
+            return name
+    return "low"
+
+
+def detect_profile() -> str:
+    """Measure this machine with a short off-screen benchmark and return the profile that suits it."""
+    pygame.init()
+    return select_profile(measure_frame_ms())
@@ -19,7 +19,9 @@ from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import pygame
 
-from src.config.actors.game_actors import create_fleet
+from src.config.actors.game_actors import clear_fleet, create_fleet
+from src.core.entity_store import fill_system
+from src.core.memory_registry import track
 from src.entities.bullet import Bullet
 
 if TYPE_CHECKING:
@@ -48,7 +50,7 @@ def create_gradient_surface(screen: pygame.Surface, top_color: tuple, bottom_col
         color = [int(top_color[i] + (bottom_color[i] - top_color[i]) * ratio) for i in range(3)]
         pygame.draw.line(gradient, color, (0, y), (current_size[0], y))
 
-    cached_gradient = gradient
+    cached_gradient = track("game_rendering", "gradient", gradient)
     last_screen_size = current_size
 
     return gradient
@@ -58,22 +60,26 @@ def update_stars(game: Game) -> None:
     """Updates and draws the stars"""
     global stars
 
-    if not stars:
-        for _ in range(game.ai_configuration.star_count):
-            x = random.randint(0, game.ai_configuration.screen_width)
-            y = random.randint(0, game.ai_configuration.screen_height)
-            size = random.randint(1, 3)
-            speed = random.uniform(0.1, 0.5)
-            stars.append([x, y, size, speed])
+    # The star count can change while playing (see quality_governor), so only missing stars are created
+    star_count = game.ai_configuration.star_count
+    while len(stars) < star_count:
+        x = random.randint(0, game.ai_configuration.screen_width)
+        y = random.randint(0, game.ai_configuration.screen_height)
+        size = random.randint(1, 3)
+        speed = random.uniform(0.1, 0.5)
+        stars.append([x, y, size, speed])
+    shown = stars[:star_count]
 
     if not game.statistics.game_paused and not game.statistics.game_over:
-        for star in stars:
-            star[1] += star[3]  # Move the star downward
+        # Idle frames are further apart, so the stars move further per frame (see power_saver)
+        steps = game.power_saver.frame_steps
+        for star in shown:
+            star[1] += star[3] * steps  # Move the star downward
             if star[1] > game.ai_configuration.screen_height:
                 star[1] = 0
                 star[0] = random.randint(0, game.ai_configuration.screen_width)
 
-    for star_x, star_y, star_size, _ in stars:
+    for star_x, star_y, star_size, _ in shown:
         x_int: int = int(star_x)
         y_int: int = int(star_y)
         size_int: int = int(star_size)
@@ -97,10 +103,12 @@ def check_play_button(
         game.scoreboard.prep_high_score()
         game.scoreboard.prep_level()
         game.scoreboard.prep_ships()
-        game.aliens.empty()
+        clear_fleet(game)
         game.bullets.empty()
         create_fleet(game)
         game.ship.center_ship()
+        # The previous game's game over sound is idle now; free it if sounds are over budget
+        game.resource_manager.unload_idle_sounds()
 
 
 def draw_fps_counter(game: Game) -> None:
@@ -129,8 +137,7 @@ def update_screen(game: Game) -> None:
     else:
         game.screen.fill(game.ai_configuration.bg_color)
 
-    for bullet in game.bullets.sprites():
-        bullet.draw_bullet()
+    fill_system(game.bullets.archetype, game.screen, game.ai_configuration.bullet_color)
     game.ship.blitme()
     game.aliens.draw(game.screen)
 
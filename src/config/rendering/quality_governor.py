@@ -0,0 +1,96 @@
+"""Quality governor for Alien Invasion.
+
+Holds the frame rate on weak hardware by trading visual effects for time.
+The governor keeps a rolling window of measured frame times (the work done
+in a frame, without the time the clock sleeps) and compares its mean to the
+frame budget of the configured frame rate:
+
+- Over budget, it takes the next step down: half the stars, no stars, a flat
+  background instead of the gradient, then an opaque HUD
+- Under HEADROOM of the budget, it undoes the last step taken
+
+The gap between the two thresholds, and starting a fresh window after every
+change, keep the governor from flipping a feature on and off every second.
+Steps that would not change the configured value (stars already off in the
+low profile, for instance) are skipped. Every change is logged.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Tuple
+
+from src.config.configuration import Configuration
+
+if TYPE_CHECKING:
+    from src.game import Game
+
+logger = logging.getLogger(__name__)
+
+# Steps taken in order while frames are over budget: (description, setting, degraded value from the configured one)
+QUALITY_STEPS: Tuple[Tuple[str, str, Callable[[Any], Any]], ...] = (
+    ("half the stars", "star_count", lambda count: count // 2),
+    ("no stars", "use_stars", lambda _: False),
+    ("flat background", "use_gradient_background", lambda _: False),
+    ("opaque HUD", "hud_translucency", lambda _: False),
+)
+
+# Frames measured before each decision
+WINDOW_FRAMES = 60
+# A step is undone once the mean frame time falls below this share of the budget
+HEADROOM = 0.6
+
+
+class QualityGovernor:
+    """Steps expensive rendering features down and up to keep frames within budget.
+
+    Args:
+        configuration (Configuration): Game configuration; its current values are the full quality
+
+    Attributes:
+        level (int): Number of steps currently taken down from full quality
+    """
+
+    def __init__(self, configuration: Configuration) -> None:
+        self.configuration = configuration
+        self.budget_ms = 1000 / configuration.frame_rate
+        self.level = 0
+        # Configured value of each setting the steps change
+        self.baseline: Dict[str, Any] = {setting: getattr(configuration, setting) for _, setting, _ in QUALITY_STEPS}
+        self.steps: List[Tuple[str, str, Any]] = [
+            (description, setting, degrade(self.baseline[setting]))
+            for description, setting, degrade in QUALITY_STEPS
+            if degrade(self.baseline[setting]) != self.baseline[setting]
+        ]
+        self.frame_times: Deque[float] = deque(maxlen=WINDOW_FRAMES)
+
+    def record(self, game: Game, frame_ms: float) -> None:
+        """Add a frame's time and step quality down or up once a full window is over or under budget.
+
+        Args:
+            game: Game object, whose HUD is rendered again when its translucency changes
+            frame_ms (float): Time spent on the frame, in milliseconds, without the clock's sleep
+        """
+        self.frame_times.append(frame_ms)
+        if len(self.frame_times) < WINDOW_FRAMES:
+            return
+        mean_ms = sum(self.frame_times) / len(self.frame_times)
+        if mean_ms > self.budget_ms and self.level < len(self.steps):
+            description, setting, value = self.steps[self.level]
+            self.level += 1
+            change = f"quality down to level {self.level}: {description}"
+        elif mean_ms < self.budget_ms * HEADROOM and self.level > 0:
+            self.level -= 1
+            description, setting, _ = self.steps[self.level]
+            value = self.baseline[setting]
+            change = f"quality up to level {self.level}: undo {description}"
+        else:
+            return
+
+        setattr(self.configuration, setting, value)
+        if setting == "hud_translucency":
+            game.scoreboard.invalidate_text()
+        logger.info(f"Mean frame time {mean_ms:.1f} ms against a {self.budget_ms:.1f} ms budget, {change}")
+        # Judge the new quality level on frames drawn with it only
+        self.frame_times.clear()
@@ -0,0 +1,151 @@
+"""Packed asset archive for frozen builds.
+
+Frozen builds ship images, sounds and translations as a single indexed
+archive instead of hundreds of loose files. The archive is memory-mapped
+once, and each asset is handed out as a memoryview slice of the mapping, so
+looking up an asset never touches the file system again. When no archive is
+present (development checkouts), callers fall back to the loose files.
+
+Archive layout:
+    MAGIC (8 bytes) | index length (uint32, little endian) | index (UTF-8 JSON) | data
+
+The index maps each asset's relative path (``src/assets/...``, forward
+slashes) to an ``[offset, length]`` pair relative to the start of the data.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Iterator, Mapping, Optional, Tuple, Union
+
+from src.core.path_utils import resource_path
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_NAME = "assets.pak"
+MAGIC = b"AIPAK\x00\x01\x00"
+_HEADER = struct.Struct("<8sI")
+
+
+def normalize_asset_name(relative_path: Union[str, Path]) -> str:
+    """Return the archive key for a relative asset path."""
+    return Path(relative_path).as_posix()
+
+
+class AssetArchive:
+    """Read-only, memory-mapped view of a packed asset archive.
+
+    Args:
+        path (Union[str, Path]): Path to the archive file
+
+    Raises:
+        ValueError: If the file is not a valid asset archive.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = str(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        if len(self._view) < _HEADER.size:
+            self.close()
+            raise ValueError(f"Asset archive is truncated: {self.path}")
+        magic, index_length = _HEADER.unpack_from(self._view)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Not an asset archive: {self.path}")
+
+        index_start = _HEADER.size
+        self._data_start = index_start + index_length
+        raw_index = json.loads(bytes(self._view[index_start : self._data_start]).decode("utf-8"))
+        self._index: Dict[str, Tuple[int, int]] = {name: (offset, length) for name, (offset, length) in raw_index.items()}
+
+    def __contains__(self, relative_path: object) -> bool:
+        return isinstance(relative_path, (str, Path)) and normalize_asset_name(relative_path) in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def names(self, prefix: str = "") -> Iterator[str]:
+        """Iterate over the asset names, optionally limited to a directory prefix."""
+        return (name for name in self._index if name.startswith(prefix))
+
+    def read(self, relative_path: Union[str, Path]) -> Optional[memoryview]:
+        """Return a zero-copy view of an asset's bytes, or None if it is not packed."""
+        entry = self._index.get(normalize_asset_name(relative_path))
+        if entry is None:
+            return None
+        offset, length = entry
+        start = self._data_start + offset
+        return self._view[start : start + length]
+
+    def close(self) -> None:
+        """Release the memory mapping."""
+        self._view.release()
+        self._mmap.close()
+
+
+def write_asset_archive(output_path: Union[str, Path], files: Mapping[str, Union[str, Path]]) -> int:
+    """Pack files into an asset archive.
+
+    Entries are written in sorted order so the same inputs always produce
+    the same archive.
+
+    Args:
+        output_path (Union[str, Path]): Where to write the archive
+        files (Mapping[str, Union[str, Path]]): Maps asset names (relative paths) to source files
+
+    Returns:
+        int: Size of the written archive in bytes
+    """
+    index: Dict[str, Tuple[int, int]] = {}
+    blobs = []
+    offset = 0
+    for name in sorted(files):
+        with open(files[name], "rb") as f:
+            blob = f.read()
+        index[normalize_asset_name(name)] = (offset, len(blob))
+        blobs.append(blob)
+        offset += len(blob)
+
+    index_bytes = json.dumps(index, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(index_bytes)))
+        f.write(index_bytes)
+        for blob in blobs:
+            f.write(blob)
+    return _HEADER.size + len(index_bytes) + offset
+
+
+_archive: Optional[AssetArchive] = None
+_archive_checked = False
+
+
+def get_asset_archive() -> Optional[AssetArchive]:
+    """Return the bundled asset archive, or None when running from loose files.
+
+    The archive is looked up and mapped only once per process.
+    """
+    global _archive, _archive_checked
+    if not _archive_checked:
+        _archive_checked = True
+        archive_path = resource_path(ARCHIVE_NAME)
+        if os.path.isfile(archive_path):
+            try:
+                _archive = AssetArchive(archive_path)
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to open asset archive {archive_path}: {e}")
+    return _archive
+
+
+def open_asset(relative_path: Union[str, Path]) -> Optional[memoryview]:
+    """Return a packed asset's bytes, or None if it must be read from a loose file."""
+    archive = get_asset_archive()
+    if archive is None:
+        return None
+    return archive.read(relative_path)
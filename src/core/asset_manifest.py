@@ -0,0 +1,26 @@
+"""Asset manifest for Alien Invasion.
+
+Declares the images and sounds that are decoded in the background at startup,
+so gameplay never has to wait on disk access for them. Rarely played sounds
+are listed separately and only decoded when the Music manager asks for them.
+The background music is streamed from disk and never decoded up front.
+"""
+
+from typing import Final, Tuple
+
+# Images used by the window icon, the HUD and the game entities
+IMAGE_ASSETS: Final[Tuple[str, ...]] = (
+    "src/assets/icons/icon.png",
+    "src/assets/images/alien.png",
+    "src/assets/images/ship.png",
+    "src/assets/images/heart.png",
+)
+
+# Sound effects played by the Music manager throughout a game
+SOUND_ASSETS: Final[Tuple[str, ...]] = (
+    "src/assets/sounds/shoot.wav",
+    "src/assets/sounds/explosion.wav",
+)
+
+# Large, rarely played sound effects, decoded on demand by the Music manager
+LAZY_SOUND_ASSETS: Final[Tuple[str, ...]] = ("src/assets/sounds/game_over.wav",)
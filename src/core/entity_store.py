@@ -0,0 +1,374 @@
+"""Archetype-based entity storage for gameplay objects.
+
+Each kind of entity (aliens, bullets) keeps its components in parallel,
+contiguous arrays: position, velocity, bounds, sprite id and an alive flag.
+Systems such as movement and rendering run over those arrays in a single
+loop instead of dispatching a Python method call per sprite.
+
+Positions are stored relative to a per-archetype origin, so moving a whole
+formation is a single add to the origin. Rects are then only brought up to
+date by sync_rects() when something actually tests them; drawing reads the
+arrays directly.
+
+EntityGroup is a pygame Group backed by an Archetype, so the rest of the
+game keeps using the familiar Group API (add, kill, len, iteration,
+spritecollideany) while the hot paths operate on the arrays.
+"""
+
+from array import array
+from itertools import compress
+from operator import add
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pygame
+from pygame.sprite import Group, Sprite
+
+
+class Archetype:
+    """Component arrays for one kind of entity.
+
+    Slots freed by despawned entities are reused by the next spawn, and the
+    arrays are truncated whenever the archetype becomes empty.
+
+    Attributes:
+        x (array): Horizontal position of each entity, relative to origin_x
+        y (array): Vertical position of each entity, relative to origin_y
+        vx (array): Horizontal velocity, in pixels per frame
+        vy (array): Vertical velocity, in pixels per frame
+        prev_x (array): Horizontal position before the last movement_system() step
+        prev_y (array): Vertical position before the last movement_system() step
+        width (array): Width of each entity's bounds
+        height (array): Height of each entity's bounds
+        sprite_id (array): Index into sprites, or -1 for entities without an image
+        alive (bytearray): 1 for slots that hold a live entity, 0 for free slots
+        entities (List[Optional[EntitySprite]]): Sprite façade for each slot
+        sprites (List[pygame.Surface]): Images referenced by sprite_id
+        origin_x (float): Horizontal offset shared by every entity
+        origin_y (float): Vertical offset shared by every entity
+        version (int): Incremented whenever an entity is added, removed or moved on its own,
+            so indexes built over the relative positions know when to rebuild
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.x = array("d")
+        self.y = array("d")
+        self.vx = array("d")
+        self.vy = array("d")
+        self.prev_x = array("d")
+        self.prev_y = array("d")
+        self.width = array("i")
+        self.height = array("i")
+        self.sprite_id = array("i")
+        self.alive = bytearray()
+        self.entities: List[Optional["EntitySprite"]] = []
+        self.sprites: List[pygame.Surface] = []
+        self._sprite_ids: Dict[int, int] = {}
+        self.origin_x = 0.0
+        self.origin_y = 0.0
+        # False once the origin moved and the entities' rects no longer match the arrays
+        self.rects_synced = True
+        # Bounds relative to the origin, cached until an entity is added, removed or moved on its own
+        self._bounds: Optional[Tuple[float, float, float, float]] = None
+        self.version = 0
+        self._free: List[int] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def indices(self) -> Iterable[int]:
+        """Return the slot indices of every live entity."""
+        return compress(range(len(self.alive)), self.alive)
+
+    def bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """Return the (left, top, right, bottom) of all live entities, or None when empty.
+
+        The bounds are computed relative to the origin and cached, so translating
+        the archetype does not require another pass over the arrays.
+        """
+        if not self._count:
+            return None
+        if self._bounds is None:
+            alive = self.alive
+            self._bounds = (
+                min(compress(self.x, alive)),
+                min(compress(self.y, alive)),
+                max(map(add, compress(self.x, alive), compress(self.width, alive))),
+                max(map(add, compress(self.y, alive), compress(self.height, alive))),
+            )
+        left, top, right, bottom = self._bounds
+        return left + self.origin_x, top + self.origin_y, right + self.origin_x, bottom + self.origin_y
+
+    def invalidate_bounds(self) -> None:
+        """Forget the cached bounds after an entity moved or resized on its own."""
+        self._bounds = None
+        self.version += 1
+
+    def register_sprite(self, image: Optional[pygame.Surface]) -> int:
+        """Return the sprite id of an image, adding it to the sprite table on first use."""
+        if image is None:
+            return -1
+        sprite_id = self._sprite_ids.get(id(image))
+        if sprite_id is None:
+            sprite_id = self._sprite_ids[id(image)] = len(self.sprites)
+            self.sprites.append(image)
+        return sprite_id
+
+    def spawn(
+        self,
+        entity: "EntitySprite",
+        position: Tuple[float, float],
+        velocity: Tuple[float, float],
+        size: Tuple[int, int],
+        image: Optional[pygame.Surface] = None,
+    ) -> int:
+        """Store the components of a new entity at a screen position and return its slot index."""
+        sprite_id = self.register_sprite(image)
+        position = (position[0] - self.origin_x, position[1] - self.origin_y)
+        if self._free:
+            index = self._free.pop()
+            self.x[index], self.y[index] = position
+            self.prev_x[index], self.prev_y[index] = position
+            self.vx[index], self.vy[index] = velocity
+            self.width[index], self.height[index] = size
+            self.sprite_id[index] = sprite_id
+            self.alive[index] = 1
+            self.entities[index] = entity
+        else:
+            index = len(self.alive)
+            self.x.append(position[0])
+            self.y.append(position[1])
+            self.vx.append(velocity[0])
+            self.vy.append(velocity[1])
+            self.prev_x.append(position[0])
+            self.prev_y.append(position[1])
+            self.width.append(size[0])
+            self.height.append(size[1])
+            self.sprite_id.append(sprite_id)
+            self.alive.append(1)
+            self.entities.append(entity)
+        self._count += 1
+        self.invalidate_bounds()
+        return index
+
+    def despawn(self, index: int) -> None:
+        """Free the slot of an entity."""
+        self.alive[index] = 0
+        self.entities[index] = None
+        self._count -= 1
+        self.invalidate_bounds()
+        if self._count == 0:
+            self.clear()
+        else:
+            self._free.append(index)
+
+    def clear(self) -> None:
+        """Drop every slot and the sprite table, and reset the origin."""
+        components: List["array[Any]"] = [
+            self.x,
+            self.y,
+            self.vx,
+            self.vy,
+            self.prev_x,
+            self.prev_y,
+            self.width,
+            self.height,
+            self.sprite_id,
+        ]
+        for component in components:
+            del component[:]
+        self.alive.clear()
+        self.entities.clear()
+        self.sprites.clear()
+        self._sprite_ids.clear()
+        self._free.clear()
+        self._count = 0
+        self.origin_x = 0.0
+        self.origin_y = 0.0
+        self.rects_synced = True
+        self.invalidate_bounds()
+
+
+class EntitySprite(Sprite):
+    """Base class for sprites whose position can live in an Archetype.
+
+    While the sprite belongs to an EntityGroup, x and y read and write the
+    archetype's arrays, offset by the archetype's origin. Outside of one they are plain attributes, so a sprite
+    keeps working on its own and in ordinary pygame Groups.
+    """
+
+    __slots__ = ("_archetype", "_index", "_x", "_y")
+
+    # Sprites without an image, like bullets, are drawn with fill_system()
+    image: Optional[pygame.Surface] = None
+    rect: pygame.Rect
+
+    def __init__(self, *groups: Any) -> None:
+        self._archetype: Optional[Archetype] = None
+        self._index = -1
+        self._x = 0.0
+        self._y = 0.0
+        super().__init__(*groups)
+
+    @property
+    def x(self) -> float:
+        """Exact horizontal position."""
+        archetype = self._archetype
+        return self._x if archetype is None else archetype.x[self._index] + archetype.origin_x
+
+    @x.setter
+    def x(self, value: float) -> None:
+        archetype = self._archetype
+        if archetype is None:
+            self._x = value
+        else:
+            archetype.x[self._index] = value - archetype.origin_x
+            archetype.rects_synced = False
+            archetype.invalidate_bounds()
+
+    @property
+    def y(self) -> float:
+        """Exact vertical position."""
+        archetype = self._archetype
+        return self._y if archetype is None else archetype.y[self._index] + archetype.origin_y
+
+    @y.setter
+    def y(self, value: float) -> None:
+        archetype = self._archetype
+        if archetype is None:
+            self._y = value
+        else:
+            archetype.y[self._index] = value - archetype.origin_y
+            archetype.rects_synced = False
+            archetype.invalidate_bounds()
+
+    def velocity(self) -> Tuple[float, float]:
+        """Return the sprite's own velocity in pixels per frame."""
+        return 0.0, 0.0
+
+    def attach(self, archetype: Archetype) -> None:
+        """Move the sprite's components into an archetype."""
+        if self._archetype is not None:
+            raise ValueError(f"{type(self).__name__} already belongs to the '{self._archetype.name}' archetype")
+        self._index = archetype.spawn(self, (self._x, self._y), self.velocity(), self.rect.size, self.image)
+        self._archetype = archetype
+
+    def detach(self) -> None:
+        """Copy the sprite's components back out of its archetype."""
+        if self._archetype is None:
+            return
+        self._x = self.x
+        self._y = self.y
+        self._archetype.despawn(self._index)
+        self._archetype = None
+        self._index = -1
+
+    def previous_rect(self) -> pygame.Rect:
+        """Return the sprite's rect at its position before the last movement_system() step."""
+        archetype = self._archetype
+        if archetype is None:
+            return self.rect.copy()
+        return pygame.Rect(
+            int(archetype.prev_x[self._index] + archetype.origin_x),
+            int(archetype.prev_y[self._index] + archetype.origin_y),
+            self.rect.width,
+            self.rect.height,
+        )
+
+    def refresh_components(self) -> None:
+        """Update the stored bounds and sprite id after the image or rect changed."""
+        archetype = self._archetype
+        if archetype is not None:
+            archetype.width[self._index], archetype.height[self._index] = self.rect.size
+            archetype.sprite_id[self._index] = archetype.register_sprite(self.image)
+            archetype.vx[self._index], archetype.vy[self._index] = self.velocity()
+            archetype.invalidate_bounds()
+
+
+class EntityGroup(Group):
+    """A pygame Group whose members store their components in an Archetype."""
+
+    def __init__(self, name: str, *sprites: Any) -> None:
+        self.archetype = Archetype(name)
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: Any, layer: None = None) -> None:
+        sprite.attach(self.archetype)
+        super().add_internal(sprite)
+
+    def remove_internal(self, sprite: Any) -> None:
+        super().remove_internal(sprite)
+        sprite.detach()
+
+    def copy(self) -> Group:  # type: ignore[override]
+        """Return a plain Group with the same sprites.
+
+        A sprite's components live in a single archetype, so the copy is an
+        ordinary Group rather than a second EntityGroup.
+        """
+        return Group(self.sprites())
+
+    def draw(self, surface: pygame.Surface, bgsurf: Any = None, special_flags: int = 0) -> List[pygame.Rect]:
+        """Draw every member from the archetype arrays in one batched blit."""
+        render_system(self.archetype, surface)
+        return []
+
+
+def movement_system(archetype: Archetype, dx: float = 0.0, dy: float = 0.0) -> None:
+    """Advance every entity by its velocity plus a shared (dx, dy) offset and sync its rect.
+
+    The positions before the step are kept in prev_x and prev_y for swept collision tests.
+    """
+    x, y, vx, vy, entities = archetype.x, archetype.y, archetype.vx, archetype.vy, archetype.entities
+    prev_x, prev_y = archetype.prev_x, archetype.prev_y
+    origin_x, origin_y = archetype.origin_x, archetype.origin_y
+    for i in archetype.indices():
+        prev_x[i] = x[i]
+        prev_y[i] = y[i]
+        new_x = x[i] = x[i] + vx[i] + dx
+        new_y = y[i] = y[i] + vy[i] + dy
+        entities[i].rect.topleft = (int(new_x + origin_x), int(new_y + origin_y))  # type: ignore[union-attr]
+    archetype.rects_synced = True
+    archetype.invalidate_bounds()
+
+
+def translate_system(archetype: Archetype, dx: float = 0.0, dy: float = 0.0) -> None:
+    """Move every entity by the same offset in constant time, leaving the rects to sync_rects()."""
+    archetype.origin_x += dx
+    archetype.origin_y += dy
+    archetype.rects_synced = False
+
+
+def sync_rects(archetype: Archetype) -> None:
+    """Bring every entity's rect up to date with its stored position, if the origin moved."""
+    if archetype.rects_synced:
+        return
+    x, y, entities = archetype.x, archetype.y, archetype.entities
+    origin_x, origin_y = archetype.origin_x, archetype.origin_y
+    for i in archetype.indices():
+        entities[i].rect.topleft = (int(x[i] + origin_x), int(y[i] + origin_y))  # type: ignore[union-attr]
+    archetype.rects_synced = True
+
+
+def render_system(archetype: Archetype, surface: pygame.Surface) -> None:
+    """Blit every entity that has an image in a single call, straight from the arrays."""
+    x, y, sprite_id, sprites = archetype.x, archetype.y, archetype.sprite_id, archetype.sprites
+    origin_x, origin_y = archetype.origin_x, archetype.origin_y
+    surface.blits(
+        [
+            (sprites[sprite_id[i]], (int(x[i] + origin_x), int(y[i] + origin_y)))
+            for i in archetype.indices()
+            if sprite_id[i] >= 0
+        ],
+        doreturn=False,
+    )
+
+
+def fill_system(archetype: Archetype, surface: pygame.Surface, color: Tuple[int, int, int]) -> None:
+    """Draw every entity as a solid rectangle of its bounds."""
+    x, y, width, height = archetype.x, archetype.y, archetype.width, archetype.height
+    origin_x, origin_y = archetype.origin_x, archetype.origin_y
+    fill = surface.fill
+    for i in archetype.indices():
+        fill(color, (int(x[i] + origin_x), int(y[i] + origin_y), width[i], height[i]))
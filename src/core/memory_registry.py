@@ -0,0 +1,138 @@
+"""Memory registry for Alien Invasion.
+
+Long-lived surfaces and sounds report their byte size and owner here, so the
+whole footprint of the game's assets and render caches can be inspected in
+one place:
+
+- track() records a single surface or sound under an owner and a name. The
+  registry only keeps a weak reference, so it never keeps an asset alive,
+  and tracking a new asset under the same name replaces the old one. The
+  number of times each name was tracked and its last size are kept after
+  the asset is released, so a surface that is allocated again every frame
+  stands out in the report even though no single one of them lives long.
+- register_source() adds a callback for caches that know their own contents,
+  like the ResourceManager.
+
+memory_report() collects every entry, largest first. Released assets are
+listed but left out of the totals. In game, F3 prints the report to the
+console (see game_controls).
+"""
+
+import weakref
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, TypeVar, Union
+
+import pygame
+
+Asset = Union[pygame.Surface, pygame.mixer.Sound]
+AssetT = TypeVar("AssetT", pygame.Surface, pygame.mixer.Sound)
+MemorySource = Callable[[], Iterable[Tuple[str, int]]]
+
+
+class MemoryRecord(NamedTuple):
+    """One entry of a memory report.
+
+    Attributes:
+        owner (str): Module or class holding the asset
+        name (str): What the asset is, unique per owner
+        size (int): Bytes used by the asset's pixels or samples, when it was last seen
+        allocations (int): Number of times the asset was created, or 1 for cache entries
+        alive (bool): False once the last tracked asset was released
+    """
+
+    owner: str
+    name: str
+    size: int
+    allocations: int
+    alive: bool = True
+
+
+# Tracked assets by (owner, name), how many times each was tracked and its last known size
+_tracked: Dict[Tuple[str, str], "weakref.ref[Asset]"] = {}
+_allocations: Dict[Tuple[str, str], int] = {}
+_last_sizes: Dict[Tuple[str, str], int] = {}
+# Callbacks listing the (name, size) entries of a cache, by owner
+_sources: Dict[str, MemorySource] = {}
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Return the number of bytes used by a surface's pixel buffer."""
+    return surface.get_pitch() * surface.get_height()
+
+
+def sound_bytes(sound: pygame.mixer.Sound) -> int:
+    """Return the number of bytes used by a sound's decoded samples."""
+    # get_init() returns None while the mixer is closed, despite its type hints
+    mixer: Optional[Tuple[int, int, int]] = pygame.mixer.get_init()
+    if not mixer:
+        return len(sound.get_raw())
+    frequency, size, channels = mixer
+    return round(sound.get_length() * frequency) * channels * (abs(size) // 8)
+
+
+def asset_bytes(asset: Asset) -> int:
+    """Return the number of bytes used by a surface or a sound."""
+    if isinstance(asset, pygame.Surface):
+        return surface_bytes(asset)
+    return sound_bytes(asset)
+
+
+def track(owner: str, name: str, asset: AssetT) -> AssetT:
+    """Record a long-lived surface or sound and return it unchanged.
+
+    Args:
+        owner (str): Module or class holding the asset
+        name (str): What the asset is; tracking another asset under the same name replaces it
+        asset: The surface or sound
+
+    Returns:
+        The asset, so creation and tracking can be written as one expression
+    """
+    key = (owner, name)
+    _tracked[key] = weakref.ref(asset)
+    _allocations[key] = _allocations.get(key, 0) + 1
+    _last_sizes[key] = asset_bytes(asset)
+    return asset
+
+
+def register_source(owner: str, source: MemorySource) -> None:
+    """Register a callback listing the (name, size) entries of a cache, replacing any earlier one."""
+    _sources[owner] = source
+
+
+def memory_report() -> List[MemoryRecord]:
+    """Return every tracked asset, released ones included, and every cache entry, largest first."""
+    records: List[MemoryRecord] = []
+    for key, allocations in _allocations.items():
+        asset = _tracked[key]()
+        if asset is not None:
+            _last_sizes[key] = asset_bytes(asset)
+        records.append(MemoryRecord(key[0], key[1], _last_sizes[key], allocations, asset is not None))
+    for owner, source in _sources.items():
+        records.extend(MemoryRecord(owner, name, size, 1) for name, size in source())
+    records.sort(key=lambda record: (-record.size, record.owner, record.name))
+    return records
+
+
+def format_memory_report(records: Optional[List[MemoryRecord]] = None) -> List[str]:
+    """Format a memory report as text lines, with the total held per owner and overall."""
+    if records is None:
+        records = memory_report()
+    lines = [f"{'KiB':>10} {'allocs':>7}  {'owner':<20} name"]
+    for record in records:
+        released = "" if record.alive else " (released)"
+        lines.append(f"{record.size / 1024:>10.1f} {record.allocations:>7}  {record.owner:<20} {record.name}{released}")
+    totals: Dict[str, int] = {}
+    for record in records:
+        if record.alive:
+            totals[record.owner] = totals.get(record.owner, 0) + record.size
+    lines.append("")
+    lines.extend(f"{size / 1024:>10.1f} {'':>7}  {owner:<20} total" for owner, size in sorted(totals.items()))
+    lines.append(f"{sum(totals.values()) / 1024:>10.1f} {'':>7}  {'all':<20} total")
+    return lines
+
+
+def clear_tracked() -> None:
+    """Forget every tracked asset, allocation count and size. Registered sources are kept."""
+    _tracked.clear()
+    _allocations.clear()
+    _last_sizes.clear()
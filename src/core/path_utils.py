@@ -2,8 +2,9 @@ import json
 import logging
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 # Configure logging
 logging.basicConfig(level=logging.WARNING)
@@ -71,6 +72,9 @@ def ensure_data_directory() -> str:
 def resource_path(relative_path: Union[str, Path]) -> str:
     """Gets the correct path to files, whether in development or in a packaged executable.
 
+    Resolved paths are memoized per bundle location, so repeated lookups of the
+    same asset cost a dictionary lookup instead of path normalization.
+
     Args:
         relative_path (Union[str, Path]): The relative path to the resource
 
@@ -82,29 +86,50 @@ def resource_path(relative_path: Union[str, Path]) -> str:
         '/path/to/application/assets/image.png'
     """
     try:
-        if getattr(sys, "frozen", False):
-            if sys.platform == "darwin":
-                if hasattr(sys, "_MEIPASS"):
-                    # Running from a macOS .app bundle with py2app in non-alias mode
-                    base_path = sys._MEIPASS  # type: ignore[attr-defined]
-                else:
-                    # Running from a macOS .app bundle in alias mode
-                    base_path = os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-            else:
-                # Running from a regular frozen executable
-                base_path = sys._MEIPASS  # type: ignore[attr-defined]
-        else:
-            # Running from source
-            base_path = os.path.abspath(".")
-
-        path = os.path.normpath(os.path.join(base_path, str(relative_path)))
-        logger.info(f"Resolved resource path: {path}")
-        return path
+        frozen = bool(getattr(sys, "frozen", False))
+        bundle_dir = getattr(sys, "_MEIPASS", None) if frozen else os.getcwd()
+        return _resolve_resource_path(str(relative_path), frozen, sys.platform, bundle_dir)
     except Exception as e:
         logger.error(f"Error resolving resource path for {relative_path}: {e}")
         return os.path.normpath(os.path.join(os.path.abspath("."), str(relative_path)))
 
 
+@lru_cache(maxsize=None)
+def _resolve_resource_path(relative_path: str, frozen: bool, platform: str, bundle_dir: Optional[str]) -> str:
+    """Resolve a resource path for a given bundle location. Results are memoized by resource_path().
+
+    Only the arguments are read, never sys or the working directory, so a
+    memoized result always matches its cache key.
+    """
+    if frozen:
+        if platform == "darwin":
+            if bundle_dir is not None:
+                # Running from a macOS .app bundle with py2app in non-alias mode
+                base_path = bundle_dir
+            else:
+                # Running from a macOS .app bundle in alias mode
+                base_path = os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+        elif bundle_dir is not None:
+            # Running from a regular frozen executable
+            base_path = bundle_dir
+        else:
+            raise RuntimeError("Frozen executable has no bundle directory")
+    elif bundle_dir is not None:
+        # Running from source, relative to the working directory
+        base_path = bundle_dir
+    else:
+        raise RuntimeError("No working directory to resolve resources from")
+
+    path = os.path.normpath(os.path.join(base_path, relative_path))
+    logger.info(f"Resolved resource path: {path}")
+    return path
+
+
+def clear_resource_path_cache() -> None:
+    """Forget memoized resource paths, e.g. after the bundle location changed."""
+    _resolve_resource_path.cache_clear()
+
+
 def load_json_file(file_path: Union[str, Path], default_value: Any = None) -> Any:
     """Load data from a JSON file.
 
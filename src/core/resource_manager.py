@@ -1,28 +1,154 @@
-from typing import Dict, Optional, Tuple
+import io
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import pygame
 
+from src.core.asset_archive import open_asset
+from src.core.memory_registry import register_source, sound_bytes, surface_bytes
 from src.core.path_utils import resource_path
 
+ScaledKey = Tuple[str, Tuple[int, int]]
+DecodedAsset = Union[pygame.Surface, pygame.mixer.Sound]
+
+
+class PreloadJob:
+    """Tracks a batch of assets being decoded on a background thread pool.
+
+    Worker threads only decode files and store the results on the job itself.
+    Converting surfaces for the display and publishing them to the
+    ResourceManager caches happens on the main thread in
+    ResourceManager.finalize_preload().
+
+    Attributes:
+        total (int): Number of assets in the batch
+        ready (threading.Event): Set once every asset has been decoded or has failed
+        failures (Dict[str, str]): Error message for each asset that failed to load
+    """
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.ready = threading.Event()
+        self.failures: Dict[str, str] = {}
+        self._completed = 0
+        self._decoded: List[Tuple[str, DecodedAsset]] = []
+        self._lock = threading.Lock()
+        if total == 0:
+            self.ready.set()
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the batch that has finished, from 0.0 to 1.0."""
+        with self._lock:
+            return 1.0 if self.total == 0 else self._completed / self.total
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the batch is ready.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait forever.
+
+        Returns:
+            True if every asset has finished, False if the timeout expired first.
+        """
+        return self.ready.wait(timeout)
+
+    def _run(self, full_path: str, decode: Callable[[str], DecodedAsset]) -> None:
+        """Decode a single asset on a worker thread and record the outcome."""
+        try:
+            asset = decode(full_path)
+        except (pygame.error, OSError) as e:
+            with self._lock:
+                self.failures[full_path] = str(e)
+        else:
+            with self._lock:
+                self._decoded.append((full_path, asset))
+        finally:
+            with self._lock:
+                self._completed += 1
+                if self._completed == self.total:
+                    self.ready.set()
+
+    def _take_decoded(self) -> List[Tuple[str, DecodedAsset]]:
+        """Hand over the decoded assets collected so far."""
+        with self._lock:
+            decoded, self._decoded = self._decoded, []
+        return decoded
+
 
 class ResourceManager:
     """Singleton class to manage game resources (images, sounds).
 
     This manager caches loaded resources to avoid redundant disk access
     and optimizes surfaces for faster rendering.
+
+    Base images and sounds are kept for the lifetime of the game. Scaled
+    images live in a separate least-recently-used cache bounded by a byte
+    budget, so switching between window sizes reuses earlier scales without
+    ever reloading the base images from disk.
+
+    Hot paths can register an image once with register_image() and then look
+    it up by integer handle, skipping path resolution on every call.
+
+    Sounds are decoded in the mixer's format, and their byte size is tracked.
+    unload_idle_sounds() drops sounds that have not been played for a while
+    once the sound cache exceeds its own byte budget; they are decoded again
+    on their next use.
+
+    Collision masks are built on demand by get_mask() and cached per surface.
+    A mask is dropped together with its surface, so masks of scaled images
+    follow the scaled image cache.
     """
 
+    # Default byte budget for scaled surfaces (64 MiB)
+    DEFAULT_SCALED_CACHE_BUDGET: int = 64 * 1024 * 1024
+    # Default byte budget for decoded sounds (1 MiB), above which idle sounds are unloaded
+    DEFAULT_SOUND_CACHE_BUDGET: int = 1024 * 1024
+    # Seconds a sound must go unused before it may be unloaded
+    DEFAULT_SOUND_IDLE_SECONDS: float = 10.0
+
     _instance: Optional["ResourceManager"] = None
+    # Image handle registry, shared by all instances: relative and resolved paths, indexed by handle
+    _handle_paths: List[str] = []
+    _handle_full_paths: List[Optional[str]] = []
+    _handle_ids: Dict[str, int] = {}
     _images: Dict[str, pygame.Surface]
-    _scaled_images: Dict[Tuple[str, Tuple[int, int]], pygame.Surface]
+    _scaled_images: "OrderedDict[ScaledKey, pygame.Surface]"
     _sounds: Dict[str, pygame.mixer.Sound]
+    _sound_bytes: Dict[str, int]
+    _sound_used: Dict[str, float]
+    _sound_budget: int
+    _sound_unloads: int
+    _masks: "weakref.WeakKeyDictionary[pygame.Surface, pygame.mask.Mask]"
+    _scaled_budget: int
+    _scaled_bytes: int
+    _scaled_hits: int
+    _scaled_misses: int
+    _scaled_evictions: int
 
     def __new__(cls) -> "ResourceManager":
         if cls._instance is None:
             instance = super().__new__(cls)
             instance._images = {}
-            instance._scaled_images = {}
+            instance._scaled_images = OrderedDict()
             instance._sounds = {}
+            instance._sound_bytes = {}
+            instance._sound_used = {}
+            instance._sound_budget = cls.DEFAULT_SOUND_CACHE_BUDGET
+            instance._sound_unloads = 0
+            instance._masks = weakref.WeakKeyDictionary()
+            instance._scaled_budget = cls.DEFAULT_SCALED_CACHE_BUDGET
+            instance._scaled_bytes = 0
+            instance._scaled_hits = 0
+            instance._scaled_misses = 0
+            instance._scaled_evictions = 0
+            register_source("ResourceManager", instance._memory_entries)
             cls._instance = instance
         return cls._instance
 
@@ -39,37 +165,280 @@ class ResourceManager:
         full_path = resource_path(path)
 
         if scale:
-            cache_key = (full_path, scale)
-            if cache_key in self._scaled_images:
-                return self._scaled_images[cache_key]
+            return self._get_scaled_image(path, full_path, scale)
 
-            base_image = self._get_base_image(full_path)
-            scaled_image = pygame.transform.scale(base_image, scale)
-            self._scaled_images[cache_key] = scaled_image
-            return scaled_image
+        return self._get_base_image(path, full_path)
 
-        return self._get_base_image(full_path)
+    @classmethod
+    def register_image(cls, path: str) -> int:
+        """Register an image path and return its integer handle.
 
-    def _get_base_image(self, full_path: str) -> pygame.Surface:
+        Registering is cheap and idempotent: the same path always maps to the
+        same handle, and the path is only resolved on first use.
+
+        Args:
+            path: Relative path to the image asset.
+
+        Returns:
+            An integer handle for get_image_by_handle().
+        """
+        handle = cls._handle_ids.get(path)
+        if handle is None:
+            handle = len(cls._handle_paths)
+            cls._handle_paths.append(path)
+            cls._handle_full_paths.append(None)
+            cls._handle_ids[path] = handle
+        return handle
+
+    def get_image_by_handle(self, handle: int, scale: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+        """Return a cached image for a handle from register_image().
+
+        Args:
+            handle: Integer handle of a registered image.
+            scale: Optional (width, height) tuple to scale the image.
+
+        Returns:
+            A pygame Surface optimized for the current display.
+        """
+        path = self._handle_paths[handle]
+        full_path = self._handle_full_paths[handle]
+        if full_path is None:
+            full_path = self._handle_full_paths[handle] = resource_path(path)
+
+        if scale:
+            return self._get_scaled_image(path, full_path, scale)
+
+        return self._get_base_image(path, full_path)
+
+    def _get_base_image(self, path: str, full_path: str) -> pygame.Surface:
         """Internal helper to load and optimize base images."""
         if full_path not in self._images:
-            image = pygame.image.load(full_path)
-            if image.get_alpha():
-                image = image.convert_alpha()
-            else:
-                image = image.convert()
-            self._images[full_path] = image
+            self._images[full_path] = self._optimize_image(self._decode_image(path, full_path))
         return self._images[full_path]
 
+    @staticmethod
+    def _decode_image(path: str, full_path: str) -> pygame.Surface:
+        """Decode an image from the packed asset archive, or from its loose file in development."""
+        data = open_asset(path)
+        if data is not None:
+            return pygame.image.load(io.BytesIO(data), os.path.basename(path))
+        return pygame.image.load(full_path)
+
+    @staticmethod
+    def _decode_sound(path: str, full_path: str) -> pygame.mixer.Sound:
+        """Decode a sound from the packed asset archive, or from its loose file in development."""
+        data = open_asset(path)
+        if data is not None:
+            return pygame.mixer.Sound(file=io.BytesIO(data))
+        return pygame.mixer.Sound(full_path)
+
+    @staticmethod
+    def _optimize_image(image: pygame.Surface) -> pygame.Surface:
+        """Convert a decoded image to the display format. Must run on the main thread."""
+        if image.get_alpha():
+            return image.convert_alpha()
+        return image.convert()
+
+    def _get_scaled_image(self, path: str, full_path: str, scale: Tuple[int, int]) -> pygame.Surface:
+        """Internal helper to fetch a scaled image from the LRU cache, scaling it on a miss."""
+        cache_key = (full_path, scale)
+        cached = self._scaled_images.get(cache_key)
+        if cached is not None:
+            self._scaled_images.move_to_end(cache_key)
+            self._scaled_hits += 1
+            return cached
+
+        self._scaled_misses += 1
+        scaled_image = pygame.transform.scale(self._get_base_image(path, full_path), scale)
+        self._scaled_images[cache_key] = scaled_image
+        self._scaled_bytes += surface_bytes(scaled_image)
+        self._evict_scaled_images()
+        return scaled_image
+
+    def get_mask(self, surface: pygame.Surface) -> pygame.mask.Mask:
+        """Return the collision mask of an image, building it on first use.
+
+        Masks are cached for as long as their surface is alive, so an image
+        shared by many sprites only has its mask built once.
+
+        Args:
+            surface: An image returned by this manager.
+
+        Returns:
+            A mask of the surface's opaque pixels.
+        """
+        mask = self._masks.get(surface)
+        if mask is None:
+            mask = self._masks[surface] = pygame.mask.from_surface(surface)
+        return mask
+
+    def _evict_scaled_images(self) -> None:
+        """Drop least recently used scaled images until the cache fits its budget.
+
+        The most recently used entry is always kept, even if it alone exceeds the budget.
+        """
+        while self._scaled_bytes > self._scaled_budget and len(self._scaled_images) > 1:
+            _, surface = self._scaled_images.popitem(last=False)
+            self._scaled_bytes -= surface_bytes(surface)
+            self._scaled_evictions += 1
+
+    def set_scaled_cache_budget(self, budget_bytes: int) -> None:
+        """Set the byte budget for scaled images, evicting entries if needed.
+
+        Args:
+            budget_bytes: Maximum number of bytes held by scaled surfaces.
+        """
+        self._scaled_budget = max(0, budget_bytes)
+        self._evict_scaled_images()
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Return statistics about the cached resources.
+
+        Returns:
+            A dictionary with the number and bytes of base images and sounds,
+            the sound budget and unloads, the number of masks, and the
+            entries, bytes, budget, hits, misses and evictions of the scaled
+            image cache.
+        """
+        return {
+            "images": len(self._images),
+            "image_bytes": sum(surface_bytes(image) for image in self._images.values()),
+            "sounds": len(self._sounds),
+            "sound_bytes": sum(self._sound_bytes.values()),
+            "sound_budget": self._sound_budget,
+            "sound_unloads": self._sound_unloads,
+            "masks": len(self._masks),
+            "scaled_entries": len(self._scaled_images),
+            "scaled_bytes": self._scaled_bytes,
+            "scaled_budget": self._scaled_budget,
+            "scaled_hits": self._scaled_hits,
+            "scaled_misses": self._scaled_misses,
+            "scaled_evictions": self._scaled_evictions,
+        }
+
+    def _memory_entries(self) -> List[Tuple[str, int]]:
+        """List every cached image, scaled image, mask and sound with its size, for the memory registry."""
+        entries = [(f"image {os.path.basename(path)}", surface_bytes(image)) for path, image in self._images.items()]
+        entries.extend(
+            (f"scaled {os.path.basename(path)} {width}x{height}", surface_bytes(image))
+            for (path, (width, height)), image in self._scaled_images.items()
+        )
+        for mask in self._masks.values():
+            # A mask stores one bit per pixel
+            width, height = mask.get_size()
+            entries.append((f"mask {width}x{height}", width * height // 8))
+        entries.extend((f"sound {os.path.basename(path)}", size) for path, size in self._sound_bytes.items())
+        return entries
+
     def get_sound(self, path: str) -> pygame.mixer.Sound:
-        """Load and cache a sound effect."""
+        """Load and cache a sound effect, marking it as recently used."""
         full_path = resource_path(path)
+        sound = self._sounds.get(full_path)
+        if sound is None:
+            sound = self._store_sound(full_path, self._decode_sound(path, full_path))
+        self._sound_used[full_path] = time.monotonic()
+        return sound
+
+    def _store_sound(self, full_path: str, sound: pygame.mixer.Sound) -> pygame.mixer.Sound:
+        """Add a decoded sound to the cache, recording its size, unless it is already cached."""
         if full_path not in self._sounds:
-            self._sounds[full_path] = pygame.mixer.Sound(full_path)
+            self._sounds[full_path] = sound
+            self._sound_bytes[full_path] = sound_bytes(sound)
+            self._sound_used[full_path] = time.monotonic()
         return self._sounds[full_path]
 
+    def set_sound_cache_budget(self, budget_bytes: int) -> None:
+        """Set the byte budget above which unload_idle_sounds() drops idle sounds.
+
+        Args:
+            budget_bytes: Number of bytes of decoded sounds to keep regardless of use.
+        """
+        self._sound_budget = max(0, budget_bytes)
+
+    def unload_idle_sounds(self, idle_seconds: float = DEFAULT_SOUND_IDLE_SECONDS) -> int:
+        """Unload the least recently used idle sounds until the sound cache fits its budget.
+
+        Sounds that are playing, or were used within idle_seconds, are kept.
+
+        Args:
+            idle_seconds: Seconds a sound must have gone unused to be unloaded.
+
+        Returns:
+            The number of bytes freed.
+        """
+        total = sum(self._sound_bytes.values())
+        cutoff = time.monotonic() - idle_seconds
+        freed = 0
+        for full_path in sorted(self._sounds, key=self._sound_used.__getitem__):
+            if total - freed <= self._sound_budget or self._sound_used[full_path] > cutoff:
+                break
+            if self._sounds[full_path].get_num_channels():
+                continue
+            del self._sounds[full_path], self._sound_used[full_path]
+            freed += self._sound_bytes.pop(full_path)
+            self._sound_unloads += 1
+        return freed
+
+    def preload(self, images: Iterable[str] = (), sounds: Iterable[str] = (), max_workers: int = 4) -> PreloadJob:
+        """Start decoding a set of assets on a background thread pool.
+
+        Assets that are already cached are skipped. Sounds are only preloaded
+        when the mixer is initialized. Call finalize_preload() on the main
+        thread once the returned job is ready to publish the results.
+
+        Args:
+            images: Relative paths of the images to decode.
+            sounds: Relative paths of the sounds to decode.
+            max_workers: Maximum number of worker threads.
+
+        Returns:
+            A PreloadJob reporting progress and readiness.
+        """
+        tasks: List[Tuple[str, Callable[[str], DecodedAsset]]] = []
+        for path in images:
+            full_path = resource_path(path)
+            if full_path not in self._images:
+                tasks.append((full_path, partial(self._decode_image, path)))
+        if pygame.mixer.get_init():
+            for path in sounds:
+                full_path = resource_path(path)
+                if full_path not in self._sounds:
+                    tasks.append((full_path, partial(self._decode_sound, path)))
+
+        job = PreloadJob(len(tasks))
+        if tasks:
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="asset-preload")
+            for full_path, decode in tasks:
+                executor.submit(job._run, full_path, decode)
+            executor.shutdown(wait=False)
+        return job
+
+    def finalize_preload(self, job: PreloadJob) -> None:
+        """Wait for a preload job and publish its assets to the caches.
+
+        Images are converted to the display format here, so this must be
+        called from the main thread after the display mode has been set.
+
+        Args:
+            job: The job returned by preload().
+        """
+        job.wait()
+        for full_path, asset in job._take_decoded():
+            if isinstance(asset, pygame.Surface):
+                self._images.setdefault(full_path, self._optimize_image(asset))
+            else:
+                self._store_sound(full_path, asset)
+
+    def clear_scaled_cache(self) -> None:
+        """Clear only the scaled images, keeping base images and sounds loaded."""
+        self._scaled_images.clear()
+        self._scaled_bytes = 0
+        self._masks.clear()
+
     def clear_cache(self) -> None:
         """Clear all cached resources."""
         self._images.clear()
-        self._scaled_images.clear()
         self._sounds.clear()
+        self._sound_bytes.clear()
+        self._sound_used.clear()
+        self.clear_scaled_cache()
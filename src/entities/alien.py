@@ -1,32 +1,91 @@
+from typing import List, Optional
+
 import pygame
-from pygame.sprite import Sprite
 
 from src.config.configuration import Configuration
 from src.config.music.music import Music
+from src.core.entity_store import EntitySprite
 from src.core.resource_manager import ResourceManager
 
-
-class Alien(Sprite):
-    """Serves to represent a single alien in the fleet"""
-
-    def __init__(self, ai_configuration: Configuration, screen: pygame.Surface) -> None:
-        """Initializes the alien and sets its initial position"""
+# Registered once at import so every alien skips path resolution
+ALIEN_IMAGE = ResourceManager.register_image("src/assets/images/alien.png")
+
+
+def get_alien_image(ai_configuration: Configuration) -> pygame.Surface:
+    """Return the alien image scaled for the current screen resolution."""
+    resource_manager = ResourceManager()
+    scale_factor = min(ai_configuration.screen_width / 1280, ai_configuration.screen_height / 720)
+    original_size = resource_manager.get_image_by_handle(ALIEN_IMAGE).get_size()
+    new_size = (int(original_size[0] * scale_factor), int(original_size[1] * scale_factor))
+    return resource_manager.get_image_by_handle(ALIEN_IMAGE, scale=new_size)
+
+
+class Alien(EntitySprite):
+    """Serves to represent a single alien in the fleet.
+
+    Only per-alien state lives on the instance, in slots. The screen,
+    configuration and sound manager are the same for the whole fleet and are
+    stored once on the class by bind(), which the game calls when it creates
+    or resizes its screen. Aliens must only be created once bind() was called.
+    """
+
+    __slots__ = ("image", "rect", "in_pool")
+
+    image: pygame.Surface
+
+    # Fleet-wide state shared by every alien, set by bind()
+    screen: pygame.Surface
+    ai_configuration: Configuration
+    music: Music
+
+    # Class variable to store aliens that can be reused by the next fleet
+    _alien_pool: List["Alien"] = []
+    _max_pool_size: int = 200  # Maximum number of aliens to keep in the pool
+
+    @classmethod
+    def get_alien(cls, image: Optional[pygame.Surface] = None) -> "Alien":
+        """Get an alien from the pool or create a new one if the pool is empty"""
+        if cls._alien_pool:
+            alien = cls._alien_pool.pop()
+            alien.in_pool = False
+            alien.reset(image)
+            return alien
+        return cls(image)
+
+    @classmethod
+    def bind(cls, ai_configuration: Configuration, screen: pygame.Surface, music: Music) -> None:
+        """Set the screen, configuration and sound manager shared by every alien.
+
+        The game passes its own Music, so binding never opens the mixer before
+        the game has configured it.
+        """
+        cls.ai_configuration = ai_configuration
+        cls.screen = screen
+        cls.music = music
+
+    @classmethod
+    def return_to_pool(cls, alien: "Alien") -> None:
+        """Return an alien to the pool.
+
+        Aliens that still belong to a group or are already pooled are ignored,
+        so an alien can never be handed out twice.
+        """
+        if alien.in_pool or alien.alive():
+            return
+        if len(cls._alien_pool) < cls._max_pool_size:
+            alien.in_pool = True
+            cls._alien_pool.append(alien)
+
+    def __init__(self, image: Optional[pygame.Surface] = None) -> None:
+        """Initializes the alien and sets its initial position.
+
+        Args:
+            image (Optional[pygame.Surface]): Pre-scaled image shared by the fleet; scaled
+                for the current resolution when omitted
+        """
         super().__init__()
 
-        self.screen = screen
-        self.ai_configuration = ai_configuration
-        self.music = Music()
-        self.resource_manager = ResourceManager()
-
-        # Calculate scale factor based on screen resolution
-        scale_factor = min(ai_configuration.screen_width / 1280, ai_configuration.screen_height / 720)
-
-        # Load the alien image through ResourceManager
-        base_img = self.resource_manager.get_image("src/assets/images/alien.png")
-        original_size = base_img.get_size()
-        new_size = (int(original_size[0] * scale_factor), int(original_size[1] * scale_factor))
-        self.image = self.resource_manager.get_image("src/assets/images/alien.png", scale=new_size)
-
+        self.image = image if image is not None else get_alien_image(self.ai_configuration)
         self.rect = self.image.get_rect()
 
         # Starts each new alien near the top left of the screen
@@ -35,6 +94,24 @@ class Alien(Sprite):
 
         # Stores the alien's exact position
         self.x = float(self.rect.x)
+        self.y = float(self.rect.y)
+
+        # Flag to indicate if the alien is waiting in the pool
+        self.in_pool = False
+
+    def reset(self, image: Optional[pygame.Surface] = None) -> None:
+        """Reset a pooled alien to its initial state, reusing its rect"""
+        self.image = image if image is not None else get_alien_image(self.ai_configuration)
+        self.rect.size = self.image.get_size()
+        self.rect.x = self.rect.width
+        self.rect.y = self.rect.height
+        self.x = float(self.rect.x)
+        self.y = float(self.rect.y)
+
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        """Collision mask of the alien's image, built once per scaled image"""
+        return ResourceManager().get_mask(self.image)
 
     def blitme(self) -> None:
         """Draw the alien at its current location"""
@@ -62,13 +139,11 @@ class Alien(Sprite):
 
     def update_image(self) -> None:
         """Update the alien's image based on current configuration (e.g., after a resize)."""
-        scale_factor = min(self.ai_configuration.screen_width / 1280, self.ai_configuration.screen_height / 720)
-        base_img = self.resource_manager.get_image("src/assets/images/alien.png")
-        original_size = base_img.get_size()
-        new_size = (int(original_size[0] * scale_factor), int(original_size[1] * scale_factor))
-        self.image = self.resource_manager.get_image("src/assets/images/alien.png", scale=new_size)
+        self.image = get_alien_image(self.ai_configuration)
 
         # Preserve position
         old_center = self.rect.center
         self.rect = self.image.get_rect()
         self.rect.center = old_center
+        self.y = float(self.rect.y)
+        self.refresh_components()
@@ -1,14 +1,26 @@
-from typing import List
+from typing import List, Tuple
 
 import pygame
-from pygame.sprite import Sprite
 
 from src.config.configuration import Configuration
+from src.core.entity_store import EntitySprite
 from src.entities.ship import Ship
 
 
-class Bullet(Sprite):
-    """A class to manage bullets fired from the ship"""
+class Bullet(EntitySprite):
+    """A class to manage bullets fired from the ship.
+
+    Every bullet has the same screen, color and speed, so those are stored
+    once on the class by bind() and only the position and state are kept in
+    each instance's slots.
+    """
+
+    __slots__ = ("rect", "active")
+
+    # State shared by every bullet, set by bind()
+    screen: pygame.Surface
+    color: Tuple[int, int, int]
+    speed_factor: float
 
     # Class variable to store the bullet pool
     _bullet_pool: List["Bullet"] = []
@@ -19,10 +31,19 @@ class Bullet(Sprite):
         """Get a bullet from the pool or create a new one if pool is empty"""
         if cls._bullet_pool:
             bullet = cls._bullet_pool.pop()
+            # A bullet is pooled as soon as it leaves the screen, before its group drops it
+            bullet.kill()
             bullet.reset(ai_configuration, screen, ship)
             return bullet
         return cls(ai_configuration, screen, ship)
 
+    @classmethod
+    def bind(cls, ai_configuration: Configuration, screen: pygame.Surface) -> None:
+        """Set the screen, color and speed shared by every bullet."""
+        cls.screen = screen
+        cls.color = ai_configuration.bullet_color
+        cls.speed_factor = 10 * min(ai_configuration.screen_width / 1280, ai_configuration.screen_height / 720)
+
     @classmethod
     def return_to_pool(cls, bullet: "Bullet") -> None:
         """Return a bullet to the pool"""
@@ -32,7 +53,7 @@ class Bullet(Sprite):
     def __init__(self, ai_configuration: Configuration, screen: pygame.Surface, ship: Ship) -> None:
         """Create a bullet object at the ship's current position"""
         super().__init__()
-        self.screen = screen
+        Bullet.bind(ai_configuration, screen)
 
         # Calculate scale factor based on screen resolution
         scale_factor = min(ai_configuration.screen_width / 1280, ai_configuration.screen_height / 720)
@@ -48,24 +69,25 @@ class Bullet(Sprite):
         self.rect.top = ship.rect.top
 
         # Store the bullet's position as a decimal value
+        self.x = float(self.rect.x)
         self.y = float(self.rect.y)
 
-        self.color = ai_configuration.bullet_color
-        self.speed_factor = 10 * scale_factor
-
         # Flag to indicate if bullet is active
         self.active = True
 
     def reset(self, ai_configuration: Configuration, screen: pygame.Surface, ship: Ship) -> None:
         """Reset bullet to initial state"""
-        self.screen = screen
+        Bullet.bind(ai_configuration, screen)
         self.rect.centerx = ship.rect.centerx
         self.rect.top = ship.rect.top
+        self.x = float(self.rect.x)
         self.y = float(self.rect.y)
-        self.color = ai_configuration.bullet_color
-        self.speed_factor = 10 * min(ai_configuration.screen_width / 1280, ai_configuration.screen_height / 720)
         self.active = True
 
+    def velocity(self) -> Tuple[float, float]:
+        """Bullets travel straight up at the shared bullet speed."""
+        return 0.0, -self.speed_factor
+
     def update(self) -> None:
         """Move the bullet up the screen"""
         # Update the float position of the bullet
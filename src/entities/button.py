@@ -3,6 +3,7 @@ from typing import Tuple
 import pygame.font
 
 from src.config.configuration import Configuration
+from src.core.memory_registry import track
 
 
 class Button:
@@ -20,6 +21,7 @@ class Button:
         text_color (tuple): RGB color of the button text
         font (pygame.font.Font): Font used for the button text
         rect (pygame.Rect): The button's rectangle for positioning
+        msg (str): The button's text
         msg_image (pygame.Surface): Rendered text surface
         msg_image_rect (pygame.Rect): Rectangle for the text surface
     """
@@ -51,9 +53,21 @@ class Button:
         self.rect = pygame.Rect(0, 0, self.width, self.height)
         self.rect.center = self.screen_rect.center
 
-        # The button's message should only be set once
+        # The button's message is rendered once, and again only when set_msg() changes it
+        self.msg = msg
+        self.msg_stale = False
         self.prep_msg(msg)
 
+    def set_msg(self, msg: str) -> None:
+        """Change the button's message, rendering it on the next draw.
+
+        Args:
+            msg (str): The new text of the button
+        """
+        if msg != self.msg:
+            self.msg = msg
+            self.msg_stale = True
+
     def prep_msg(self, msg: str) -> None:
         """Convert the message to a rendered image and center the text.
 
@@ -63,7 +77,7 @@ class Button:
         This method creates a rendered surface of the text and centers
         it on the button's rectangle.
         """
-        self.msg_image = self.font.render(msg, True, self.text_color, self.button_color)
+        self.msg_image = track("Button", msg, self.font.render(msg, True, self.text_color, self.button_color))
         self.msg_image_rect = self.msg_image.get_rect()
         self.msg_image_rect.center = self.rect.center
 
@@ -74,6 +88,10 @@ class Button:
         It first draws the button's background color, then blits
         the text surface on top of it.
         """
+        if self.msg_stale:
+            self.msg_stale = False
+            self.prep_msg(self.msg)
+
         # Draw the button in white, then draw the message
         self.screen.fill(self.button_color, self.rect)
         self.screen.blit(self.msg_image, self.msg_image_rect)
@@ -4,6 +4,7 @@ import pygame.font
 
 from src.config.configuration import Configuration
 from src.config.language.language import Language
+from src.core.memory_registry import track
 
 
 class ControlsScreen:
@@ -23,9 +24,22 @@ class ControlsScreen:
         # Set the font and colors
         self.title_font = pygame.font.SysFont(None, 64)
         self.text_font = pygame.font.SysFont(None, 36)
+        self.continue_font = pygame.font.SysFont(None, 48)
         self.title_color: Tuple[int, int, int] = (0, 255, 0)  # Green
         self.text_color: Tuple[int, int, int] = (255, 255, 255)  # White
 
+        self.prep_text()
+        # Set when the language changes; texts are rendered again on the next draw
+        self.text_stale = False
+        self.language.add_listener(self.invalidate_text)
+
+        # Create a semi-transparent surface for the background
+        self.background = pygame.Surface((self.screen_rect.width, self.screen_rect.height), pygame.SRCALPHA)
+        track("ControlsScreen", "background", self.background)
+        self.background.fill((0, 0, 0, 200))  # Black with 78% opacity
+
+    def prep_text(self) -> None:
+        """Render the title and continue texts and translate the control descriptions"""
         # Create the title
         self.title = self.title_font.render(self.language.get_text("game_controls"), True, self.title_color)
         self.title_rect = self.title.get_rect()
@@ -43,18 +57,21 @@ class ControlsScreen:
         ]
 
         # Create the continue text
-        self.continue_font = pygame.font.SysFont(None, 48)
         self.continue_text = self.continue_font.render(self.language.get_text("press_space"), True, self.text_color)
         self.continue_rect = self.continue_text.get_rect()
         self.continue_rect.centerx = self.screen_rect.centerx
         self.continue_rect.bottom = self.screen_rect.bottom - 50
 
-        # Create a semi-transparent surface for the background
-        self.background = pygame.Surface((self.screen_rect.width, self.screen_rect.height), pygame.SRCALPHA)
-        self.background.fill((0, 0, 0, 200))  # Black with 78% opacity
+    def invalidate_text(self) -> None:
+        """Mark the translated texts stale, to be rendered again on the next draw."""
+        self.text_stale = True
 
     def draw_controls(self) -> None:
         """Draw the controls screen"""
+        if self.text_stale:
+            self.text_stale = False
+            self.prep_text()
+
         # Draw the semi-transparent background
         self.screen.blit(self.background, (0, 0))
 
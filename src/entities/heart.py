@@ -6,15 +6,19 @@ from pygame.sprite import Sprite
 from src.config.configuration import Configuration
 from src.core.resource_manager import ResourceManager
 
+# Image handle for the lives display
+HEART_IMAGE = ResourceManager.register_image("src/assets/images/heart.png")
+
 
 class Heart(Sprite):
     """A class to represent a heart for lives display"""
 
+    __slots__ = ("screen", "image", "rect")
+
     def __init__(self, screen: pygame.Surface, ai_configuration: Optional[Configuration] = None) -> None:
         """Initialize the heart and set its starting position"""
         super().__init__()
         self.screen = screen
-        self.resource_manager = ResourceManager()
 
         # Calculate scale factor based on screen resolution
         if ai_configuration:
@@ -29,7 +33,7 @@ class Heart(Sprite):
         new_size = (new_size_val, new_size_val)
 
         # Load the heart image through ResourceManager
-        self.image = self.resource_manager.get_image("src/assets/images/heart.png", scale=new_size)
+        self.image = ResourceManager().get_image_by_handle(HEART_IMAGE, scale=new_size)
 
         self.rect = self.image.get_rect()
 
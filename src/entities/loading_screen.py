@@ -0,0 +1,41 @@
+from typing import Tuple
+
+import pygame.font
+
+from src.config.configuration import Configuration
+
+
+class LoadingScreen:
+    """A class to display asset loading progress at startup"""
+
+    def __init__(self, ai_configuration: Configuration, screen: pygame.Surface) -> None:
+        """Initialize the loading screen"""
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.bg_color: Tuple[int, int, int] = ai_configuration.bg_color
+        self.bar_color: Tuple[int, int, int] = (0, 255, 0)  # Green
+        self.text_color: Tuple[int, int, int] = (255, 255, 255)  # White
+
+        # Calculate bar dimensions based on screen size
+        scale_factor = min(ai_configuration.screen_width / 1280, ai_configuration.screen_height / 720)
+        self.bar_rect = pygame.Rect(0, 0, int(400 * scale_factor), max(4, int(20 * scale_factor)))
+        self.bar_rect.center = self.screen_rect.center
+        self.font = pygame.font.SysFont(None, int(36 * scale_factor))
+
+    def draw(self, progress: float) -> None:
+        """Draw the progress bar and percentage for the given progress (0.0 to 1.0)"""
+        progress = min(max(progress, 0.0), 1.0)
+        self.screen.fill(self.bg_color)
+
+        # Draw the bar outline, then the filled portion
+        pygame.draw.rect(self.screen, self.bar_color, self.bar_rect, 2)
+        fill_rect = self.bar_rect.copy()
+        fill_rect.width = int(self.bar_rect.width * progress)
+        self.screen.fill(self.bar_color, fill_rect)
+
+        # Draw the percentage below the bar
+        percent_image = self.font.render(f"{int(progress * 100)}%", True, self.text_color)
+        percent_rect = percent_image.get_rect()
+        percent_rect.centerx = self.bar_rect.centerx
+        percent_rect.top = self.bar_rect.bottom + 10
+        self.screen.blit(percent_image, percent_rect)
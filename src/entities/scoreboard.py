@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 import pygame.font
 from pygame.sprite import Group
@@ -6,6 +6,7 @@ from pygame.sprite import Group
 from src.config.configuration import Configuration
 from src.config.language.language import Language
 from src.config.statistics.statistics import Statistics
+from src.core.memory_registry import track
 from src.entities.heart import Heart
 from src.utils.number_formatter import NumberFormatter
 
@@ -42,6 +43,44 @@ class Scoreboard:
         self.prep_level()
         self.prep_ships()
 
+        # The pause overlay is rendered on the first paused frame, then reused
+        self.pause_images: Optional[List[Tuple[pygame.Surface, pygame.Rect]]] = None
+        # Set when the language changes; labels are rendered again on the next draw
+        self.text_stale = False
+        self.language.add_listener(self.invalidate_text)
+
+    def invalidate_text(self) -> None:
+        """Mark every translated label stale, to be rendered again on the next draw."""
+        self.text_stale = True
+        self.pause_images = None
+
+    def prep_pause(self) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """Render the pause overlay: a dimmed background with the pause and instruction texts"""
+        # Create semi-transparent background for pause screen
+        pause_bg = track("Scoreboard", "pause overlay", pygame.Surface((self.screen_rect.width, self.screen_rect.height)))
+        pause_bg.fill((0, 0, 0))
+        pause_bg.set_alpha(128)
+        pause_images = [(pause_bg, pause_bg.get_rect())]
+
+        pause_font = pygame.font.SysFont(None, 72)
+        instruction_font = pygame.font.SysFont(None, 36)
+        texts = (
+            # Pause text
+            (pause_font, "paused_game", (255, 0, 0), -40),
+            # Instruction text for resume
+            (instruction_font, "press_p", (255, 255, 255), 20),
+            # Instruction text for quit
+            (instruction_font, "press_q", (255, 255, 255), 60),
+        )
+        for font, key, color, offset in texts:
+            image = font.render(self.language.get_text(key), True, color)
+            rect = image.get_rect()
+            rect.centerx = self.screen_rect.centerx
+            rect.centery = self.screen_rect.centery + offset
+            pause_images.append((image, rect))
+        self.pause_images = pause_images
+        return pause_images
+
     def prep_score(self) -> None:
         """Convert the score to a rendered image"""
         rounded_score = int(round(self.statistics.score, -1))
@@ -54,12 +93,13 @@ class Scoreboard:
         # Create background surface
         bg_surface = pygame.Surface((text_surface.get_width() + 20, text_surface.get_height() + 10))
         bg_surface.fill((0, 0, 0))  # Black background
-        bg_surface.set_alpha(180)  # Semi-transparent
+        if self.ai_configuration.hud_translucency:
+            bg_surface.set_alpha(180)  # Semi-transparent
 
         # Place text on background
         bg_surface.blit(text_surface, (10, 5))
 
-        self.score_image = bg_surface
+        self.score_image = track("Scoreboard", "score", bg_surface)
         self.score_rect = self.score_image.get_rect()
         self.score_rect.right = self.screen_rect.right - 20
         self.score_rect.top = 20
@@ -76,12 +116,13 @@ class Scoreboard:
         # Create background surface
         bg_surface = pygame.Surface((text_surface.get_width() + 20, text_surface.get_height() + 10))
         bg_surface.fill((0, 0, 0))  # Black background
-        bg_surface.set_alpha(180)  # Semi-transparent
+        if self.ai_configuration.hud_translucency:
+            bg_surface.set_alpha(180)  # Semi-transparent
 
         # Place text on background
         bg_surface.blit(text_surface, (10, 5))
 
-        self.high_score_image = bg_surface
+        self.high_score_image = track("Scoreboard", "high_score", bg_surface)
         self.high_score_rect = self.high_score_image.get_rect()
         self.high_score_rect.centerx = self.screen_rect.centerx
         self.high_score_rect.top = self.score_rect.top
@@ -96,12 +137,13 @@ class Scoreboard:
         # Create background surface
         bg_surface = pygame.Surface((text_surface.get_width() + 20, text_surface.get_height() + 10))
         bg_surface.fill((0, 0, 0))  # Black background
-        bg_surface.set_alpha(180)  # Semi-transparent
+        if self.ai_configuration.hud_translucency:
+            bg_surface.set_alpha(180)  # Semi-transparent
 
         # Place text on background
         bg_surface.blit(text_surface, (10, 5))
 
-        self.level_image = bg_surface
+        self.level_image = track("Scoreboard", "level", bg_surface)
         self.level_rect = self.level_image.get_rect()
         self.level_rect.right = self.score_rect.right
         self.level_rect.top = self.score_rect.bottom + 10
@@ -117,6 +159,12 @@ class Scoreboard:
 
     def show_score(self) -> None:
         """Draw the score to the screen"""
+        if self.text_stale:
+            self.text_stale = False
+            self.prep_score()
+            self.prep_high_score()
+            self.prep_level()
+
         self.screen.blit(self.score_image, self.score_rect)
         self.screen.blit(self.high_score_image, self.high_score_rect)
         self.screen.blit(self.level_image, self.level_rect)
@@ -124,31 +172,4 @@ class Scoreboard:
 
         # If the game is paused, show pause text
         if self.statistics.game_paused:
-            # Create semi-transparent background for pause screen
-            pause_bg = pygame.Surface((self.screen_rect.width, self.screen_rect.height))
-            pause_bg.fill((0, 0, 0))
-            pause_bg.set_alpha(128)
-            self.screen.blit(pause_bg, (0, 0))
-
-            # Pause text
-            pause_font = pygame.font.SysFont(None, 72)
-            pause_image = pause_font.render(self.language.get_text("paused_game"), True, (255, 0, 0))
-            pause_rect = pause_image.get_rect()
-            pause_rect.centerx = self.screen_rect.centerx
-            pause_rect.centery = self.screen_rect.centery - 40
-            self.screen.blit(pause_image, pause_rect)
-
-            # Instruction text for resume
-            instruction_font = pygame.font.SysFont(None, 36)
-            instruction_image = instruction_font.render(self.language.get_text("press_p"), True, (255, 255, 255))
-            instruction_rect = instruction_image.get_rect()
-            instruction_rect.centerx = self.screen_rect.centerx
-            instruction_rect.centery = self.screen_rect.centery + 20
-            self.screen.blit(instruction_image, instruction_rect)
-
-            # Instruction text for quit
-            quit_image = instruction_font.render(self.language.get_text("press_q"), True, (255, 255, 255))
-            quit_rect = quit_image.get_rect()
-            quit_rect.centerx = self.screen_rect.centerx
-            quit_rect.centery = self.screen_rect.centery + 60
-            self.screen.blit(quit_image, quit_rect)
+            self.screen.blits(self.pause_images or self.prep_pause(), doreturn=False)
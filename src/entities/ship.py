@@ -6,6 +6,9 @@ from src.config.music.music import Music
 from src.config.statistics.statistics import Statistics
 from src.core.resource_manager import ResourceManager
 
+# Image handle for the ship sprite
+SHIP_IMAGE = ResourceManager.register_image("src/assets/images/ship.png")
+
 
 class Ship(Sprite):
     """A class to manage the player's ship in the game.
@@ -23,6 +26,19 @@ class Ship(Sprite):
         music (Music): Sound effects manager
     """
 
+    __slots__ = (
+        "screen",
+        "ai_configuration",
+        "statistics",
+        "image",
+        "rect",
+        "screen_rect",
+        "center",
+        "moving_right",
+        "moving_left",
+        "music",
+    )
+
     def __init__(
         self,
         ai_configuration: Configuration,
@@ -41,7 +57,7 @@ class Ship(Sprite):
         self.screen = screen
         self.ai_configuration = ai_configuration
         self.statistics = statistics
-        self.resource_manager = ResourceManager()
+        resource_manager = ResourceManager()
 
         # Calculate scale factor based on screen resolution
         scale_factor = min(ai_configuration.screen_width / 1280, ai_configuration.screen_height / 720)
@@ -49,10 +65,10 @@ class Ship(Sprite):
         # Load the ship image through ResourceManager
         # Using a fixed original size or getting it from resource manager
         # Since we need new_size, we can get the base image first or let RM handle it
-        base_img = self.resource_manager.get_image("src/assets/images/ship.png")
+        base_img = resource_manager.get_image_by_handle(SHIP_IMAGE)
         original_size = base_img.get_size()
         new_size = (int(original_size[0] * scale_factor), int(original_size[1] * scale_factor))
-        self.image = self.resource_manager.get_image("src/assets/images/ship.png", scale=new_size)
+        self.image = resource_manager.get_image_by_handle(SHIP_IMAGE, scale=new_size)
 
         self.rect = self.image.get_rect()
         self.screen_rect = screen.get_rect()
@@ -91,6 +107,15 @@ class Ship(Sprite):
         # Update rect position
         self.rect.centerx = int(self.center)
 
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        """Collision mask of the ship's image.
+
+        Built once per scaled image by the ResourceManager and only used
+        when precise collisions are enabled.
+        """
+        return ResourceManager().get_mask(self.image)
+
     def blitme(self) -> None:
         """Draw the ship at its current location.
 
@@ -118,10 +143,11 @@ class Ship(Sprite):
     def update_image(self) -> None:
         """Update the ship's image based on current configuration (e.g., after a resize)."""
         scale_factor = min(self.ai_configuration.screen_width / 1280, self.ai_configuration.screen_height / 720)
-        base_img = self.resource_manager.get_image("src/assets/images/ship.png")
+        resource_manager = ResourceManager()
+        base_img = resource_manager.get_image_by_handle(SHIP_IMAGE)
         original_size = base_img.get_size()
         new_size = (int(original_size[0] * scale_factor), int(original_size[1] * scale_factor))
-        self.image = self.resource_manager.get_image("src/assets/images/ship.png", scale=new_size)
+        self.image = resource_manager.get_image_by_handle(SHIP_IMAGE, scale=new_size)
 
         # Keep current position
         old_center = self.rect.center
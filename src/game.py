@@ -1,21 +1,28 @@
-from typing import Optional
+import sys
+from typing import Optional, Tuple
 
 import pygame
-from pygame.sprite import Group
 
-from src.config.actors.game_actors import create_fleet
+from src.config.actors.game_actors import FleetPrebuilder, FleetSpawner, create_fleet, update_collision_cell_size
 from src.config.configuration import Configuration
-from src.config.controls.game_controls import verify_events
+from src.config.controls.game_controls import apply_pending_resize, verify_events
 from src.config.controls.gamepad_controls import GamepadManager
 from src.config.language.language import Language
 from src.config.logic.game_logic import update_aliens, update_bullets
 from src.config.music.music import Music
+from src.config.music.voices import configure_mixer
+from src.config.power.power_saver import PowerSaver
 from src.config.rendering.game_rendering import update_screen
+from src.config.rendering.quality_governor import QualityGovernor
 from src.config.statistics.statistics import Statistics
+from src.core.asset_manifest import IMAGE_ASSETS, SOUND_ASSETS
+from src.core.entity_store import EntityGroup, sync_rects
 from src.core.resource_manager import ResourceManager
+from src.entities.alien import Alien
 from src.entities.button import Button
 from src.entities.controls_screen import ControlsScreen
 from src.entities.gamepad_config_screen import GamepadConfigScreen
+from src.entities.loading_screen import LoadingScreen
 from src.entities.scoreboard import Scoreboard
 from src.entities.ship import Ship
 
@@ -27,8 +34,7 @@ class Game:
         """Initialize the game, and create game resources."""
         pygame.init()
         self.resource_manager = ResourceManager()
-        self.music = Music()
-        self.ai_configuration = Configuration()
+        self.ai_configuration = Configuration.load()
 
         # Initialize gamepad support
         self.gamepad = GamepadManager(
@@ -41,14 +47,29 @@ class Game:
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont(None, 48)
         self.fps_counter: Optional[pygame.Surface] = None
+        self.quality_governor = QualityGovernor(self.ai_configuration)
+        self.power_saver = PowerSaver()
         self.last_fps: int = 0  # Cache last FPS value to avoid unnecessary renders
         pygame.display.set_caption("Alien Invasion")
 
+        # Open the mixer with the configured latency before any sound is decoded
+        configure_mixer(self.ai_configuration.audio_buffer_size)
+
+        # Decode the asset manifest in the background before any entity needs it
+        self.preload_assets()
+        self.music = Music()
+        Alien.bind(self.ai_configuration, self.screen, self.music)
+
+        # Latest window size requested by a resize, applied once the drag settles
+        self.pending_resize: Optional[Tuple[int, int]] = None
+        self.resize_requested_at: int = 0
+
         # Set window icon
         icon = self.resource_manager.get_image("src/assets/icons/icon.png")
         pygame.display.set_icon(icon)
 
         self.language = Language()
+        self.language.add_listener(self.on_language_changed)
         self.play_button = Button(self.ai_configuration, self.screen, self.language.get_text("play"))
         self.statistics = Statistics(self.ai_configuration)
         self.scoreboard = Scoreboard(self.ai_configuration, self.screen, self.statistics, self.language)
@@ -57,43 +78,88 @@ class Game:
             self.ai_configuration, self.screen, self.gamepad.config, self.language
         )
         self.ship = Ship(self.ai_configuration, self.screen, self.statistics, self.music)
-        self.bullets: Group = Group()
-        self.aliens: Group = Group()
+        self.bullets = EntityGroup("bullets")
+        self.aliens = EntityGroup("aliens")
+        self.fleet_spawner = FleetSpawner()
+        self.fleet_prebuilder = FleetPrebuilder()
 
         create_fleet(self)
 
+    def preload_assets(self) -> None:
+        """Load the asset manifest on a thread pool while showing a loading screen."""
+        job = self.resource_manager.preload(IMAGE_ASSETS, SOUND_ASSETS)
+        loading_screen = LoadingScreen(self.ai_configuration, self.screen)
+        while not job.ready.is_set():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    sys.exit()
+            loading_screen.draw(job.progress)
+            pygame.display.flip()
+            job.wait(timeout=1 / 30)
+        self.resource_manager.finalize_preload(job)
+
     def run(self) -> None:
         """Start the main loop for the game."""
         while True:
-            self.clock.tick(60)
-
-            # Only render FPS counter if enabled and value changed
-            if self.ai_configuration.show_fps:
-                fps = int(self.clock.get_fps())
-                if fps != self.last_fps:
-                    self.fps_counter = self.font.render(f"FPS: {fps}", True, (255, 255, 255))
-                    self.last_fps = fps
-
-            verify_events(self)
-
-            if self.statistics.game_active and not self.statistics.game_paused:
-                self.ship.update()
-                update_bullets(self)
-                update_aliens(self)
-
+            self.run_frame()
+
+    def run_frame(self) -> None:
+        """Wait for the next frame, then handle input, update the game and draw it.
+
+        While the game is idle (see PowerSaver), the loop sleeps until input
+        arrives instead of ticking at full frame rate, and only draws frames
+        that may have changed.
+        """
+        if self.power_saver.is_idle(self):
+            self.power_saver.wait_for_event(self)
+            self.power_saver.set_frame_time(self, self.clock.tick())
+        else:
+            self.clock.tick(self.ai_configuration.frame_rate)
+            self.power_saver.frame_steps = 1.0
+            if self.ai_configuration.adaptive_quality:
+                # Raw time is the work done in the last frame, without the clock's sleep
+                self.quality_governor.record(self, self.clock.get_rawtime())
+
+        # Only render FPS counter if enabled and value changed
+        if self.ai_configuration.show_fps:
+            fps = int(self.clock.get_fps())
+            if fps != self.last_fps:
+                self.fps_counter = self.font.render(f"FPS: {fps}", True, (255, 255, 255))
+                self.last_fps = fps
+
+        verify_events(self)
+        if apply_pending_resize(self):
+            self.power_saver.request_present()
+
+        if self.statistics.game_active and not self.statistics.game_paused:
+            self.ship.update()
+            update_bullets(self)
+            update_aliens(self)
+
+        if self.power_saver.should_present(self):
             update_screen(self)
 
+    def on_language_changed(self) -> None:
+        """Translate the play button again; the scoreboard and screens listen to the language themselves."""
+        self.play_button.set_msg(self.language.get_text("play"))
+
     def refresh_assets(self) -> None:
         """Refresh all game assets. This is typically called after a window resize."""
+        # Aliens draw on the new screen
+        Alien.bind(self.ai_configuration, self.screen, self.music)
+
         # Update scoreboard (it needs new dimensions and font)
         self.scoreboard = Scoreboard(self.ai_configuration, self.screen, self.statistics, self.language)
 
         # Update ship
         self.ship.update_image()
 
-        # Update all aliens
+        # Spawn any rows still queued by a staggered fleet, then update all aliens
+        self.fleet_spawner.spawn_rows(self, self.fleet_spawner.pending_rows)
+        sync_rects(self.aliens.archetype)
         for alien in self.aliens:
             alien.update_image()
+        update_collision_cell_size(self)
 
         # Update other UI elements if necessary
         self.play_button = Button(self.ai_configuration, self.screen, self.language.get_text("play"))
@@ -1,9 +1,21 @@
 """Tests for game actors module."""
 
+from unittest.mock import patch
+
 import pygame
 from pygame.sprite import Group
 
-from src.config.actors.game_actors import check_aliens_bottom, create_alien, create_fleet, ship_hit
+from src.config.actors.game_actors import (
+    check_aliens_bottom,
+    clear_fleet,
+    create_alien,
+    create_fleet,
+    get_fleet_prototype,
+    prebuild_next_fleet,
+    ship_hit,
+    spawn_fleet_rows,
+)
+from src.entities.alien import Alien
 from tests.conftest import MockGame
 
 
@@ -161,7 +173,7 @@ def test_check_aliens_bottom_with_collision(mock_game: MockGame) -> None:
     # Move alien to bottom of screen
     screen_rect = mock_game.screen.get_rect()
     alien = list(mock_game.aliens.sprites())[0]
-    alien.rect.bottom = screen_rect.bottom
+    alien.y = screen_rect.bottom - alien.rect.height
 
     check_aliens_bottom(mock_game)
 
@@ -179,7 +191,7 @@ def test_check_aliens_bottom_stops_after_first_hit(mock_game: MockGame) -> None:
 
     # Move all aliens to bottom
     for alien in mock_game.aliens.sprites():
-        alien.rect.bottom = screen_rect.bottom
+        alien.y = screen_rect.bottom - alien.rect.height
 
     initial_ships = mock_game.statistics.ships_remaining
 
@@ -187,3 +199,150 @@ def test_check_aliens_bottom_stops_after_first_hit(mock_game: MockGame) -> None:
 
     # Should only decrement ships once (breaks after first hit)
     assert mock_game.statistics.ships_remaining == initial_ships - 1
+
+
+def test_get_fleet_prototype_is_cached_per_screen_size(mock_game: MockGame) -> None:
+    """Test that the fleet prototype is reused until the screen size changes."""
+    prototype = get_fleet_prototype(mock_game)
+
+    assert get_fleet_prototype(mock_game) is prototype
+
+    mock_game.ai_configuration.screen_width = 1280
+    mock_game.ai_configuration.screen_height = 720
+    assert get_fleet_prototype(mock_game) is not prototype
+
+
+def test_create_fleet_shares_prototype_image(mock_game: MockGame) -> None:
+    """Test that every alien in a fleet shares the prototype's scaled image."""
+    mock_game.aliens.empty()
+
+    create_fleet(mock_game)
+
+    prototype = get_fleet_prototype(mock_game)
+    assert len(mock_game.aliens) == prototype.number_aliens_x * prototype.number_rows
+    assert all(alien.image is prototype.image for alien in mock_game.aliens)
+    assert sorted((alien.rect.x, alien.rect.y) for alien in mock_game.aliens) == sorted(prototype.positions)
+
+
+def test_create_fleet_does_not_rebind_aliens(mock_game: MockGame) -> None:
+    """Test that new and pooled aliens use the state bound by the game instead of binding it again."""
+    mock_game.aliens.empty()
+
+    with patch.object(Alien, "bind") as bind:
+        create_fleet(mock_game)
+        clear_fleet(mock_game)
+        create_fleet(mock_game)
+
+    bind.assert_not_called()
+    assert all(alien.screen is mock_game.screen for alien in mock_game.aliens)
+
+
+def test_clear_fleet_recycles_aliens(mock_game: MockGame) -> None:
+    """Test that a fleet rebuilt after clear_fleet reuses the previous aliens."""
+    Alien._alien_pool.clear()
+    mock_game.aliens.empty()
+    create_fleet(mock_game)
+    previous_aliens = set(mock_game.aliens.sprites())
+
+    clear_fleet(mock_game)
+    assert len(mock_game.aliens) == 0
+    create_fleet(mock_game)
+
+    assert set(mock_game.aliens.sprites()) == previous_aliens
+    assert Alien._alien_pool == []
+
+
+def test_staggered_create_fleet_spawns_first_row(mock_game: MockGame) -> None:
+    """Test that a staggered fleet only spawns its first row immediately."""
+    mock_game.aliens.empty()
+    mock_game.ai_configuration.staggered_fleet_spawn = True
+
+    create_fleet(mock_game)
+
+    prototype = get_fleet_prototype(mock_game)
+    assert len(mock_game.aliens) == prototype.number_aliens_x
+    assert mock_game.fleet_spawner.pending_rows == prototype.number_rows - 1
+
+
+def test_staggered_rows_follow_fleet_offset(mock_game: MockGame) -> None:
+    """Test that later rows spawn aligned with a formation that has already moved."""
+    mock_game.aliens.empty()
+    mock_game.ai_configuration.staggered_fleet_spawn = True
+    create_fleet(mock_game)
+    for alien in mock_game.aliens:
+        alien.x += 7.0
+        alien.y += 3
+    first_row = set(mock_game.aliens.sprites())
+
+    spawn_fleet_rows(mock_game)
+
+    prototype = get_fleet_prototype(mock_game)
+    second_row = [alien for alien in mock_game.aliens if alien not in first_row]
+    expected = sorted((x + 7, y + 3) for x, y in prototype.rows()[1])
+    assert sorted((alien.rect.x, alien.rect.y) for alien in second_row) == expected
+
+
+def test_clear_fleet_cancels_staggered_spawn(mock_game: MockGame) -> None:
+    """Test that clearing the fleet drops rows that have not spawned yet."""
+    mock_game.aliens.empty()
+    mock_game.ai_configuration.staggered_fleet_spawn = True
+    create_fleet(mock_game)
+
+    clear_fleet(mock_game)
+    spawn_fleet_rows(mock_game)
+
+    assert mock_game.fleet_spawner.is_spawning is False
+    assert len(mock_game.aliens) == 0
+
+
+def test_prebuild_waits_for_few_remaining_aliens(mock_game: MockGame) -> None:
+    """Test that the next fleet is only prepared once few aliens remain."""
+    create_fleet(mock_game)
+
+    prebuild_next_fleet(mock_game)
+
+    assert mock_game.fleet_prebuilder.is_ready is False
+    assert mock_game.fleet_prebuilder.take(mock_game, get_fleet_prototype(mock_game)) is None
+
+
+def test_create_fleet_uses_prebuilt_fleet(mock_game: MockGame) -> None:
+    """Test that a fleet prepared ahead of time is swapped in by create_fleet."""
+    mock_game.aliens.empty()
+    mock_game.ai_configuration.fleet_prebuild_aliens_per_frame = 1000
+    prebuild_next_fleet(mock_game)
+    assert mock_game.fleet_prebuilder.is_ready is True
+    prepared = list(mock_game.fleet_prebuilder._aliens)
+
+    create_fleet(mock_game)
+
+    assert set(mock_game.aliens.sprites()) == set(prepared)
+    assert mock_game.fleet_prebuilder.is_ready is False
+
+
+def test_create_fleet_completes_partial_prebuild(mock_game: MockGame) -> None:
+    """Test that a partly prepared fleet is completed at the level transition."""
+    mock_game.aliens.empty()
+    mock_game.ai_configuration.fleet_prebuild_aliens_per_frame = 2
+    prebuild_next_fleet(mock_game)
+
+    create_fleet(mock_game)
+
+    positions = sorted((alien.rect.x, alien.rect.y) for alien in mock_game.aliens)
+    assert positions == sorted(get_fleet_prototype(mock_game).positions)
+
+
+def test_create_fleet_discards_prebuild_for_other_prototype(mock_game: MockGame) -> None:
+    """Test that a fleet prepared before a resize is discarded instead of handed out later."""
+    Alien._alien_pool.clear()
+    mock_game.aliens.empty()
+    mock_game.ai_configuration.fleet_prebuild_aliens_per_frame = 1000
+    prebuild_next_fleet(mock_game)
+    assert mock_game.fleet_prebuilder.is_ready is True
+
+    mock_game.ai_configuration.screen_width = 1280
+    mock_game.ai_configuration.screen_height = 720
+    create_fleet(mock_game)
+
+    prototype = get_fleet_prototype(mock_game)
+    assert all(alien.image is prototype.image for alien in mock_game.aliens)
+    assert mock_game.fleet_prebuilder._aliens == []
@@ -1,7 +1,9 @@
+from unittest.mock import patch
+
 import pygame
 import pytest
 
-from src.config.controls.game_controls import verify_events, verify_events_keydown, verify_events_keyup
+from src.config.controls.game_controls import apply_pending_resize, verify_events, verify_events_keydown, verify_events_keyup
 from tests.conftest import MockGame
 
 
@@ -95,6 +97,26 @@ def test_verify_events_keydown_toggle_sound(mock_game: MockGame) -> None:
     assert mock_game.music.sound_effects_enabled != initial_sound_state
 
 
+def test_verify_events_keydown_next_language(mock_game: MockGame) -> None:
+    """Test that L switches language and retranslates the play button."""
+    mock_game.language.set_language("en")
+    event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_l)
+
+    verify_events_keydown(event, mock_game)
+
+    assert mock_game.language.current_language != "en"
+    assert mock_game.play_button.msg == mock_game.language.get_text("play")
+
+
+def test_verify_events_keydown_memory_report(mock_game: MockGame, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that F3 prints the memory report."""
+    event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3)
+
+    verify_events_keydown(event, mock_game)
+
+    assert "all" in capsys.readouterr().out
+
+
 def test_verify_events_keyup_move_right(mock_game: MockGame) -> None:
     """Test that releasing right arrow stops ship movement."""
     event = pygame.event.Event(pygame.KEYUP, key=pygame.K_RIGHT)
@@ -154,3 +176,59 @@ def test_verify_events_mouse_button(mock_game: MockGame) -> None:
 
     # Should not raise an exception
     verify_events(mock_game)
+
+
+def test_verify_events_coalesces_resize_events(mock_game: MockGame) -> None:
+    """Test that a burst of resize events only keeps the final size."""
+    initial_width = mock_game.ai_configuration.screen_width
+    for width, height in [(900, 600), (950, 620), (1000, 640)]:
+        pygame.event.post(pygame.event.Event(pygame.VIDEORESIZE, w=width, h=height, size=(width, height)))
+
+    verify_events(mock_game)
+
+    assert mock_game.pending_resize == (1000, 640)
+    # Nothing is rebuilt until the resize settles
+    assert mock_game.ai_configuration.screen_width == initial_width
+
+
+def test_apply_pending_resize_waits_for_settle(mock_game: MockGame) -> None:
+    """Test that a pending resize is not applied before the settle period."""
+    mock_game.pending_resize = (1000, 640)
+    mock_game.resize_requested_at = pygame.time.get_ticks()
+    mock_game.ai_configuration.resize_settle_ms = 10_000
+
+    with patch.object(mock_game, "refresh_assets") as refresh_assets:
+        assert apply_pending_resize(mock_game) is False
+
+    refresh_assets.assert_not_called()
+    assert mock_game.pending_resize == (1000, 640)
+
+
+def test_apply_pending_resize_applies_final_size_once(mock_game: MockGame) -> None:
+    """Test that a settled resize updates the configuration and rebuilds assets once."""
+    mock_game.pending_resize = (1000, 640)
+    mock_game.resize_requested_at = pygame.time.get_ticks() - mock_game.ai_configuration.resize_settle_ms
+
+    with patch("pygame.display.set_mode", return_value=mock_game.screen) as set_mode:
+        with patch.object(mock_game, "refresh_assets") as refresh_assets:
+            assert apply_pending_resize(mock_game) is True
+            assert apply_pending_resize(mock_game) is False
+
+    set_mode.assert_called_once_with((1000, 640), pygame.RESIZABLE)
+    refresh_assets.assert_called_once()
+    assert mock_game.ai_configuration.screen_width == 1000
+    assert mock_game.ai_configuration.screen_height == 640
+    assert mock_game.pending_resize is None
+
+
+def test_apply_pending_resize_skips_unchanged_size(mock_game: MockGame) -> None:
+    """Test that a drag ending at the current size does not rebuild assets."""
+    config = mock_game.ai_configuration
+    mock_game.pending_resize = (config.screen_width, config.screen_height)
+    mock_game.resize_requested_at = pygame.time.get_ticks() - config.resize_settle_ms
+
+    with patch.object(mock_game, "refresh_assets") as refresh_assets:
+        assert apply_pending_resize(mock_game) is False
+
+    refresh_assets.assert_not_called()
+    assert mock_game.pending_resize is None
@@ -0,0 +1,100 @@
+"""Tests for the pluggable collision broadphase."""
+
+import pygame
+import pytest
+
+from src.config.actors.game_actors import create_fleet
+from src.config.logic import broadphase
+from src.config.logic.broadphase import BROADPHASES, Broadphase, get_broadphase, get_grid_cells, set_grid_cell_size
+from src.config.logic.game_logic import find_bullet_hits, move_bullets, move_fleet, swept_bullets
+from src.entities.bullet import Bullet
+from tests.conftest import MockGame
+
+
+def fire_at(mock_game: MockGame, x: int, y: int) -> Bullet:
+    """Add a bullet whose top-left corner is at (x, y)."""
+    bullet = Bullet(mock_game.ai_configuration, mock_game.screen, mock_game.ship)
+    bullet.x, bullet.y = float(x), float(y)
+    mock_game.bullets.add(bullet)
+    return bullet
+
+
+def fleet_under_fire(mock_game: MockGame) -> None:
+    """Build a moved fleet with bullets fired at, between and beside its aliens."""
+    create_fleet(mock_game)
+    for _ in range(5):
+        move_fleet(mock_game)
+    aliens = mock_game.aliens.sprites()
+    aliens[len(aliens) // 2].kill()
+    for alien in aliens[::3]:
+        fire_at(mock_game, int(alien.x) + 2, int(alien.y + alien.rect.height) + 1)
+        fire_at(mock_game, int(alien.x + alien.rect.width) + 1, int(alien.y + alien.rect.height) - 2)
+    fire_at(mock_game, 0, mock_game.ai_configuration.screen_height // 2)
+    move_bullets(mock_game)
+
+
+@pytest.mark.parametrize("name", sorted(BROADPHASES))
+def test_broadphases_find_the_same_hits(mock_game: MockGame, name: str) -> None:
+    """Test that every strategy reports the same hits as brute force."""
+    fleet_under_fire(mock_game)
+
+    mock_game.ai_configuration.broadphase = "brute_force"
+    expected = find_bullet_hits(mock_game)
+    mock_game.ai_configuration.broadphase = name
+    hits = find_bullet_hits(mock_game)
+
+    assert expected
+    # Hits at the same time of impact may come in any order
+    assert {bullet: (time, alien) for time, bullet, alien in hits} == {
+        bullet: (time, alien) for time, bullet, alien in expected
+    }
+    assert [time for time, _, _ in hits] == sorted(time for time, _, _ in hits)
+
+
+@pytest.mark.parametrize("name", sorted(BROADPHASES))
+def test_broadphases_never_miss_overlapping_pairs(mock_game: MockGame, name: str) -> None:
+    """Test that every strategy reports each bullet-alien pair whose rects overlap."""
+    fleet_under_fire(mock_game)
+    sweeps = swept_bullets(mock_game)
+    overlapping = {
+        (bullet, alien) for bullet, swept in sweeps for alien in mock_game.aliens if swept.colliderect(alien.rect)
+    }
+
+    assert overlapping <= set(get_broadphase(name).pairs(mock_game.aliens, sweeps))
+
+
+def test_formation_index_follows_removed_aliens(mock_game: MockGame) -> None:
+    """Test that the formation index is rebuilt when an alien is destroyed."""
+    mock_game.ai_configuration.broadphase = "formation"
+    create_fleet(mock_game)
+    alien = mock_game.aliens.sprites()[0]
+    fire_at(mock_game, int(alien.x) + 2, int(alien.y + alien.rect.height) + 1)
+    move_bullets(mock_game)
+    assert find_bullet_hits(mock_game)[0][2] is alien
+
+    alien.kill()
+
+    assert all(hit_alien is not alien for _, _, hit_alien in find_bullet_hits(mock_game))
+
+
+def test_get_broadphase_unknown_name() -> None:
+    """Test that an unknown strategy name is rejected."""
+    with pytest.raises(ValueError, match="Unknown broadphase"):
+        get_broadphase("octree")
+
+
+def test_broadphase_requires_pairs() -> None:
+    """Test that a strategy must implement pairs() to be created."""
+    with pytest.raises(TypeError):
+        Broadphase()  # type: ignore[abstract]
+
+
+def test_create_fleet_sizes_grid_cells(mock_game: MockGame) -> None:
+    """Test that the grid cell size follows the scaled alien size."""
+    set_grid_cell_size(64)
+
+    create_fleet(mock_game)
+
+    alien = mock_game.aliens.sprites()[0]
+    assert broadphase.grid_cell_size == max(alien.rect.size)
+    assert get_grid_cells(pygame.Rect(0, 0, *alien.rect.size)) == [(0, 0)]
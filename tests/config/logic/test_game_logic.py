@@ -1,20 +1,25 @@
 """Tests for game logic module."""
 
 import pygame
+import pytest
 from pygame.sprite import Group
 
 from src.config.actors.game_actors import create_alien, create_fleet
+from src.config.logic.broadphase import build_spatial_grid, get_grid_cells, spatial_grid
 from src.config.logic.game_logic import (
     change_fleet_direction,
     check_bullet_alien_collisions,
     check_fleet_edges,
     check_high_score,
-    get_grid_cells,
-    spatial_grid,
+    find_bullet_hits,
+    move_bullets,
+    ship_collides_with_fleet,
+    swept_bullets,
+    swept_collision_time,
     update_aliens,
     update_bullets,
-    update_spatial_grid,
 )
+from src.core.entity_store import sync_rects
 from src.entities.bullet import Bullet
 from tests.conftest import MockGame
 
@@ -38,8 +43,8 @@ def test_update_aliens_ship_collision(mock_game: MockGame) -> None:
     alien = list(mock_game.aliens.sprites())[0]
 
     # Move alien to ship position for collision
-    alien.rect.centerx = mock_game.ship.rect.centerx
-    alien.rect.centery = mock_game.ship.rect.centery
+    alien.x = mock_game.ship.rect.centerx - alien.rect.width // 2
+    alien.y = mock_game.ship.rect.centery - alien.rect.height // 2
     initial_ships = mock_game.statistics.ships_remaining
 
     update_aliens(mock_game)
@@ -77,7 +82,7 @@ def test_get_grid_cells_single_cell(mock_game: MockGame) -> None:
     """Test get_grid_cells for object in single cell."""
     rect = pygame.Rect(10, 10, 20, 20)
 
-    cells = get_grid_cells(rect)
+    cells = get_grid_cells(rect, cell_size=64)
 
     # Small rect should occupy only one cell
     assert len(cells) == 1
@@ -90,7 +95,7 @@ def test_get_grid_cells_multiple_cells(mock_game: MockGame) -> None:
     # Rect from (50,50) to (130,130) covers cells (0,0), (1,0), (2,0), (0,1), (1,1), (2,1), (0,2), (1,2), (2,2)
     rect = pygame.Rect(50, 50, 80, 80)
 
-    cells = get_grid_cells(rect)
+    cells = get_grid_cells(rect, cell_size=64)
 
     # Rect covers cells in range: x from 50//64=0 to 130//64=2, y from 50//64=0 to 130//64=2
     # That's 3x3 = 9 cells
@@ -101,7 +106,7 @@ def test_get_grid_cells_edge_case(mock_game: MockGame) -> None:
     """Test get_grid_cells at cell boundaries."""
     rect = pygame.Rect(64, 64, 1, 1)
 
-    cells = get_grid_cells(rect)
+    cells = get_grid_cells(rect, cell_size=64)
 
     # Should be in cell (1, 1)
     assert (1, 1) in cells
@@ -111,27 +116,27 @@ def test_get_grid_cells_exact_cell_boundary(mock_game: MockGame) -> None:
     """Test exact 64x64 rect maps to one cell, not four."""
     rect = pygame.Rect(0, 0, 64, 64)
 
-    cells = get_grid_cells(rect)
+    cells = get_grid_cells(rect, cell_size=64)
 
     assert cells == [(0, 0)]
 
 
-def test_update_spatial_grid_empty(mock_game: MockGame) -> None:
+def test_build_spatial_grid_empty(mock_game: MockGame) -> None:
     """Test spatial grid update with no objects."""
     mock_game.aliens.empty()
     mock_game.bullets.empty()
 
-    update_spatial_grid(mock_game)
+    build_spatial_grid(mock_game.aliens, swept_bullets(mock_game))
 
     # Grid should be empty
     assert len(spatial_grid) == 0
 
 
-def test_update_spatial_grid_with_aliens(mock_game: MockGame) -> None:
+def test_build_spatial_grid_with_aliens(mock_game: MockGame) -> None:
     """Test spatial grid update with aliens."""
     create_alien(mock_game, alien_number=0, row_number=0)
 
-    update_spatial_grid(mock_game)
+    build_spatial_grid(mock_game.aliens, swept_bullets(mock_game))
 
     # Grid should have at least one cell with aliens
     assert len(spatial_grid) > 0
@@ -139,12 +144,12 @@ def test_update_spatial_grid_with_aliens(mock_game: MockGame) -> None:
     assert has_aliens
 
 
-def test_update_spatial_grid_with_bullets(mock_game: MockGame) -> None:
+def test_build_spatial_grid_with_bullets(mock_game: MockGame) -> None:
     """Test spatial grid update with bullets."""
     bullet = Bullet(mock_game.ai_configuration, mock_game.screen, mock_game.ship)
     mock_game.bullets.add(bullet)
 
-    update_spatial_grid(mock_game)
+    build_spatial_grid(mock_game.aliens, swept_bullets(mock_game))
 
     # Grid should have at least one cell with bullets
     assert len(spatial_grid) > 0
@@ -152,13 +157,13 @@ def test_update_spatial_grid_with_bullets(mock_game: MockGame) -> None:
     assert has_bullets
 
 
-def test_update_spatial_grid_with_both(mock_game: MockGame) -> None:
+def test_build_spatial_grid_with_both(mock_game: MockGame) -> None:
     """Test spatial grid update with both aliens and bullets."""
     create_alien(mock_game, alien_number=0, row_number=0)
     bullet = Bullet(mock_game.ai_configuration, mock_game.screen, mock_game.ship)
     mock_game.bullets.add(bullet)
 
-    update_spatial_grid(mock_game)
+    build_spatial_grid(mock_game.aliens, swept_bullets(mock_game))
 
     # Grid should have cells with both aliens and bullets
     assert len(spatial_grid) > 0
@@ -168,6 +173,8 @@ def test_check_bullet_alien_collisions_hit(mock_game: MockGame) -> None:
     """Test that bullet-alien collision is detected."""
     create_alien(mock_game, alien_number=0, row_number=0)
     alien = list(mock_game.aliens.sprites())[0]
+    # A second alien keeps the level from completing, which would recycle the destroyed alien
+    create_alien(mock_game, alien_number=3, row_number=0)
 
     bullet = Bullet(mock_game.ai_configuration, mock_game.screen, mock_game.ship)
     mock_game.bullets.add(bullet)
@@ -284,15 +291,15 @@ def test_check_fleet_edges_at_edge(mock_game: MockGame) -> None:
 
     # Move alien to right edge
     screen_rect = mock_game.screen.get_rect()
-    alien.rect.right = screen_rect.right
+    alien.x = screen_rect.right - alien.rect.width
 
-    initial_y = alien.rect.y
+    initial_y = alien.y
     initial_direction = mock_game.ai_configuration.fleet_direction
 
     check_fleet_edges(mock_game)
 
     # Fleet should have moved down
-    assert alien.rect.y > initial_y
+    assert alien.y > initial_y
     # Direction should have changed
     assert mock_game.ai_configuration.fleet_direction != initial_direction
 
@@ -303,14 +310,14 @@ def test_change_fleet_direction(mock_game: MockGame) -> None:
     create_alien(mock_game, alien_number=1, row_number=0)
 
     aliens = list(mock_game.aliens.sprites())
-    initial_y_positions = [alien.rect.y for alien in aliens]
+    initial_y_positions = [alien.y for alien in aliens]
     initial_direction = mock_game.ai_configuration.fleet_direction
 
     change_fleet_direction(mock_game)
 
     # All aliens should have moved down
     for i, alien in enumerate(aliens):
-        assert alien.rect.y > initial_y_positions[i]
+        assert alien.y > initial_y_positions[i]
 
     # Direction should be reversed
     assert mock_game.ai_configuration.fleet_direction == -initial_direction
@@ -329,3 +336,130 @@ def test_change_fleet_direction_multiple_times(mock_game: MockGame) -> None:
     # Should alternate
     assert first_change == -initial_direction
     assert second_change == initial_direction
+
+
+def test_level_not_complete_while_fleet_is_spawning(mock_game: MockGame) -> None:
+    """Test that destroying every spawned alien does not finish a level with rows still queued."""
+    mock_game.aliens.empty()
+    mock_game.ai_configuration.staggered_fleet_spawn = True
+    create_fleet(mock_game)
+    mock_game.aliens.empty()
+    initial_level = mock_game.statistics.level
+
+    check_bullet_alien_collisions(mock_game)
+
+    assert mock_game.statistics.level == initial_level
+    assert mock_game.fleet_spawner.is_spawning is True
+
+
+def test_update_aliens_defers_rect_sync_until_needed(mock_game: MockGame) -> None:
+    """Test that fleet movement leaves rects untouched while no collision test needs them."""
+    mock_game.aliens.empty()
+    create_fleet(mock_game)
+    alien = mock_game.aliens.sprites()[0]
+    initial_rect_x = alien.rect.x
+
+    update_aliens(mock_game)
+
+    assert alien.x != initial_rect_x
+    assert alien.rect.x == initial_rect_x
+    sync_rects(mock_game.aliens.archetype)
+    assert alien.rect.x == int(alien.x)
+
+
+def test_swept_collision_time_detects_tunnelling() -> None:
+    """Test that a rect passing completely through a target within one move is detected."""
+    target = pygame.Rect(0, 100, 40, 30)
+    previous = pygame.Rect(10, 200, 3, 15)
+    current = pygame.Rect(10, 20, 3, 15)
+
+    assert not current.colliderect(target) and not previous.colliderect(target)
+    time = swept_collision_time(previous, current, target)
+    assert time is not None
+    assert time == pytest.approx((200 - 130) / 180)
+
+
+def test_swept_collision_time_misses() -> None:
+    """Test that paths beside or short of a target do not collide."""
+    target = pygame.Rect(0, 100, 40, 30)
+
+    assert swept_collision_time(pygame.Rect(50, 200, 3, 15), pygame.Rect(50, 20, 3, 15), target) is None
+    assert swept_collision_time(pygame.Rect(10, 200, 3, 15), pygame.Rect(10, 140, 3, 15), target) is None
+    # Only touching the target's bottom edge is not a collision, like Rect.colliderect()
+    assert swept_collision_time(pygame.Rect(10, 200, 3, 15), pygame.Rect(10, 130, 3, 15), target) is None
+
+
+def test_fast_bullet_hits_alien_it_would_skip(mock_game: MockGame, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a bullet moving further than an alien's height per frame still hits it."""
+    mock_game.aliens.empty()
+    create_alien(mock_game, alien_number=0, row_number=1)
+    create_alien(mock_game, alien_number=3, row_number=0)
+    alien = mock_game.aliens.sprites()[0]
+
+    bullet = Bullet(mock_game.ai_configuration, mock_game.screen, mock_game.ship)
+    # Far enough per frame to jump from below the alien to above it
+    monkeypatch.setattr(Bullet, "speed_factor", float(alien.rect.height + bullet.rect.height + 20))
+    bullet.rect.midtop = (alien.rect.centerx, alien.rect.bottom + 5)
+    bullet.x, bullet.y = float(bullet.rect.x), float(bullet.rect.y)
+    mock_game.bullets.add(bullet)
+
+    update_bullets(mock_game)
+
+    assert not bullet.rect.colliderect(alien.rect)
+    assert bullet.active is False
+    assert alien not in mock_game.aliens
+
+
+def test_bullet_hits_first_alien_on_its_path(mock_game: MockGame, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a bullet crossing two aliens in one frame destroys the nearer one."""
+    mock_game.aliens.empty()
+    create_alien(mock_game, alien_number=0, row_number=0)
+    create_alien(mock_game, alien_number=0, row_number=1)
+    create_alien(mock_game, alien_number=3, row_number=0)
+    upper, lower = mock_game.aliens.sprites()[:2]
+
+    bullet = Bullet(mock_game.ai_configuration, mock_game.screen, mock_game.ship)
+    monkeypatch.setattr(Bullet, "speed_factor", float(lower.rect.bottom - upper.rect.top + 10))
+    bullet.rect.midtop = (lower.rect.centerx, lower.rect.bottom + 5)
+    bullet.x, bullet.y = float(bullet.rect.x), float(bullet.rect.y)
+    mock_game.bullets.add(bullet)
+
+    update_bullets(mock_game)
+
+    assert lower not in mock_game.aliens
+    assert upper in mock_game.aliens
+
+
+def test_precise_collisions_ignore_transparent_border(mock_game: MockGame) -> None:
+    """Test that a bullet grazing an alien's transparent border only hits without precise collisions."""
+    mock_game.aliens.empty()
+    create_alien(mock_game, alien_number=1, row_number=1)
+    alien = mock_game.aliens.sprites()[0]
+    assert not any(alien.mask.get_at((x, y)) for x in range(2) for y in range(alien.rect.height))
+
+    bullet = Bullet(mock_game.ai_configuration, mock_game.screen, mock_game.ship)
+    bullet.x, bullet.y = float(alien.rect.left + 2 - bullet.rect.width), float(alien.rect.bottom)
+    mock_game.bullets.add(bullet)
+    move_bullets(mock_game)
+
+    assert [hit[2] for hit in find_bullet_hits(mock_game)] == [alien]
+    mock_game.ai_configuration.precise_collisions = True
+    assert find_bullet_hits(mock_game) == []
+
+
+def test_precise_ship_collision(mock_game: MockGame) -> None:
+    """Test that an alien whose transparent bottom rows overlap the ship only hits without precise collisions."""
+    mock_game.aliens.empty()
+    create_alien(mock_game, alien_number=0, row_number=0)
+    alien = mock_game.aliens.sprites()[0]
+    alien.x = float(mock_game.ship.rect.centerx - alien.rect.width // 2)
+    alien.y = float(mock_game.ship.rect.top + 1 - alien.rect.height)
+    sync_rects(mock_game.aliens.archetype)
+
+    assert ship_collides_with_fleet(mock_game)
+    mock_game.ai_configuration.precise_collisions = True
+    assert not ship_collides_with_fleet(mock_game)
+
+    alien.y = float(mock_game.ship.rect.centery - alien.rect.height // 2)
+    sync_rects(mock_game.aliens.archetype)
+    assert ship_collides_with_fleet(mock_game)
@@ -0,0 +1 @@
+"""Tests for music and sound effects."""
@@ -0,0 +1,75 @@
+"""Tests for the Music manager's lazy and per-asset audio loading."""
+
+from typing import Iterator
+
+import pygame
+import pytest
+
+from src.config.music import music as music_module
+from src.config.music.music import GAME_OVER_SOUND, DummySound, Music
+from src.core.path_utils import resource_path
+from src.core.resource_manager import ResourceManager
+
+
+@pytest.fixture
+def music(monkeypatch: pytest.MonkeyPatch) -> Iterator[Music]:
+    """Provide a fresh Music manager on SDL's dummy audio driver, restoring the shared one afterwards."""
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.quit()
+    previous = Music._instance
+    Music._instance = None
+    ResourceManager().clear_cache()
+    yield Music()
+    Music._instance = previous
+    pygame.mixer.quit()
+
+
+def test_missing_music_keeps_sound_effects(music: Music) -> None:
+    """Test that the missing background track does not silence the sound effects."""
+    assert not music.music_loaded
+    assert isinstance(music.shoot_sound, pygame.mixer.Sound)
+    assert isinstance(music.explosion_sound, pygame.mixer.Sound)
+
+    music.volume = 0.2
+    assert music.volume == 0.2
+
+
+def test_game_over_sound_is_loaded_on_first_use(music: Music) -> None:
+    """Test that the game over sound is not decoded until it is needed."""
+    assert resource_path(GAME_OVER_SOUND) not in ResourceManager()._sounds
+
+    sound = music.game_over_sound
+
+    assert isinstance(sound, pygame.mixer.Sound)
+    assert music.game_over_sound is sound
+
+
+def test_prefetch_game_over(music: Music) -> None:
+    """Test that a prefetched game over sound is published by its first use."""
+    music.prefetch_game_over()
+    assert music._game_over_job is not None
+
+    assert isinstance(music.game_over_sound, pygame.mixer.Sound)
+    assert music._game_over_job is None
+
+
+def test_failed_sound_effect_falls_back_alone(music: Music, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a sound effect that fails to load is replaced without affecting the others."""
+    monkeypatch.setattr(music_module, "GAME_OVER_SOUND", "src/assets/sounds/missing.wav")
+
+    assert isinstance(music.game_over_sound, DummySound)
+    assert isinstance(music.shoot_sound, pygame.mixer.Sound)
+
+
+def test_idle_game_over_sound_is_unloaded_and_reloaded(music: Music) -> None:
+    """Test that Music holds no sound itself, so the ResourceManager can unload it when idle."""
+    resource_manager = ResourceManager()
+    music.game_over_sound
+    resource_manager.set_sound_cache_budget(0)
+
+    freed = resource_manager.unload_idle_sounds(idle_seconds=0)
+
+    assert freed > 0
+    assert resource_manager.get_cache_stats()["sounds"] == 0
+    assert isinstance(music.game_over_sound, pygame.mixer.Sound)
+    resource_manager.set_sound_cache_budget(ResourceManager.DEFAULT_SOUND_CACHE_BUDGET)
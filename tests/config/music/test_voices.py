@@ -0,0 +1,79 @@
+"""Tests for channel reservation, voice limits and priorities."""
+
+from typing import Dict, Iterator
+
+import pygame
+import pytest
+
+from src.config.music.voices import VoiceCategory, VoiceManager, configure_mixer, mixer_latency_ms
+
+CATEGORIES: Dict[str, VoiceCategory] = {
+    "critical": VoiceCategory(channels=1, priority=100, max_voices=1),
+    "weapon": VoiceCategory(channels=2, priority=10, max_voices=2),
+}
+
+
+@pytest.fixture
+def mixer(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Open the mixer on SDL's dummy audio driver."""
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    assert configure_mixer(256)
+    yield
+    pygame.mixer.quit()
+
+
+def make_sound() -> pygame.mixer.Sound:
+    """Return a silent sound long enough to still be playing during a test."""
+    frequency, _, channels = pygame.mixer.get_init()
+    return pygame.mixer.Sound(buffer=bytes(frequency * channels * 2 * 10))
+
+
+def test_configure_mixer_sets_latency(mixer: None) -> None:
+    """Test that the configured buffer size is reported as the mixer latency."""
+    latency = mixer_latency_ms()
+
+    assert latency == pytest.approx(256 / pygame.mixer.get_init()[0] * 1000)
+
+
+def test_voice_limit_restarts_oldest_copy(mixer: None) -> None:
+    """Test that a sound at its voice limit reuses the channel of one of its copies."""
+    voices = VoiceManager(CATEGORIES)
+    shot = make_sound()
+
+    for _ in range(3):
+        assert voices.play(shot, "weapon") is not None
+
+    # Channel 0 is reserved for the critical category; the weapon owns channels 1 and 2
+    assert [pygame.mixer.Channel(i).get_sound() for i in range(3)] == [None, shot, shot]
+    assert voices.stolen == 1
+
+
+def test_reserved_channels_are_not_used_by_plain_play(mixer: None) -> None:
+    """Test that Sound.play() never lands on a channel reserved for a category."""
+    VoiceManager(CATEGORIES)
+
+    channel = make_sound().play()
+
+    assert channel is not None
+    assert channel.get_sound() is not None
+    assert all(not pygame.mixer.Channel(i).get_busy() for i in range(3))
+
+
+def test_priority_steals_lower_priority_voice(mixer: None) -> None:
+    """Test that a full high priority category takes over a lower priority voice, but not the reverse."""
+    voices = VoiceManager(CATEGORIES)
+    shots = [make_sound(), make_sound()]
+    alarms = [make_sound(), make_sound()]
+    for shot in shots:
+        voices.play(shot, "weapon")
+
+    voices.play(alarms[0], "critical")
+    voices.play(alarms[1], "critical")
+    assert [pygame.mixer.Channel(i).get_sound() for i in range(3)] == [alarms[0], alarms[1], shots[1]]
+
+    # A weapon sound replaces the weapon voice rather than the higher priority voice on its channel
+    extra = make_sound()
+    voices.play(extra, "weapon")
+    assert [pygame.mixer.Channel(i).get_sound() for i in range(3)] == [alarms[0], alarms[1], extra]
+    assert voices.stolen == 2
+    assert voices.dropped == 0
@@ -0,0 +1,134 @@
+"""Tests for the main loop's power saving."""
+
+import time
+from unittest.mock import patch
+
+import pygame
+import pytest
+
+import src.config.rendering.game_rendering as rendering
+from src.config.power.power_saver import PowerSaver
+from src.config.rendering.game_rendering import update_stars
+from tests.conftest import MockGame
+
+
+@pytest.fixture
+def playing_game(mock_game: MockGame) -> MockGame:
+    """Return a mock game with a game in progress."""
+    mock_game.statistics.game_active = True
+    mock_game.statistics.game_paused = False
+    mock_game.statistics.show_controls = False
+    return mock_game
+
+
+@pytest.mark.parametrize("event_type", [pygame.WINDOWFOCUSLOST, pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN])
+def test_leaving_the_window_pauses_the_game(playing_game: MockGame, event_type: int) -> None:
+    """Test that losing focus or hiding the window pauses a game in progress."""
+    power_saver = playing_game.power_saver
+    assert not power_saver.is_idle(playing_game)
+
+    power_saver.handle_event(pygame.event.Event(event_type), playing_game)
+
+    assert playing_game.statistics.game_paused is True
+    assert power_saver.is_idle(playing_game)
+
+
+def test_hidden_window_is_never_drawn(playing_game: MockGame) -> None:
+    """Test that nothing is drawn while minimized, and drawing resumes once restored."""
+    power_saver = playing_game.power_saver
+    power_saver.handle_event(pygame.event.Event(pygame.WINDOWMINIMIZED), playing_game)
+    assert not power_saver.should_present(playing_game)
+
+    power_saver.handle_event(pygame.event.Event(pygame.WINDOWRESTORED), playing_game)
+
+    assert power_saver.window_visible
+    assert power_saver.should_present(playing_game)
+
+
+def test_idle_frames_are_drawn_only_after_changes(mock_game: MockGame) -> None:
+    """Test that the menu is drawn once, then again only after input."""
+    mock_game.ai_configuration.use_stars = False
+    power_saver = mock_game.power_saver
+    assert power_saver.is_idle(mock_game)
+
+    assert power_saver.should_present(mock_game)
+    assert not power_saver.should_present(mock_game)
+
+    power_saver.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0)), mock_game)
+    assert power_saver.should_present(mock_game)
+    assert not power_saver.should_present(mock_game)
+
+
+def test_power_saving_disabled(mock_game: MockGame) -> None:
+    """Test that disabling power saving keeps the loop running at full rate."""
+    mock_game.ai_configuration.power_saving = False
+    power_saver = PowerSaver()
+
+    assert not power_saver.is_idle(mock_game)
+    assert power_saver.should_present(mock_game)
+    assert power_saver.should_present(mock_game)
+
+
+def test_wait_for_event_wakes_on_input(mock_game: MockGame) -> None:
+    """Test that an idle wait returns at once on input and leaves the event in the queue."""
+    mock_game.ai_configuration.idle_frame_rate = 1
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+
+    start = time.perf_counter()
+    mock_game.power_saver.wait_for_event(mock_game)
+
+    assert time.perf_counter() - start < 0.5
+    assert [event.type for event in pygame.event.get()] == [pygame.KEYDOWN]
+
+
+def test_idle_main_loop_skips_unchanged_frames(mock_game: MockGame) -> None:
+    """Test that the main loop draws the idle menu once until something changes."""
+    mock_game.ai_configuration.use_stars = False
+    mock_game.clock = pygame.time.Clock()
+    mock_game.ai_configuration.idle_frame_rate = 100
+    pygame.event.clear()
+
+    with patch("src.game.update_screen") as update_screen:
+        for _ in range(3):
+            mock_game.run_frame()
+
+    assert update_screen.call_count == 1
+
+
+def test_title_star_field_keeps_scrolling(mock_game: MockGame) -> None:
+    """Test that idle frames of the title screen are drawn while its stars scroll, but not once paused."""
+    power_saver = mock_game.power_saver
+    assert power_saver.is_idle(mock_game)
+
+    assert all(power_saver.should_present(mock_game) for _ in range(3))
+
+    mock_game.statistics.game_over = True
+    power_saver.should_present(mock_game)
+    assert not power_saver.should_present(mock_game)
+
+
+def test_idle_star_motion_follows_time_slept(mock_game: MockGame) -> None:
+    """Test that stars move by the frames that fit in the time slept, up to one idle frame."""
+    configuration = mock_game.ai_configuration
+    configuration.frame_rate = 60
+    configuration.idle_frame_rate = 4
+    power_saver = mock_game.power_saver
+
+    power_saver.set_frame_time(mock_game, 100)
+    assert power_saver.frame_steps == pytest.approx(6.0)
+
+    power_saver.set_frame_time(mock_game, 60_000)
+    assert power_saver.frame_steps == pytest.approx(15.0)
+
+
+def test_update_stars_moves_by_frame_steps(mock_game: MockGame) -> None:
+    """Test that a drawn frame moves each star by its speed times the frame steps."""
+    mock_game.ai_configuration.star_count = 1
+    mock_game.power_saver.frame_steps = 4.0
+    rendering.stars[:] = [[10, 100.0, 2, 0.5]]
+
+    update_stars(mock_game)
+
+    assert rendering.stars[0][1] == pytest.approx(102.0)
+    rendering.stars.clear()
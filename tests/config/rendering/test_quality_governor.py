@@ -0,0 +1,114 @@
+"""Tests for the quality governor."""
+
+import logging
+
+import pytest
+
+from src.config.rendering import game_rendering
+from src.config.rendering.quality_governor import HEADROOM, QUALITY_STEPS, WINDOW_FRAMES, QualityGovernor
+from tests.conftest import MockGame
+
+
+def run_frames(governor: QualityGovernor, mock_game: MockGame, frame_ms: float, windows: int = 1) -> None:
+    """Record enough frames of one duration for a number of decisions."""
+    for _ in range(WINDOW_FRAMES * windows):
+        governor.record(mock_game, frame_ms)
+
+
+def test_steps_down_in_order_when_over_budget(mock_game: MockGame) -> None:
+    """Test that each window over budget takes the next step down, until none are left."""
+    configuration = mock_game.ai_configuration
+    governor = QualityGovernor(configuration)
+    star_count = configuration.star_count
+
+    run_frames(governor, mock_game, governor.budget_ms * 2)
+    assert governor.level == 1
+    assert configuration.star_count == star_count // 2
+
+    run_frames(governor, mock_game, governor.budget_ms * 2, windows=len(QUALITY_STEPS) + 2)
+    assert governor.level == len(QUALITY_STEPS)
+    assert configuration.use_stars is False
+    assert configuration.use_gradient_background is False
+    assert configuration.hud_translucency is False
+
+
+def test_steps_back_up_with_headroom(mock_game: MockGame) -> None:
+    """Test that frames well under budget undo the steps, restoring the configured values."""
+    configuration = mock_game.ai_configuration
+    governor = QualityGovernor(configuration)
+    star_count = configuration.star_count
+    run_frames(governor, mock_game, governor.budget_ms * 2, windows=len(QUALITY_STEPS))
+
+    run_frames(governor, mock_game, governor.budget_ms * HEADROOM / 2, windows=len(QUALITY_STEPS))
+
+    assert governor.level == 0
+    assert configuration.star_count == star_count
+    assert configuration.use_gradient_background is True
+    assert configuration.hud_translucency is True
+
+
+def test_hysteresis_holds_level_between_thresholds(mock_game: MockGame) -> None:
+    """Test that frames between the two thresholds change nothing."""
+    governor = QualityGovernor(mock_game.ai_configuration)
+    run_frames(governor, mock_game, governor.budget_ms * 2)
+
+    run_frames(governor, mock_game, governor.budget_ms * (1 + HEADROOM) / 2, windows=3)
+
+    assert governor.level == 1
+
+
+def test_decisions_wait_for_a_full_window(mock_game: MockGame) -> None:
+    """Test that a single slow frame does not change quality."""
+    governor = QualityGovernor(mock_game.ai_configuration)
+
+    for _ in range(WINDOW_FRAMES - 1):
+        governor.record(mock_game, governor.budget_ms * 10)
+
+    assert governor.level == 0
+
+
+def test_skips_steps_already_off(mock_game: MockGame) -> None:
+    """Test that features disabled by the configuration are not counted as steps."""
+    mock_game.ai_configuration.use_stars = False
+    mock_game.ai_configuration.star_count = 0
+
+    governor = QualityGovernor(mock_game.ai_configuration)
+
+    assert [setting for _, setting, _ in governor.steps] == ["use_gradient_background", "hud_translucency"]
+
+
+def test_changes_are_logged(mock_game: MockGame, caplog: pytest.LogCaptureFixture) -> None:
+    """Test that every quality change is logged."""
+    governor = QualityGovernor(mock_game.ai_configuration)
+
+    with caplog.at_level(logging.INFO, logger="src.config.rendering.quality_governor"):
+        run_frames(governor, mock_game, governor.budget_ms * 2)
+        run_frames(governor, mock_game, 0.0)
+
+    assert "quality down to level 1: half the stars" in caplog.text
+    assert "quality up to level 0: undo half the stars" in caplog.text
+
+
+def test_opaque_hud_renders_labels_again(mock_game: MockGame) -> None:
+    """Test that turning HUD translucency off re-renders the scoreboard without alpha."""
+    governor = QualityGovernor(mock_game.ai_configuration)
+    run_frames(governor, mock_game, governor.budget_ms * 2, windows=len(QUALITY_STEPS))
+
+    mock_game.scoreboard.show_score()
+
+    assert mock_game.scoreboard.score_image.get_alpha() is None
+
+
+def test_update_stars_follows_star_count(mock_game: MockGame) -> None:
+    """Test that lowering the star count draws fewer stars without forgetting the others."""
+    game_rendering.stars.clear()
+    game_rendering.update_stars(mock_game)
+    star_count = mock_game.ai_configuration.star_count
+
+    mock_game.ai_configuration.star_count = star_count // 2
+    game_rendering.update_stars(mock_game)
+    mock_game.ai_configuration.star_count = star_count
+    game_rendering.update_stars(mock_game)
+
+    assert len(game_rendering.stars) == star_count
+    game_rendering.stars.clear()
@@ -0,0 +1,118 @@
+"""Tests for the layered configuration and performance profiles."""
+
+import json
+import logging
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.config.configuration import Configuration
+from src.config.profiles import PERFORMANCE_PROFILES, PROFILE_FRAME_MS, measure_frame_ms, select_profile
+
+
+def write_settings(tmp_path: Path, settings: dict) -> str:
+    """Write a settings file and return its path."""
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps(settings), encoding="utf-8")
+    return str(path)
+
+
+def test_first_launch_detects_and_saves_profile(tmp_path: Path) -> None:
+    """Test that the first launch benchmarks the machine once and remembers the profile."""
+    path = str(tmp_path / "settings.json")
+
+    with patch("src.config.configuration.detect_profile", return_value="low") as detect:
+        configuration = Configuration.load(path, environ={})
+        Configuration.load(path, environ={})
+
+    detect.assert_called_once()
+    assert configuration.performance_profile == "low"
+    assert configuration.frame_rate == PERFORMANCE_PROFILES["low"]["frame_rate"]
+    assert json.loads(Path(path).read_text(encoding="utf-8")) == {"profile": "low"}
+
+
+def test_layers_override_in_order(tmp_path: Path) -> None:
+    """Test that the settings file overrides the profile and the environment overrides both."""
+    path = write_settings(tmp_path, {"profile": "ultra", "star_count": 42, "show_fps": True, "frame_rate": 90})
+
+    configuration = Configuration.load(
+        path, environ={"ALIEN_INVASION_CFG_FRAME_RATE": "45", "ALIEN_INVASION_CFG_BULLET_COLOR": "1,2,3", "HOME": "/"}
+    )
+
+    assert configuration.performance_profile == "ultra"
+    assert configuration.precise_collisions is True
+    assert configuration.star_count == 42
+    assert configuration.show_fps is True
+    assert configuration.frame_rate == 45
+    assert configuration.bullet_color == (1, 2, 3)
+
+
+def test_environment_selects_profile(tmp_path: Path) -> None:
+    """Test that a profile named in the environment wins over the settings file."""
+    path = write_settings(tmp_path, {"profile": "ultra"})
+
+    configuration = Configuration.load(path, environ={"ALIEN_INVASION_CFG_PROFILE": "medium"})
+
+    assert configuration.performance_profile == "medium"
+    assert configuration.star_count == PERFORMANCE_PROFILES["medium"]["star_count"]
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [{"profile": "potato"}, {"profile": "high", "no_such_setting": 1}, {"profile": "high", "star_count": "many"}],
+)
+def test_invalid_settings_are_skipped(tmp_path: Path, settings: dict) -> None:
+    """Test that unknown profiles, names and unconvertible values fall back to the defaults."""
+    configuration = Configuration.load(write_settings(tmp_path, settings), environ={"ALIEN_INVASION_CFG_SHOW_FPS": "maybe"})
+
+    assert configuration.performance_profile == "high"
+    assert configuration.star_count == PERFORMANCE_PROFILES["high"]["star_count"]
+    assert configuration.show_fps is False
+
+
+def test_profiles_set_known_settings() -> None:
+    """Test that every profile only names existing settings."""
+    configuration = Configuration()
+
+    for profile in PERFORMANCE_PROFILES.values():
+        for name in profile:
+            assert hasattr(configuration, name)
+
+
+def test_select_profile_by_frame_time() -> None:
+    """Test that faster frames pick richer profiles."""
+    assert select_profile(PROFILE_FRAME_MS["ultra"] / 2) == "ultra"
+    assert select_profile(PROFILE_FRAME_MS["ultra"] + 0.1) == "high"
+    assert select_profile(PROFILE_FRAME_MS["medium"]) == "medium"
+    assert select_profile(PROFILE_FRAME_MS["medium"] * 10) == "low"
+
+
+def test_measure_frame_ms() -> None:
+    """Test that the benchmark reports a positive frame time."""
+    assert measure_frame_ms(frames=2, size=(320, 180)) > 0
+
+
+@pytest.mark.parametrize(
+    "settings", [{"broadphase": "octree"}, {"frame_rate": 0}, {"idle_frame_rate": -4}, {"frame_rate": "0"}]
+)
+def test_unusable_values_are_skipped(tmp_path: Path, settings: dict) -> None:
+    """Test that values of the right type the game cannot use fall back to the earlier layer."""
+    defaults = Configuration()
+    path = write_settings(tmp_path, {"profile": "high", **settings})
+
+    configuration = Configuration.load(path, environ={})
+
+    assert configuration.broadphase == defaults.broadphase
+    assert configuration.frame_rate == PERFORMANCE_PROFILES["high"]["frame_rate"]
+    assert configuration.idle_frame_rate == defaults.idle_frame_rate
+
+
+def test_secrets_sharing_the_game_prefix_are_not_settings(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Test that the high score encryption variables are not read as settings."""
+    environ = {"ALIEN_INVASION_SALT": "salt", "ALIEN_INVASION_PASSWORD": "secret"}
+
+    with caplog.at_level(logging.WARNING):
+        Configuration.load(write_settings(tmp_path, {"profile": "high"}), environ=environ)
+
+    assert "Ignoring" not in caplog.text
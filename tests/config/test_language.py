@@ -16,8 +16,68 @@ def test_language_initialization(language: Language) -> None:
     assert isinstance(language, Language)
     assert language.current_language in Language.SUPPORTED_LANGUAGES
     assert isinstance(language.translations, dict)
-    for lang in Language.SUPPORTED_LANGUAGES:
-        assert lang in language.translations
+    # Only the current language and the English fallback are read at startup
+    assert set(language.translations) == {language.current_language, Language.DEFAULT_LANGUAGE}
+
+
+def test_set_language_loads_on_demand(language: Language) -> None:
+    """Test that a language's translations are read on its first selection."""
+    language.set_language("en")
+    assert "fr" not in language.translations
+
+    assert language.set_language("fr") is True
+
+    assert "fr" in language.translations
+    assert language.get_text("play") == language.translations["fr"]["play"]
+
+
+class Listener:
+    """Counts language change notifications."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def changed(self) -> None:
+        self.calls += 1
+
+
+def test_listeners_notified_on_change_only(language: Language) -> None:
+    """Test that listeners hear about actual language changes only."""
+    language.set_language("en")
+    listener = Listener()
+    language.add_listener(listener.changed)
+
+    language.set_language("en")
+    assert listener.calls == 0
+    language.set_language("es")
+    assert listener.calls == 1
+
+
+def test_listeners_are_held_weakly(language: Language) -> None:
+    """Test that a listener's object can be released without unregistering."""
+    language.add_listener(Listener().changed)
+
+    language.set_language("es" if language.current_language != "es" else "fr")
+
+    assert language._listeners == []
+
+
+def test_next_language_wraps_around(language: Language) -> None:
+    """Test that next_language() cycles through the available languages."""
+    available = language.get_available_languages()
+    language.set_language(available[-1])
+
+    assert language.next_language() == available[0]
+    assert language.next_language() == available[1]
+
+
+def test_missing_key_falls_back_to_english(language: Language) -> None:
+    """Test that a key missing from the current language uses the English text."""
+    language.set_language("es")
+    del language.translations["es"]["play"]
+    language.set_language("es")
+
+    assert language.get_text("play") == "Play"
 
 
 # Test data for parametrized language tests
@@ -292,7 +352,8 @@ def test_translation_file_loading(language: Language) -> None:
     # Verify all supported languages
     for lang in Language.SUPPORTED_LANGUAGES:
         # Check language translations dictionary exists
-        assert lang in language.translations, f"Language '{lang}' not loaded"
+        assert language.set_language(lang)
+        assert language.translations[lang], f"Language '{lang}' not loaded"
 
         # Check all required keys exist and have valid values
         for key in required_keys:
@@ -0,0 +1,66 @@
+"""Tests for the precompiled translation bundle."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+import src.config.language.translation_bundle as translation_bundle
+from src.config.language.language import Language
+from src.config.language.translation_bundle import TranslationBundle, compile_translations
+
+TRANSLATIONS_DIR = "src/assets/translations"
+
+
+@pytest.fixture
+def installed_bundle() -> Iterator[None]:
+    """Install a bundle whose Spanish title differs from the JSON file for the duration of a test."""
+    bundle = TranslationBundle(compile_translations(TRANSLATIONS_DIR))
+    bundle._languages["es"] = tuple(
+        "bundled" if key == "play" else value for key, value in zip(bundle._keys, bundle._languages["es"])
+    )
+    previous = (translation_bundle._bundle, translation_bundle._bundle_checked)
+    translation_bundle._bundle, translation_bundle._bundle_checked = bundle, True
+    yield
+    translation_bundle._bundle, translation_bundle._bundle_checked = previous
+
+
+def test_bundle_matches_sources() -> None:
+    """Test that every language in the bundle has exactly the texts of its JSON file."""
+    bundle = TranslationBundle(compile_translations(TRANSLATIONS_DIR))
+
+    filenames = sorted(name for name in os.listdir(TRANSLATIONS_DIR) if name.endswith(".json"))
+    assert bundle.languages() == sorted(name[: -len(".json")] for name in filenames)
+    for filename in filenames:
+        with open(os.path.join(TRANSLATIONS_DIR, filename), encoding="utf-8") as f:
+            assert bundle.translations(filename[: -len(".json")]) == json.load(f), filename
+
+
+def test_build_script_output_is_consistent_with_sources(tmp_path: Path) -> None:
+    """Test that the build step writes byte for byte what the sources compile to."""
+    output = tmp_path / "translations.bin"
+
+    subprocess.run([sys.executable, "tools/build-translations.py", str(output)], check=True, capture_output=True)
+
+    assert output.read_bytes() == compile_translations(TRANSLATIONS_DIR)
+
+
+def test_bundle_rejects_invalid_data() -> None:
+    """Test that data without the bundle header, or with a corrupt body, is rejected."""
+    with pytest.raises(ValueError, match="Not a translation bundle"):
+        TranslationBundle(b"{}")
+    with pytest.raises(ValueError, match="corrupt"):
+        TranslationBundle(translation_bundle.MAGIC + b"\x00")
+
+
+def test_language_prefers_bundle(installed_bundle: None) -> None:
+    """Test that Language reads its translations from the bundle when one is shipped."""
+    language = Language()
+
+    assert language.get_available_languages() == Language.SUPPORTED_LANGUAGES
+    assert language.set_language("es")
+    assert language.get_text("play") == "bundled"
@@ -7,13 +7,18 @@ import pytest
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
 
-from pygame.sprite import Group
 
+from src.config.actors.game_actors import FleetPrebuilder, FleetSpawner
 from src.config.configuration import Configuration
 from src.config.controls.gamepad_controls import GamepadManager
 from src.config.language.language import Language
 from src.config.music.music import Music
+from src.config.power.power_saver import PowerSaver
+from src.config.rendering.quality_governor import QualityGovernor
 from src.config.statistics.statistics import Statistics
+from src.core.entity_store import EntityGroup
+from src.core.resource_manager import ResourceManager
+from src.entities.alien import Alien
 from src.entities.button import Button
 from src.entities.controls_screen import ControlsScreen
 from src.entities.gamepad_config_screen import GamepadConfigScreen
@@ -26,15 +31,24 @@ from src.game import Game
 class MockGame(Game):
     def __init__(self) -> None:
         pygame.init()
+        self.resource_manager = ResourceManager()
         self.ai_configuration = Configuration()
         self.screen = pygame.display.set_mode((self.ai_configuration.screen_width, self.ai_configuration.screen_height))
         self.statistics = Statistics(self.ai_configuration)
+        self.quality_governor = QualityGovernor(self.ai_configuration)
+        self.power_saver = PowerSaver()
         self.language = Language()
+        self.language.add_listener(self.on_language_changed)
         self.music = Music()
+        Alien.bind(self.ai_configuration, self.screen, self.music)
         self.gamepad = GamepadManager(enabled=False)  # Disabled for testing
         self.ship = Ship(self.ai_configuration, self.screen, self.statistics, self.music)
-        self.bullets: Group = Group()
-        self.aliens: Group = Group()
+        self.bullets = EntityGroup("bullets")
+        self.aliens = EntityGroup("aliens")
+        self.fleet_spawner = FleetSpawner()
+        self.fleet_prebuilder = FleetPrebuilder()
+        self.pending_resize = None
+        self.resize_requested_at = 0
         self.play_button = Button(self.ai_configuration, self.screen, self.language.get_text("play"))
         self.scoreboard = Scoreboard(self.ai_configuration, self.screen, self.statistics, self.language)
         self.controls_screen = ControlsScreen(self.ai_configuration, self.screen, self.language)
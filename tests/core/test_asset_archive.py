@@ -0,0 +1,102 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pygame
+import pytest
+
+import src.core.asset_archive as asset_archive
+from src.config.language.language import Language
+from src.core.asset_archive import AssetArchive, open_asset, write_asset_archive
+from src.core.resource_manager import ResourceManager
+
+ALIEN_IMAGE = "src/assets/images/alien.png"
+SPANISH = "src/assets/translations/es.json"
+
+
+@pytest.fixture
+def archive_path(tmp_path: Path) -> Path:
+    """Pack a small archive with one image and one translation."""
+    path = tmp_path / "assets.pak"
+    write_asset_archive(path, {ALIEN_IMAGE: ALIEN_IMAGE, SPANISH: SPANISH})
+    return path
+
+
+@pytest.fixture
+def bundled_archive(archive_path: Path) -> Iterator[AssetArchive]:
+    """Install the packed archive as the bundled archive for the duration of a test."""
+    archive = AssetArchive(archive_path)
+    previous = (asset_archive._archive, asset_archive._archive_checked)
+    asset_archive._archive, asset_archive._archive_checked = archive, True
+    yield archive
+    asset_archive._archive, asset_archive._archive_checked = previous
+
+
+def test_archive_round_trip(archive_path: Path) -> None:
+    """Test that packed assets are returned byte for byte."""
+    archive = AssetArchive(archive_path)
+
+    assert len(archive) == 2
+    assert ALIEN_IMAGE in archive
+    data = archive.read(ALIEN_IMAGE)
+    assert data is not None
+    assert bytes(data) == Path(ALIEN_IMAGE).read_bytes()
+    assert archive.read("src/assets/images/missing.png") is None
+
+
+def test_archive_is_deterministic(tmp_path: Path) -> None:
+    """Test that packing the same files twice produces identical archives."""
+    files = {SPANISH: SPANISH, ALIEN_IMAGE: ALIEN_IMAGE}
+    write_asset_archive(tmp_path / "a.pak", files)
+    write_asset_archive(tmp_path / "b.pak", dict(reversed(list(files.items()))))
+
+    assert (tmp_path / "a.pak").read_bytes() == (tmp_path / "b.pak").read_bytes()
+
+
+def test_pack_script_leaves_translations_to_the_bundle(tmp_path: Path) -> None:
+    """Test that the packed archive holds images but no translations, which ship in translations.bin."""
+    output = tmp_path / "assets.pak"
+
+    subprocess.run([sys.executable, "tools/pack-assets.py", str(output)], check=True, capture_output=True)
+
+    archive = AssetArchive(output)
+    assert ALIEN_IMAGE in archive
+    assert list(archive.names("src/assets/translations")) == []
+    archive.close()
+
+
+def test_archive_rejects_invalid_file(tmp_path: Path) -> None:
+    """Test that a file without the archive header is rejected."""
+    path = tmp_path / "bogus.pak"
+    path.write_bytes(b"not an archive at all")
+
+    with pytest.raises(ValueError):
+        AssetArchive(path)
+
+
+def test_open_asset_without_archive() -> None:
+    """Test that development checkouts fall back to loose files."""
+    assert asset_archive.get_asset_archive() is None
+    assert open_asset(ALIEN_IMAGE) is None
+
+
+def test_resource_manager_loads_from_archive(bundled_archive: AssetArchive) -> None:
+    """Test that images are decoded from the archive when one is bundled."""
+    pygame.init()
+    pygame.display.set_mode((640, 480))
+
+    image = ResourceManager._decode_image(ALIEN_IMAGE, "does/not/exist.png")
+
+    assert image.get_size() == pygame.image.load(ALIEN_IMAGE).get_size()
+
+
+def test_language_loads_translations_from_archive(bundled_archive: AssetArchive) -> None:
+    """Test that translations are read from the archive when one is bundled."""
+    language = Language()
+
+    assert language.get_available_languages() == ["es"]
+    assert language.set_language("es")
+    with open(SPANISH, encoding="utf-8") as f:
+        assert language.translations["es"] == json.load(f)
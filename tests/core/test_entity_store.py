@@ -0,0 +1,133 @@
+from typing import Tuple
+
+import pygame
+import pytest
+from pygame.sprite import Group
+
+from src.core.entity_store import (
+    EntityGroup,
+    EntitySprite,
+    fill_system,
+    movement_system,
+    render_system,
+    sync_rects,
+    translate_system,
+)
+
+
+class Dot(EntitySprite):
+    """Minimal entity used to exercise the store."""
+
+    def __init__(self, x: float, y: float, vy: float = 0.0) -> None:
+        super().__init__()
+        self.image = pygame.Surface((4, 4))
+        self.rect = self.image.get_rect(topleft=(int(x), int(y)))
+        self.x = x
+        self.y = y
+        self.vy = vy
+
+    def velocity(self) -> Tuple[float, float]:
+        return 0.0, self.vy
+
+
+def test_position_moves_into_archetype_and_back() -> None:
+    """Test that x and y are stored in the archetype while grouped and restored when removed."""
+    group = EntityGroup("dots")
+    dot = Dot(10.5, 20.0)
+
+    group.add(dot)
+    group.archetype.x[0] = 42.0
+    assert dot.x == 42.0
+
+    dot.kill()
+    assert dot.x == 42.0
+    assert len(group.archetype) == 0
+
+
+def test_freed_slots_are_reused() -> None:
+    """Test that a despawned entity's slot is handed to the next one."""
+    group = EntityGroup("dots")
+    first, second, third = Dot(0, 0), Dot(1, 1), Dot(2, 2)
+    group.add(first, second)
+
+    first.kill()
+    group.add(third)
+
+    assert len(group.archetype.alive) == 2
+    assert sorted(group.archetype.indices()) == [0, 1]
+    assert third.x == 2.0
+
+
+def test_sprite_cannot_join_two_entity_groups() -> None:
+    """Test that a sprite's components live in a single archetype."""
+    dot = Dot(0, 0)
+    EntityGroup("a").add(dot)
+
+    with pytest.raises(ValueError):
+        EntityGroup("b").add(dot)
+
+
+def test_copy_returns_plain_group() -> None:
+    """Test that copying an EntityGroup does not move sprites out of its archetype."""
+    group = EntityGroup("dots", Dot(0, 0))
+
+    copy = group.copy()
+
+    assert type(copy) is Group
+    assert len(group.archetype) == 1
+
+
+def test_movement_system_applies_velocity_and_shared_offset() -> None:
+    """Test that the movement system updates positions and rects in one pass."""
+    group = EntityGroup("dots")
+    dot = Dot(10.0, 50.0, vy=-2.5)
+    group.add(dot)
+
+    movement_system(group.archetype, dx=1.5)
+
+    assert (dot.x, dot.y) == (11.5, 47.5)
+    assert dot.rect.topleft == (11, 47)
+
+
+def test_render_and_fill_systems_draw_at_stored_positions() -> None:
+    """Test that the render systems read positions from the archetype."""
+    surface = pygame.Surface((20, 20))
+    group = EntityGroup("dots")
+    dot = Dot(5.0, 5.0)
+    assert dot.image is not None
+    dot.image.fill((255, 0, 0))
+    group.add(dot)
+
+    render_system(group.archetype, surface)
+    assert surface.get_at((6, 6))[:3] == (255, 0, 0)
+
+    fill_system(group.archetype, surface, (0, 0, 255))
+    assert surface.get_at((6, 6))[:3] == (0, 0, 255)
+
+
+def test_translate_system_moves_origin_and_defers_rects() -> None:
+    """Test that translating a group only moves its origin until the rects are synced."""
+    group = EntityGroup("dots")
+    dot = Dot(10.0, 20.0)
+    group.add(dot)
+
+    translate_system(group.archetype, dx=5.0, dy=2.0)
+
+    assert (dot.x, dot.y) == (15.0, 22.0)
+    assert group.archetype.x[0] == 10.0
+    assert dot.rect.topleft == (10, 20)
+
+    sync_rects(group.archetype)
+    assert dot.rect.topleft == (15, 22)
+
+
+def test_spawn_after_translate_keeps_screen_position() -> None:
+    """Test that entities added to a moved group keep their screen position."""
+    group = EntityGroup("dots", Dot(0.0, 0.0))
+    translate_system(group.archetype, dx=8.0)
+    late = Dot(30.0, 4.0)
+
+    group.add(late)
+
+    assert (late.x, late.y) == (30.0, 4.0)
+    assert group.archetype.bounds() == (8.0, 0.0, 34.0, 8.0)
@@ -1,10 +1,11 @@
 import os
-from typing import Tuple
+from typing import Iterator, List, Tuple
 
 import pygame
 import pytest
 
 from src.config.music.music import Music
+from src.config.music.voices import DEFAULT_CATEGORIES
 from src.config.statistics.statistics import Statistics
 
 # Setting up headless mode for Pygame
@@ -12,12 +13,28 @@ os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
 
 # Import game modules after setting up the environment
+from src import game as game_module
 from src.config.configuration import Configuration
 from src.config.language.language import Language
 from src.entities.button import Button
 from src.entities.controls_screen import ControlsScreen
 from src.entities.scoreboard import Scoreboard
 from src.entities.ship import Ship
+from src.game import Game
+
+
+@pytest.fixture
+def fresh_mixer(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Close the mixer and drop the shared Music manager, so a Game starts audio from scratch."""
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    # Skip the first launch benchmark, which would write a settings file
+    monkeypatch.setenv("ALIEN_INVASION_CFG_PROFILE", "high")
+    pygame.mixer.quit()
+    previous = Music._instance
+    Music._instance = None
+    yield
+    Music._instance = previous
+    pygame.mixer.quit()
 
 
 @pytest.fixture
@@ -159,3 +176,41 @@ def test_sound_effects(game_setup: Tuple[Configuration, pygame.Surface, Statisti
     # Test volume control
     music.volume = 0.7
     assert 0 <= music.volume <= 1.0
+
+
+def test_game_configures_mixer_before_music(fresh_mixer: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the mixer is configured before any sound is loaded, keeping the reserved channels."""
+    calls: List[str] = []
+    reserved: List[int] = []
+    original_configure = game_module.configure_mixer
+    original_music_init = Music.__init__
+    original_set_reserved = pygame.mixer.set_reserved
+    original_quit = pygame.mixer.quit
+
+    def configure_mixer(buffer_size: int) -> bool:
+        calls.append("configure_mixer")
+        return original_configure(buffer_size)
+
+    def music_init(self: Music) -> None:
+        if not self._initialized:
+            calls.append("Music")
+        original_music_init(self)
+
+    def set_reserved(count: int) -> int:
+        reserved.append(count)
+        return original_set_reserved(count)
+
+    def quit_mixer() -> None:
+        # Closing the mixer forgets its reserved channels
+        reserved.clear()
+        original_quit()
+
+    monkeypatch.setattr(game_module, "configure_mixer", configure_mixer)
+    monkeypatch.setattr(Music, "__init__", music_init)
+    monkeypatch.setattr(pygame.mixer, "set_reserved", set_reserved)
+    monkeypatch.setattr(pygame.mixer, "quit", quit_mixer)
+
+    Game()
+
+    assert calls[:2] == ["configure_mixer", "Music"]
+    assert reserved == [sum(category.channels for category in DEFAULT_CATEGORIES.values())]
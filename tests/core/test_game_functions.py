@@ -8,7 +8,8 @@ os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
 
 import src.config.rendering.game_rendering as rendering
 from src.config.actors.game_actors import create_fleet
-from src.config.logic.game_logic import check_bullet_alien_collisions, get_grid_cells, spatial_grid, update_spatial_grid
+from src.config.logic.broadphase import build_spatial_grid, get_grid_cells, spatial_grid
+from src.config.logic.game_logic import check_bullet_alien_collisions, swept_bullets
 from src.config.rendering.game_rendering import create_gradient_surface, fire_bullet, stars, update_stars
 from src.entities.bullet import Bullet
 from tests.conftest import MockGame
@@ -168,8 +169,8 @@ def test_spatial_grid(mock_game: MockGame) -> None:
     # Position bullet and alien in the same grid cell
     bullet.rect.center = alien.rect.center
 
-    # Update spatial grid
-    update_spatial_grid(mock_game)
+    # Build the spatial grid
+    build_spatial_grid(mock_game.aliens, swept_bullets(mock_game))
 
     # Get the grid cells for the bullet and alien
     bullet_cells = get_grid_cells(bullet.rect)
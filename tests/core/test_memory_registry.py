@@ -0,0 +1,100 @@
+"""Tests for the memory registry."""
+
+from typing import Iterator, List
+
+import pygame
+import pytest
+
+from src.core import memory_registry
+from src.core.memory_registry import (
+    MemoryRecord,
+    clear_tracked,
+    format_memory_report,
+    memory_report,
+    register_source,
+    surface_bytes,
+    track,
+)
+from src.core.resource_manager import ResourceManager
+
+
+@pytest.fixture(autouse=True)
+def empty_registry() -> Iterator[None]:
+    """Start and end every test with no tracked assets or extra sources."""
+    sources = dict(memory_registry._sources)
+    clear_tracked()
+    yield
+    clear_tracked()
+    memory_registry._sources.clear()
+    memory_registry._sources.update(sources)
+
+
+def tracked(owner: str) -> List[MemoryRecord]:
+    """Return the report entries of one owner."""
+    return [record for record in memory_report() if record.owner == owner]
+
+
+def test_track_reports_size_and_owner() -> None:
+    """Test that a tracked surface is reported with its owner and byte size."""
+    surface = track("Test", "panel", pygame.Surface((20, 10)))
+
+    assert tracked("Test") == [MemoryRecord("Test", "panel", surface_bytes(surface), 1)]
+
+
+def test_track_same_name_replaces_and_counts_allocations() -> None:
+    """Test that tracking a name again replaces the asset and counts the allocation."""
+    track("Test", "overlay", pygame.Surface((10, 10)))
+    second = track("Test", "overlay", pygame.Surface((30, 30)))
+
+    assert tracked("Test") == [MemoryRecord("Test", "overlay", surface_bytes(second), 2)]
+
+
+def test_released_assets_stay_in_the_report() -> None:
+    """Test that per-frame surfaces are reported as released with their allocation count and last size."""
+    for _ in range(100):
+        track("Test", "temporary", pygame.Surface((10, 10)))
+
+    assert tracked("Test") == [MemoryRecord("Test", "temporary", surface_bytes(pygame.Surface((10, 10))), 100, False)]
+
+
+def test_report_is_sorted_largest_first() -> None:
+    """Test that entries are ordered by size, largest first."""
+    small = track("Test", "small", pygame.Surface((4, 4)))
+    large = track("Test", "large", pygame.Surface((40, 40)))
+    register_source("Cache", lambda: [("middle", surface_bytes(small) + 1)])
+
+    records = [record for record in memory_report() if record.owner in ("Test", "Cache")]
+
+    assert [record.size for record in records] == sorted((record.size for record in records), reverse=True)
+    assert [record.name for record in records] == ["large", "middle", "small"]
+    assert records[0].size == surface_bytes(large)
+
+
+def test_resource_manager_entries_are_reported() -> None:
+    """Test that images cached by the ResourceManager appear in the report."""
+    pygame.init()
+    pygame.display.set_mode((640, 480))
+    previous = ResourceManager._instance
+    ResourceManager._instance = None
+    ResourceManager().get_image("src/assets/images/ship.png")
+
+    names = [record.name for record in tracked("ResourceManager")]
+    ResourceManager._instance = previous
+
+    assert "image ship.png" in names
+
+
+def test_format_memory_report_totals() -> None:
+    """Test that the formatted report ends with per-owner and overall totals."""
+    records = [
+        MemoryRecord("A", "one", 2048, 1),
+        MemoryRecord("B", "two", 1024, 3),
+        MemoryRecord("B", "old", 512, 60, False),
+    ]
+
+    lines = format_memory_report(records)
+
+    assert lines[3].split() == ["0.5", "60", "B", "old", "(released)"]
+    assert lines[-3].split() == ["2.0", "A", "total"]
+    assert lines[-2].split() == ["1.0", "B", "total"]
+    assert lines[-1].split() == ["3.0", "all", "total"]
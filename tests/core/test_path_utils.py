@@ -9,7 +9,15 @@ from unittest.mock import patch
 
 import pytest
 
-from src.core.path_utils import ensure_data_directory, get_app_directory, load_json_file, resource_path, save_json_file
+from src.core.path_utils import (
+    _resolve_resource_path,
+    clear_resource_path_cache,
+    ensure_data_directory,
+    get_app_directory,
+    load_json_file,
+    resource_path,
+    save_json_file,
+)
 
 
 def test_get_app_directory_from_source() -> None:
@@ -294,3 +302,38 @@ def test_save_json_file_error() -> None:
 
     # May succeed or fail depending on permissions, so just check it's a boolean
     assert isinstance(result, bool)
+
+
+def test_resource_path_is_memoized() -> None:
+    """Test that resolving the same path twice reuses the memoized result."""
+    clear_resource_path_cache()
+    with patch("sys.frozen", False, create=True):
+        first = resource_path("src/assets/images/alien.png")
+        second = resource_path("src/assets/images/alien.png")
+
+    assert first == second
+    cache_info = _resolve_resource_path.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+
+def test_resource_path_cache_follows_bundle_location() -> None:
+    """Test that memoized paths are not reused across bundle locations."""
+    with patch("sys.frozen", True, create=True):
+        with patch("sys.platform", "linux"):
+            with patch("sys._MEIPASS", "/tmp/first", create=True):
+                first = resource_path("test.txt")
+            with patch("sys._MEIPASS", "/tmp/second", create=True):
+                second = resource_path("test.txt")
+
+    assert first.startswith(os.path.normpath("/tmp/first"))
+    assert second.startswith(os.path.normpath("/tmp/second"))
+
+
+@pytest.mark.parametrize("frozen", [True, False])
+def test_resolve_resource_path_uses_bundle_dir_argument(frozen: bool) -> None:
+    """Test that the memoized resolver reads the bundle location it is keyed on, not global state."""
+    with patch("sys._MEIPASS", "/tmp/global", create=True):
+        result = _resolve_resource_path("test.txt", frozen, "linux", "/tmp/keyed")
+
+    assert result == os.path.normpath("/tmp/keyed/test.txt")
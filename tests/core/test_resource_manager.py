@@ -0,0 +1,165 @@
+from typing import Iterator
+
+import pygame
+import pytest
+
+from src.core.resource_manager import ResourceManager, surface_bytes
+
+ALIEN_IMAGE = "src/assets/images/alien.png"
+SHOOT_SOUND = "src/assets/sounds/shoot.wav"
+
+
+@pytest.fixture
+def resource_manager() -> Iterator[ResourceManager]:
+    """Provide a fresh ResourceManager and restore the shared singleton afterwards."""
+    pygame.init()
+    pygame.display.set_mode((640, 480))
+    previous = ResourceManager._instance
+    ResourceManager._instance = None
+    yield ResourceManager()
+    ResourceManager._instance = previous
+
+
+def test_scaled_image_cache_hit(resource_manager: ResourceManager) -> None:
+    """Test that requesting the same scale twice returns the cached surface."""
+    first = resource_manager.get_image(ALIEN_IMAGE, scale=(40, 30))
+    second = resource_manager.get_image(ALIEN_IMAGE, scale=(40, 30))
+
+    assert first is second
+    stats = resource_manager.get_cache_stats()
+    assert stats["scaled_entries"] == 1
+    assert stats["scaled_hits"] == 1
+    assert stats["scaled_misses"] == 1
+    assert stats["scaled_bytes"] == surface_bytes(first)
+
+
+def test_scaled_image_cache_evicts_least_recently_used(resource_manager: ResourceManager) -> None:
+    """Test that the scaled cache evicts the least recently used entry when over budget."""
+    small = resource_manager.get_image(ALIEN_IMAGE, scale=(10, 10))
+    medium = resource_manager.get_image(ALIEN_IMAGE, scale=(20, 20))
+    resource_manager.set_scaled_cache_budget(surface_bytes(small) + surface_bytes(medium))
+
+    # Touch the small image so the medium one becomes the least recently used
+    resource_manager.get_image(ALIEN_IMAGE, scale=(10, 10))
+    resource_manager.get_image(ALIEN_IMAGE, scale=(12, 12))
+
+    stats = resource_manager.get_cache_stats()
+    assert stats["scaled_evictions"] == 1
+    assert stats["scaled_bytes"] <= stats["scaled_budget"]
+    assert resource_manager.get_image(ALIEN_IMAGE, scale=(10, 10)) is small
+
+
+def test_clear_scaled_cache_keeps_base_images(resource_manager: ResourceManager) -> None:
+    """Test that clearing scaled images does not drop the base images."""
+    base = resource_manager.get_image(ALIEN_IMAGE)
+    resource_manager.get_image(ALIEN_IMAGE, scale=(40, 30))
+
+    resource_manager.clear_scaled_cache()
+
+    stats = resource_manager.get_cache_stats()
+    assert stats["scaled_entries"] == 0
+    assert stats["scaled_bytes"] == 0
+    assert resource_manager.get_image(ALIEN_IMAGE) is base
+
+
+def test_preload_decodes_images_in_background(resource_manager: ResourceManager) -> None:
+    """Test that preloaded images are cached once the job is finalized."""
+    job = resource_manager.preload(images=[ALIEN_IMAGE, "src/assets/images/ship.png"])
+
+    assert job.wait(timeout=5)
+    resource_manager.finalize_preload(job)
+
+    assert job.progress == 1.0
+    assert job.failures == {}
+    assert resource_manager.get_cache_stats()["images"] == 2
+
+
+def test_preload_records_missing_assets(resource_manager: ResourceManager) -> None:
+    """Test that a missing asset is reported without failing the whole batch."""
+    job = resource_manager.preload(images=[ALIEN_IMAGE, "src/assets/images/missing.png"])
+
+    assert job.wait(timeout=5)
+    resource_manager.finalize_preload(job)
+
+    assert len(job.failures) == 1
+    assert resource_manager.get_cache_stats()["images"] == 1
+
+
+def test_preload_skips_cached_assets(resource_manager: ResourceManager) -> None:
+    """Test that assets already in the cache are not decoded again."""
+    resource_manager.get_image(ALIEN_IMAGE)
+
+    job = resource_manager.preload(images=[ALIEN_IMAGE])
+
+    assert job.total == 0
+    assert job.ready.is_set()
+
+
+def test_register_image_is_idempotent() -> None:
+    """Test that registering the same path twice returns the same handle."""
+    handle = ResourceManager.register_image(ALIEN_IMAGE)
+
+    assert ResourceManager.register_image(ALIEN_IMAGE) == handle
+    assert ResourceManager.register_image("src/assets/images/ship.png") != handle
+
+
+def test_get_image_by_handle_matches_path_lookup(resource_manager: ResourceManager) -> None:
+    """Test that handle lookups share the cache with path lookups."""
+    handle = ResourceManager.register_image(ALIEN_IMAGE)
+
+    assert resource_manager.get_image_by_handle(handle) is resource_manager.get_image(ALIEN_IMAGE)
+    scaled = resource_manager.get_image_by_handle(handle, scale=(40, 30))
+    assert scaled is resource_manager.get_image(ALIEN_IMAGE, scale=(40, 30))
+
+
+def test_get_mask_is_built_once_per_surface(resource_manager: ResourceManager) -> None:
+    """Test that a scaled image's mask is cached and follows the surface's opaque pixels."""
+    image = resource_manager.get_image(ALIEN_IMAGE, scale=(70, 50))
+
+    mask = resource_manager.get_mask(image)
+
+    assert resource_manager.get_mask(image) is mask
+    assert mask.get_size() == image.get_size()
+    assert 0 < mask.count() < 70 * 50
+    assert resource_manager.get_cache_stats()["masks"] == 1
+
+    resource_manager.clear_scaled_cache()
+    assert resource_manager.get_cache_stats()["masks"] == 0
+
+
+def test_sound_bytes_are_tracked(resource_manager: ResourceManager, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that each cached sound's decoded size is counted in the cache stats."""
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.quit()
+    pygame.mixer.init()
+
+    sound = resource_manager.get_sound(SHOOT_SOUND)
+
+    stats = resource_manager.get_cache_stats()
+    assert stats["sounds"] == 1
+    assert stats["sound_bytes"] == len(sound.get_raw())
+    assert stats["image_bytes"] == 0
+    pygame.mixer.quit()
+
+
+def test_unload_idle_sounds_keeps_recent_sounds(resource_manager: ResourceManager, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that only sounds idle for long enough are unloaded, and only while over budget."""
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.quit()
+    pygame.mixer.init()
+    resource_manager.get_sound(SHOOT_SOUND)
+    resource_manager.set_sound_cache_budget(0)
+
+    assert resource_manager.unload_idle_sounds(idle_seconds=60) == 0
+    assert resource_manager.get_cache_stats()["sounds"] == 1
+
+    resource_manager.set_sound_cache_budget(10**9)
+    assert resource_manager.unload_idle_sounds(idle_seconds=0) == 0
+
+    resource_manager.set_sound_cache_budget(0)
+    assert resource_manager.unload_idle_sounds(idle_seconds=0) > 0
+    stats = resource_manager.get_cache_stats()
+    assert stats["sounds"] == 0
+    assert stats["sound_bytes"] == 0
+    assert stats["sound_unloads"] == 1
+    pygame.mixer.quit()
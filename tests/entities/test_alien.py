@@ -1,7 +1,9 @@
 import pygame
 import pytest
+from pygame.sprite import Group
 
 from src.config.configuration import Configuration
+from src.config.music.music import Music
 from src.entities.alien import Alien
 
 
@@ -11,7 +13,8 @@ def alien() -> Alien:
     pygame.init()
     screen = pygame.Surface((800, 600))
     ai_configuration = Configuration()
-    return Alien(ai_configuration, screen)
+    Alien.bind(ai_configuration, screen, Music())
+    return Alien()
 
 
 def test_alien_initialization(alien: Alien) -> None:
@@ -42,3 +45,43 @@ def test_alien_direction_change(alien: Alien) -> None:
 
     alien.rect.left = 0
     assert alien.check_edges() is True
+
+
+def test_alien_pool_reuses_released_alien(alien: Alien) -> None:
+    """Test that an alien returned to the pool is handed out again."""
+    Alien._alien_pool.clear()
+    alien.x = 500.0
+    alien.rect.x = 500
+
+    Alien.return_to_pool(alien)
+    reused = Alien.get_alien()
+
+    assert reused is alien
+    assert reused.in_pool is False
+    assert reused.rect.x == reused.rect.width
+    assert reused.x == float(reused.rect.x)
+
+
+def test_alien_pool_ignores_live_and_duplicate_aliens(alien: Alien) -> None:
+    """Test that aliens still in a group or already pooled are not pooled again."""
+    Alien._alien_pool.clear()
+    group: Group = Group(alien)
+
+    Alien.return_to_pool(alien)
+    assert Alien._alien_pool == []
+
+    group.remove(alien)
+    Alien.return_to_pool(alien)
+    Alien.return_to_pool(alien)
+    assert Alien._alien_pool == [alien]
+    Alien._alien_pool.clear()
+
+
+def test_alien_shares_fleet_state(alien: Alien) -> None:
+    """Test that the screen and configuration are shared by the class, not copied per alien."""
+    other = Alien()
+
+    assert other.screen is alien.screen
+    assert "screen" not in vars(alien)
+    assert "ai_configuration" not in vars(alien)
+    assert set(vars(alien)).isdisjoint(Alien.__slots__)
@@ -46,3 +46,11 @@ def test_bullet_deactivation(bullet: Bullet) -> None:
     bullet.y = -bullet.rect.height
     bullet.update()
     assert bullet.active is False
+
+
+def test_bullet_shares_color_and_speed(bullet: Bullet) -> None:
+    """Test that the color and speed are stored once on the class, not per bullet."""
+    assert bullet.color == Configuration().bullet_color
+    assert "color" not in vars(bullet)
+    assert "speed_factor" not in vars(bullet)
+    assert set(vars(bullet)).isdisjoint(Bullet.__slots__)
@@ -41,3 +41,17 @@ def test_button_draw(button: Button) -> None:
     assert button.rect is not None
     assert button.msg_image is not None
     assert button.msg_image_rect is not None
+
+
+def test_button_set_msg_renders_on_next_draw(button: Button) -> None:
+    """Test that a new message is rendered when the button is drawn, and only if it changed."""
+    msg_image = button.msg_image
+
+    button.set_msg("Test Button")
+    assert button.msg_stale is False
+
+    button.set_msg("Jugar")
+    assert button.msg_image is msg_image
+    button.draw_button()
+    assert button.msg_image is not msg_image
+    assert button.msg == "Jugar"
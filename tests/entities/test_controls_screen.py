@@ -52,3 +52,15 @@ def test_controls_screen_text_positions(controls_screen: ControlsScreen) -> None
     # Continue text should be near the bottom center
     assert controls_screen.continue_rect.centerx == 400  # Screen width / 2
     assert controls_screen.continue_rect.bottom == 550  # Screen height - 50
+
+
+def test_controls_screen_language_change(controls_screen: ControlsScreen) -> None:
+    """Test that the texts are translated again on the next draw after a language change."""
+    controls_screen.language.set_language("en")
+    controls_screen.draw_controls()
+
+    controls_screen.language.set_language("es")
+    assert controls_screen.controls[1][1] == "Shoot"
+    controls_screen.draw_controls()
+
+    assert controls_screen.controls[1][1] == controls_screen.language.get_text("shoot") != "Shoot"
@@ -0,0 +1,34 @@
+import pygame
+import pytest
+
+from src.config.configuration import Configuration
+from src.entities.loading_screen import LoadingScreen
+
+
+@pytest.fixture
+def loading_screen() -> LoadingScreen:
+    """Create a loading screen instance for testing."""
+    pygame.init()
+    screen = pygame.Surface((1280, 720))
+    ai_configuration = Configuration()
+    ai_configuration.screen_width = 1280
+    ai_configuration.screen_height = 720
+    return LoadingScreen(ai_configuration, screen)
+
+
+def test_loading_screen_initialization(loading_screen: LoadingScreen) -> None:
+    """Test that the progress bar is centered on the screen."""
+    assert loading_screen.bar_rect.center == loading_screen.screen_rect.center
+    assert loading_screen.bar_rect.width > 0
+
+
+def test_loading_screen_draws_progress(loading_screen: LoadingScreen) -> None:
+    """Test that the filled part of the bar follows the progress."""
+    bar = loading_screen.bar_rect
+    inside_left = (bar.left + 5, bar.centery)
+    inside_right = (bar.right - 5, bar.centery)
+
+    loading_screen.draw(0.5)
+
+    assert loading_screen.screen.get_at(inside_left)[:3] == loading_screen.bar_color
+    assert loading_screen.screen.get_at(inside_right)[:3] == loading_screen.bg_color
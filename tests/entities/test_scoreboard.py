@@ -82,3 +82,31 @@ def test_scoreboard_ships_update(scoreboard: Scoreboard) -> None:
         assert ship.rect.y == 10
     # Restore initial ships
     scoreboard.statistics.ships_remaining = initial_ships
+
+
+def test_scoreboard_language_change_renders_on_next_draw(scoreboard: Scoreboard) -> None:
+    """Test that a language change re-renders the labels lazily, on the next draw only."""
+    score_image = scoreboard.score_image
+    scoreboard.language.set_language("en")
+
+    scoreboard.language.set_language("es")
+
+    assert scoreboard.score_image is score_image
+    scoreboard.show_score()
+    assert scoreboard.score_image is not score_image
+    assert scoreboard.text_stale is False
+
+
+def test_scoreboard_pause_overlay_is_cached(scoreboard: Scoreboard) -> None:
+    """Test that the pause overlay is rendered once and again only after a language change."""
+    scoreboard.statistics.game_paused = True
+    scoreboard.show_score()
+    pause_images = scoreboard.pause_images
+
+    scoreboard.show_score()
+    assert scoreboard.pause_images is pause_images
+
+    scoreboard.language.set_language("fr" if scoreboard.language.current_language != "fr" else "es")
+    assert scoreboard.pause_images is None
+    scoreboard.show_score()
+    assert scoreboard.pause_images is not None
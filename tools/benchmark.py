@@ -0,0 +1,435 @@
+"""Micro-benchmarks for Alien Invasion hot paths.
+
+Usage:
+    python tools/benchmark.py [benchmark ...]
+
+Runs every benchmark when none is named. Pygame uses SDL's dummy video and
+audio drivers, so no window is opened and no sound is played.
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Tuple, cast
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
+
+import pygame  # noqa: E402
+from pygame.sprite import Group, Sprite  # noqa: E402
+
+from src.config import profiles  # noqa: E402
+from src.config.actors import game_actors  # noqa: E402
+from src.config.configuration import Configuration  # noqa: E402
+from src.config.language.language import Language  # noqa: E402
+from src.config.language.translation_bundle import TranslationBundle, compile_translations  # noqa: E402
+from src.config.logic import broadphase, game_logic  # noqa: E402
+from src.config.music.music import Music  # noqa: E402
+from src.config.music.voices import VoiceManager, configure_mixer, mixer_latency_ms  # noqa: E402
+from src.config.statistics.statistics import Statistics  # noqa: E402
+from src.core.entity_store import EntityGroup, movement_system  # noqa: E402
+from src.core.path_utils import resource_path  # noqa: E402
+from src.core.resource_manager import ResourceManager  # noqa: E402
+from src.entities.alien import Alien, get_alien_image  # noqa: E402
+from src.entities.bullet import Bullet  # noqa: E402
+from src.entities.ship import Ship  # noqa: E402
+from src.game import Game  # noqa: E402
+
+RESOLUTIONS: Dict[str, Tuple[int, int]] = {"720p": (1280, 720), "1080p": (1920, 1080), "4K": (3840, 2160)}
+
+
+def make_game(width: int, height: int) -> Game:
+    """Build the subset of Game used by the gameplay functions, at a given resolution."""
+    pygame.init()
+    ai_configuration = Configuration()
+    ai_configuration.screen_width = width
+    ai_configuration.screen_height = height
+    screen = pygame.display.set_mode((width, height))
+    music = Music()
+    Alien.bind(ai_configuration, screen, music)
+    statistics = Statistics(ai_configuration)
+    ship = Ship(ai_configuration, screen, statistics, music)
+    fake = SimpleNamespace(
+        ai_configuration=ai_configuration,
+        screen=screen,
+        statistics=statistics,
+        ship=ship,
+        aliens=EntityGroup("aliens"),
+        bullets=EntityGroup("bullets"),
+        fleet_spawner=game_actors.FleetSpawner(),
+        fleet_prebuilder=game_actors.FleetPrebuilder(),
+    )
+    return cast(Game, fake)
+
+
+def timed(function: Callable[[], object], repeat: int) -> float:
+    """Return the mean wall time of a call in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def bench_create_fleet() -> List[str]:
+    """Time create_fleet at common resolutions, with and without a cached prototype."""
+    lines = [f"{'resolution':<10} {'aliens':>7} {'first (ms)':>11} {'cached (ms)':>12}"]
+    for name, (width, height) in RESOLUTIONS.items():
+        game = make_game(width, height)
+        game_actors._fleet_prototypes.clear()
+
+        def rebuild() -> None:
+            game.aliens.empty()
+            game_actors.create_fleet(game)
+
+        first = timed(rebuild, 1)
+        cached = timed(rebuild, 50)
+        lines.append(f"{name:<10} {len(game.aliens):>7} {first:>11.3f} {cached:>12.3f}")
+    return lines
+
+
+def bench_fleet_transition() -> List[str]:
+    """Compare the worst frame spent building a new fleet: at once, row by row, or prebuilt."""
+    lines = [f"{'resolution':<10} {'mode':<10} {'frames':>7} {'worst (ms)':>11}"]
+    for name, (width, height) in RESOLUTIONS.items():
+        game = make_game(width, height)
+        game_actors.create_fleet(game)
+        for mode in ("at once", "staggered", "prebuilt"):
+            game.ai_configuration.staggered_fleet_spawn = mode == "staggered"
+            worst = 0.0
+            frames = 0
+            for _ in range(20):
+                game_actors.clear_fleet(game)
+                if mode == "prebuilt":
+                    # Prepared during the previous level's last frames, outside the timed transition
+                    while not game.fleet_prebuilder.is_ready:
+                        game_actors.prebuild_next_fleet(game)
+                frames = 1
+                frame = timed(lambda: game_actors.create_fleet(game), 1)
+                while game.fleet_spawner.is_spawning:
+                    frame = max(frame, timed(lambda: game_actors.spawn_fleet_rows(game), 1))
+                    frames += 1
+                worst = max(worst, frame)
+            lines.append(f"{name:<10} {mode:<10} {frames:>7} {worst:>11.3f}")
+    return lines
+
+
+class DictAlien(Sprite):
+    """Reference alien that keeps all of its state in an instance __dict__."""
+
+    def __init__(self, ai_configuration: Configuration, screen: pygame.Surface, image: pygame.Surface) -> None:
+        super().__init__()
+        self.screen = screen
+        self.ai_configuration = ai_configuration
+        self.music = Music()
+        self.resource_manager = ResourceManager()
+        self.image = image
+        self.rect = image.get_rect()
+        self.x = float(self.rect.x)
+        self.in_pool = False
+
+
+def traced(function: Callable[[], object]) -> int:
+    """Return the number of bytes still allocated by a call once it returns."""
+    tracemalloc.start()
+    kept = function()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return allocated
+
+
+def bench_entity_memory() -> List[str]:
+    """Measure the memory held by 500 aliens and 500 bullets."""
+    count = 500
+    game = make_game(*RESOLUTIONS["720p"])
+    image = get_alien_image(game.ai_configuration)
+    cfg, screen = game.ai_configuration, game.screen
+    cases = {
+        "alien (__dict__)": lambda: [DictAlien(cfg, screen, image) for _ in range(count)],
+        "alien (slots)": lambda: [Alien(image) for _ in range(count)],
+        "bullet (slots)": lambda: [Bullet(cfg, screen, game.ship) for _ in range(count)],
+    }
+    lines = [f"{'entity':<18} {'total (KiB)':>12} {'per entity (B)':>15}"]
+    for name, build in cases.items():
+        build()  # warm up class-level and interpreter caches
+        allocated = traced(build)
+        lines.append(f"{name:<18} {allocated / 1024:>12.1f} {allocated / count:>15.0f}")
+    return lines
+
+
+def bench_entity_systems() -> List[str]:
+    """Compare moving and drawing aliens through Group dispatch and through entity systems."""
+    game = make_game(*RESOLUTIONS["1080p"])
+    cfg, screen = game.ai_configuration, game.screen
+    image = get_alien_image(cfg)
+    header = f"{'aliens':>7} {'Group.update':>13} {'movement':>9} {'Group.draw':>11} {'render':>8}"
+    lines = [header + "   (ms per frame)"]
+    for count in (50, 200, 1000):
+        group: Group = Group()
+        store = EntityGroup("aliens")
+        for _ in range(count):
+            group.add(Alien(image))
+            store.add(Alien(image))
+
+        update = timed(group.update, 200)
+        movement = timed(lambda: movement_system(store.archetype, dx=cfg.alien_speed_factor), 200)
+        draw = timed(lambda: Group.draw(group, screen), 200)
+        render = timed(lambda: store.draw(screen), 200)
+        lines.append(f"{count:>7} {update:>13.3f} {movement:>9.3f} {draw:>11.3f} {render:>8.3f}")
+        group.empty()
+        store.empty()
+    return lines
+
+
+def bench_update_aliens() -> List[str]:
+    """Time update_aliens against per-sprite edge checks and updates, across fleet sizes."""
+    game = make_game(*RESOLUTIONS["4K"])
+    cfg = game.ai_configuration
+    prototype = game_actors.get_fleet_prototype(game)
+    # Pack up to 80 aliens per row, overlapping as needed, so large fleets stay well above the ship
+    step_x = (cfg.screen_width - 3 * prototype.width) // 80
+    step_y = prototype.height // 8
+    lines = [f"{'aliens':>7} {'per sprite (ms)':>16} {'update_aliens (ms)':>19}"]
+    for count in (50, 200, 500, 1000, 2000):
+        positions = [(prototype.width + step_x * (i % 80), prototype.height + step_y * (i // 80)) for i in range(count)]
+        sprites: Group = Group(prototype.stamp(x, y) for x, y in positions)
+
+        def per_sprite() -> None:
+            for alien in sprites:
+                if alien.check_edges():
+                    for other in sprites:
+                        other.rect.y += cfg.fleet_drop_speed
+                    cfg.fleet_direction *= -1
+                    break
+            sprites.update()
+            pygame.sprite.spritecollideany(game.ship, sprites)
+
+        legacy = timed(per_sprite, 100)
+        sprites.empty()
+
+        game.aliens.add(prototype.stamp(x, y) for x, y in positions)
+        current = timed(lambda: game_logic.update_aliens(game), 100)
+        game.aliens.empty()
+        lines.append(f"{count:>7} {legacy:>16.3f} {current:>19.3f}")
+    return lines
+
+
+def bench_broadphase() -> List[str]:
+    """Compare the collision broadphases across fleet sizes and bullet counts."""
+    game = make_game(*RESOLUTIONS["4K"])
+    cfg, screen = game.ai_configuration, game.screen
+    prototype = game_actors.get_fleet_prototype(game)
+    game_actors.update_collision_cell_size(game)
+    step_x = (cfg.screen_width - 3 * prototype.width) // 80
+    step_y = prototype.height // 2
+    names = sorted(broadphase.BROADPHASES)
+    lines = [f"{'aliens':>7} {'bullets':>8} " + " ".join(f"{name:>15}" for name in names) + "   (ms per frame)"]
+    for count in (50, 200, 1000):
+        positions = [(prototype.width + step_x * (i % 80), prototype.height + step_y * (i // 80)) for i in range(count)]
+        game.aliens.add(prototype.stamp(x, y) for x, y in positions)
+        bottom = prototype.height + step_y * ((count - 1) // 80 + 1)
+        for bullets in (4, 20, 100):
+            for i in range(bullets):
+                bullet = Bullet(cfg, screen, game.ship)
+                bullet.x = float(prototype.width + (cfg.screen_width - 2 * prototype.width) * i // bullets)
+                bullet.y = float(prototype.height + (bottom - prototype.height) * (i % 7) // 7)
+                game.bullets.add(bullet)
+            game_logic.move_bullets(game)
+            times = []
+            for name in names:
+                cfg.broadphase = name
+                times.append(timed(lambda: game_logic.find_bullet_hits(game), 50))
+            lines.append(f"{count:>7} {bullets:>8} " + " ".join(f"{time:>15.3f}" for time in times))
+            game.bullets.empty()
+        game.aliens.empty()
+    return lines
+
+
+def bench_precise_collisions() -> List[str]:
+    """Compare bullet hit detection with rects only and with masks confirming rect hits."""
+    game = make_game(*RESOLUTIONS["1080p"])
+    cfg = game.ai_configuration
+    game_actors.create_fleet(game)
+    lines = [f"{'bullets':>8} {'rects (ms)':>11} {'masks (ms)':>11} {'rect hits':>10} {'mask hits':>10}"]
+    for count in (4, 20, 100):
+        aliens = game.aliens.sprites()
+        for i in range(count):
+            # Alternate between bullets aimed at an alien's centre and at its left border
+            alien = aliens[i % len(aliens)]
+            bullet = Bullet(cfg, game.screen, game.ship)
+            bullet.x = float(alien.rect.centerx if i % 2 else alien.rect.left - bullet.rect.width + 2)
+            bullet.y = float(alien.rect.bottom)
+            game.bullets.add(bullet)
+        game_logic.move_bullets(game)
+        results = []
+        for precise in (False, True):
+            cfg.precise_collisions = precise
+            results.append((timed(lambda: game_logic.find_bullet_hits(game), 200), len(game_logic.find_bullet_hits(game))))
+        (rects, rect_hits), (masks, mask_hits) = results
+        lines.append(f"{count:>8} {rects:>11.3f} {masks:>11.3f} {rect_hits:>10} {mask_hits:>10}")
+        game.bullets.empty()
+    return lines
+
+
+def bench_audio_startup() -> List[str]:
+    """Compare decoding every sound at startup with streaming music and loading rare effects lazily."""
+    pygame.mixer.init()
+    # music.mp3 is not shipped in development checkouts; its warning would repeat on every run
+    logging.getLogger("src.config.music.music").setLevel(logging.ERROR)
+    resource_manager = ResourceManager()
+    eager_paths = ["src/assets/sounds/shoot.wav", "src/assets/sounds/explosion.wav", "src/assets/sounds/game_over.wav"]
+
+    def eager() -> int:
+        return sum(len(pygame.mixer.Sound(resource_path(path)).get_raw()) for path in eager_paths)
+
+    def lazy() -> int:
+        resource_manager.clear_cache()
+        Music._instance = None
+        Music()
+        return resource_manager.get_cache_stats()["sound_bytes"]
+
+    lines = [f"{'loading':<8} {'startup (ms)':>13} {'decoded (KiB)':>14}"]
+    for name, load in (("eager", eager), ("lazy", lazy)):
+        lines.append(f"{name:<8} {timed(load, 10):>13.3f} {load() / 1024:>14.0f}")
+    return lines
+
+
+def bench_voices() -> List[str]:
+    """Simulate rapid fire with plain Sound.play() and with the voice manager, then report mixer latency."""
+    lines = [f"{'playback':<14} {'game over':>10} {'dropped':>8} {'play (us)':>10}"]
+    for mode in ("Sound.play", "VoiceManager"):
+        configure_mixer()
+        frequency, _, channels = pygame.mixer.get_init()
+        shot, explosion, game_over = (pygame.mixer.Sound(buffer=bytes(frequency * channels * 2)) for _ in range(3))
+        play: Callable[[pygame.mixer.Sound, str], Optional[pygame.mixer.Channel]] = lambda sound, _: sound.play()
+        if mode == "VoiceManager":
+            play = VoiceManager().play
+        plays = [(shot, "weapon")] * 4 + [(explosion, "impact")] * 3
+        dropped = 0
+        start = time.perf_counter()
+        # 30 frames of rapid fire and hits, then the game over sound
+        for _ in range(30):
+            for sound, category in plays:
+                dropped += play(sound, category) is None
+        elapsed = (time.perf_counter() - start) * 1e6 / (30 * len(plays))
+        outcome = "dropped" if play(game_over, "critical") is None else "played"
+        lines.append(f"{mode:<14} {outcome:>10} {dropped:>8} {elapsed:>10.1f}")
+    lines.append("")
+    lines.append(f"{'buffer':>7} {'latency (ms)':>13}")
+    for buffer_size in (256, 512, 1024, 2048):
+        configure_mixer(buffer_size)
+        lines.append(f"{buffer_size:>7} {mixer_latency_ms() or 0.0:>13.1f}")
+    return lines
+
+
+def bench_language_startup() -> List[str]:
+    """Compare parsing every translation at startup with loading the current language and English only."""
+
+    def eager() -> Language:
+        language = Language()
+        current = language.current_language
+        for language_code in language.get_available_languages():
+            language.set_language(language_code)
+        language.set_language(current)
+        return language
+
+    lines = [f"{'loading':<8} {'startup (ms)':>13} {'parsed':>7} {'held (KiB)':>11}"]
+    for name, load in (("eager", eager), ("lazy", Language)):
+        lines.append(f"{name:<8} {timed(load, 10):>13.3f} {len(load().translations):>7} {traced(load) / 1024:>11.1f}")
+
+    # Reading every language from the JSON files and from the precompiled bundle
+    translations_dir = resource_path(Language.TRANSLATIONS_DIR)
+    data = compile_translations(translations_dir)
+
+    def from_json() -> int:
+        for filename in os.listdir(translations_dir):
+            with open(os.path.join(translations_dir, filename), "r", encoding="utf-8") as f:
+                json.load(f)
+        return len(os.listdir(translations_dir))
+
+    def from_bundle() -> int:
+        bundle = TranslationBundle(data)
+        for language_code in bundle.languages():
+            bundle.translations(language_code)
+        return len(bundle.languages())
+
+    lines.append("")
+    lines.append(f"{'source':<8} {'all (ms)':>13} {'size (KiB)':>11}")
+    json_size = sum(os.path.getsize(os.path.join(translations_dir, filename)) for filename in os.listdir(translations_dir))
+    for name, read, size in (("json", from_json, json_size), ("bundle", from_bundle, len(data))):
+        lines.append(f"{name:<8} {timed(read, 10):>13.3f} {size / 1024:>11.1f}")
+    return lines
+
+
+def bench_profiles() -> List[str]:
+    """Run the first-launch profile detection and report its cost and outcome."""
+    start = time.perf_counter()
+    frame_ms = profiles.measure_frame_ms()
+    elapsed = (time.perf_counter() - start) * 1000
+    return [
+        f"{'frame (ms)':>11} {'detection (ms)':>15} {'profile':>8}",
+        f"{frame_ms:>11.3f} {elapsed:>15.1f} {profiles.select_profile(frame_ms):>8}",
+    ]
+
+
+def bench_idle_cpu() -> List[str]:
+    """Measure the CPU used by the main loop on the Play screen and while paused, with and without power saving."""
+    # Skip the first-launch profile benchmark, which would save its choice to the data directory
+    os.environ.setdefault("ALIEN_INVASION_CFG_PROFILE", "high")
+    game = Game()
+    lines = [f"{'state':<8} {'power saving':>13} {'CPU (%)':>8} {'frames drawn':>13}"]
+    for state in ("menu", "paused"):
+        game.statistics.game_active = state == "paused"
+        game.statistics.game_paused = state == "paused"
+        game.statistics.show_controls = False
+        for power_saving in (False, True):
+            game.ai_configuration.power_saving = power_saving
+            drawn = 0
+            original_flip = pygame.display.flip
+
+            def counting_flip() -> None:
+                nonlocal drawn
+                drawn += 1
+                original_flip()
+
+            pygame.display.flip = counting_flip
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            while time.perf_counter() - wall_start < 2.0:
+                game.run_frame()
+            cpu = (time.process_time() - cpu_start) / (time.perf_counter() - wall_start) * 100
+            pygame.display.flip = original_flip
+            lines.append(f"{state:<8} {'on' if power_saving else 'off':>13} {cpu:>8.1f} {drawn:>13}")
+    return lines
+
+
+BENCHMARKS: Dict[str, Callable[[], List[str]]] = {
+    "create_fleet": bench_create_fleet,
+    "fleet_transition": bench_fleet_transition,
+    "entity_memory": bench_entity_memory,
+    "entity_systems": bench_entity_systems,
+    "update_aliens": bench_update_aliens,
+    "broadphase": bench_broadphase,
+    "precise_collisions": bench_precise_collisions,
+    "audio_startup": bench_audio_startup,
+    "voices": bench_voices,
+    "language_startup": bench_language_startup,
+    "profiles": bench_profiles,
+    "idle_cpu": bench_idle_cpu,
+}
+
+
+if __name__ == "__main__":
+    selected = sys.argv[1:] or list(BENCHMARKS)
+    for benchmark in selected:
+        if benchmark not in BENCHMARKS:
+            sys.exit(f"Unknown benchmark '{benchmark}'. Available: {', '.join(BENCHMARKS)}")
+        print(f"== {benchmark} ==")
+        for line in BENCHMARKS[benchmark]():
+            print(line)
+        print()
@@ -0,0 +1,28 @@
+"""Compile the JSON translations into a single bundle for frozen builds.
+
+Usage:
+    python tools/build-translations.py [output_path]
+
+The bundle defaults to build/translations.bin and is bundled by PyInstaller
+next to the executable, where src/config/language/translation_bundle.py
+picks it up at runtime.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config.language.translation_bundle import compile_translations  # noqa: E402
+
+TRANSLATIONS_DIR = "src/assets/translations"
+output_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join("build", "translations.bin")
+
+bundle = compile_translations(TRANSLATIONS_DIR)
+os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+with open(output_path, "wb") as f:
+    f.write(bundle)
+
+languages = sum(1 for filename in os.listdir(TRANSLATIONS_DIR) if filename.endswith(".json"))
+print(f"✔ Compiled {languages} translations ({len(bundle) / 1024:.0f} KiB) into:")
+print(f" - {output_path}")
@@ -0,0 +1,30 @@
+"""Pack game assets into a single memory-mapped archive for frozen builds.
+
+Usage:
+    python tools/pack-assets.py [output_path]
+
+The archive defaults to build/assets.pak and is bundled by PyInstaller next
+to the executable, where src/core/asset_archive.py picks it up at runtime.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.asset_archive import write_asset_archive  # noqa: E402
+
+# Translations ship precompiled in translations.bin (tools/build-translations.py) instead
+ASSET_DIRS = ["src/assets/images", "src/assets/sounds", "src/assets/icons"]
+output_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join("build", "assets.pak")
+
+files = {}
+for directory in ASSET_DIRS:
+    for filename in sorted(os.listdir(directory)):
+        if not filename.startswith("."):
+            files[f"{directory}/{filename}"] = os.path.join(directory, filename)
+
+size = write_asset_archive(output_path, files)
+
+print(f"✔ Packed {len(files)} assets ({size / 1024:.0f} KiB) into:")
+print(f" - {output_path}")